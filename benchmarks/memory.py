@@ -0,0 +1,104 @@
+# your_project/benchmarks/memory.py
+#
+# 그룹/플레이어당 메모리 사용량 측정.
+#
+#   python -m benchmarks.memory --groups 100000 --players-per-group 4
+#
+# 실제 소켓 대신 아무것도 하지 않는 가짜 소켓으로 ConnectionManager 에 직접 등록한다.
+# 라우터처럼 register_player 응답을 한 번 보낸 뒤(송신 큐/writer 가 만들어지는 경로)
+# 타이머가 멈춘 상태로 놓아 둔 "대기 중인" 그룹을 기준으로 tracemalloc 으로 측정한다.
+# 결과는 JSON 한 줄: bytes_per_group (호스트 1명 포함), bytes_per_player (게스트 1명 추가분), RSS.
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("TIMER_LOG_LEVEL", "WARNING")
+
+from core.connection_manager import ConnectionManager  # noqa: E402
+from core.protocol import json_frame  # noqa: E402
+
+
+class NullSocket:
+    """send 만 받아 버리는 WebSocket 대역"""
+
+    async def send(self, message):
+        pass
+
+    async def close(self, code=1000):
+        pass
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return 0.0
+
+
+async def settle():
+    """송신 큐 writer 들이 응답을 다 보내고 정리될 때까지 루프를 돌린다"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+    gc.collect()
+
+
+async def register(mgr: ConnectionManager, name: str):
+    group_name, player = await mgr.register_player(NullSocket(), name)
+    player.send(json_frame({"status": "success", "action": "register_player", "group_name": group_name}))
+    return group_name, player
+
+
+async def run(groups: int, players_per_group: int) -> dict:
+    mgr = ConnectionManager()
+    mgr.max_groups = 0
+    mgr.max_players_per_group = 0
+
+    await settle()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+
+    hosts = []
+    for i in range(groups):
+        hosts.append(await register(mgr, f"host-{i}"))
+    await settle()
+    after_groups = tracemalloc.get_traced_memory()[0]
+
+    guests = groups * (players_per_group - 1)
+    for i, (group_name, host) in enumerate(hosts):
+        for j in range(players_per_group - 1):
+            _, guest = await register(mgr, f"guest-{i}-{j}")
+            await mgr.join_group(host.player_id, guest.player_id)
+    await settle()
+    after_players = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return {
+        "groups": groups,
+        "players_per_group": players_per_group,
+        "bytes_per_group": round((after_groups - base) / groups),
+        "bytes_per_player": round((after_players - after_groups) / guests) if guests else None,
+        "total_mb": round((after_players - base) / 2 ** 20, 1),
+        "rss_mb": rss_mb()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Timer server memory benchmark")
+    parser.add_argument("--groups", type=int, default=10000)
+    parser.add_argument("--players-per-group", type=int, default=4)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.groups, args.players_per_group))))
+
+
+if __name__ == "__main__":
+    main()
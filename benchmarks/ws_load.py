@@ -0,0 +1,356 @@
+# your_project/benchmarks/ws_load.py
+"""
+WebSocket 그룹 / 타이머 tick 부하 벤치마크.
+
+main.py 의 FastAPI 앱을 uvicorn 서브프로세스로 localhost 에 띄우고 (또는 --url 로 기존 서버 사용),
+그룹 수를 바꿔가며 다음을 측정한다.
+
+  - first_tick_latency : /timer/start 요청 시점부터 첫 update_timer 수신까지 (초)
+  - tick_lateness      : 같은 턴의 첫 tick 기준으로 기대되는 수신 시각 대비 지연 (초, 누적 drift)
+  - tick_jitter        : 연속 tick 수신 간격과 기대 간격의 차이 절대값 (초)
+  - messages_per_sec   : 클라이언트 전체 수신 메시지 수 / 측정 시간
+  - server_cpu_percent, server_rss_bytes, server_peak_rss_bytes : /proc 기준 (서브프로세스 모드, Linux)
+
+결과는 그룹 수마다 JSON 한 줄로 출력한다 (--output 지정 시 파일에 추가).
+
+예)
+    python -m benchmarks.ws_load --groups 10,100,1000 --players-per-group 4 --duration 15
+    python -m benchmarks.ws_load --groups 10000 --protocol binary --ticks stream
+
+그룹이 많을 때는 열린 소켓 수가 groups * players-per-group 이므로 `ulimit -n` 을 충분히 올려야 한다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import struct
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlencode, urlsplit
+
+import websockets
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_TICK_STRUCT = struct.Struct("!BHI")
+_OP_UPDATE_TIMER = 1
+
+
+# --- 서버 프로세스 ---
+
+class ServerProcess:
+    """uvicorn 으로 main:app 을 띄우고 /proc 으로 CPU / RSS 를 읽는다"""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.proc: Optional[subprocess.Popen] = None
+
+    def start(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app",
+             "--host", "127.0.0.1", "--port", str(self.port),
+             "--log-level", "warning", "--ws-max-queue", "64"],
+            cwd=ROOT,
+            # 플레이어마다 먼저 자기 그룹을 만들므로 (groups x players_per_group 개) 그룹/인원 제한을 끈다
+            env={**os.environ, "TIMER_MAX_GROUPS": "0", "TIMER_MAX_PLAYERS_PER_GROUP": "0"},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.2):
+                    return
+            except OSError:
+                time.sleep(0.1)
+        raise RuntimeError("uvicorn did not start")
+
+    def stop(self):
+        if self.proc is not None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+            self.proc = None
+
+    def cpu_seconds(self) -> Optional[float]:
+        try:
+            with open(f"/proc/{self.proc.pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        except (OSError, AttributeError):
+            return None
+
+    def memory(self) -> Dict[str, Optional[int]]:
+        result = {"server_rss_bytes": None, "server_peak_rss_bytes": None}
+        try:
+            with open(f"/proc/{self.proc.pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        result["server_rss_bytes"] = int(line.split()[1]) * 1024
+                    elif line.startswith("VmHWM:"):
+                        result["server_peak_rss_bytes"] = int(line.split()[1]) * 1024
+        except (OSError, AttributeError):
+            pass
+        return result
+
+
+# --- HTTP (의존성 없이 최소 구현) ---
+
+async def http_post(host: str, port: int, path: str, params: Optional[dict] = None) -> int:
+    if params:
+        path = f"{path}?{urlencode(params)}"
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(
+            f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: 0\r\nConnection: close\r\n\r\n".encode()
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+# --- 클라이언트 ---
+
+class SimPlayer:
+    """시뮬레이션 플레이어 하나 (WebSocket 연결 + 수신 통계)"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.ws = None
+        self.player_id = None
+        self.group_name = None
+        self.received = 0
+
+        # 현재 턴의 첫 tick 기준 (수신 시각, 남은 초)
+        self._turn = None
+        self._origin = None
+        self._last = None
+
+    async def connect(self, ws_url: str, name: str):
+        self.ws = await websockets.connect(
+            ws_url + "&" + urlencode({"player_name": name, "heartbeat": "true"}), max_size=None
+        )
+        reply = json.loads(await self.ws.recv())
+        if reply.get("status") != "success":
+            # 서버 그룹 수 제한 등으로 등록이 거절됨 (외부 서버라면 TIMER_MAX_GROUPS 확인)
+            raise RuntimeError(f"register_player failed for {name}: {reply.get('detail', reply)}")
+        self.player_id = reply["player_info"]["player_id"]
+        self.group_name = reply["group_name"]
+
+    async def listen(self, stats: "Stats", start_times: Dict[str, float], group_of: Dict[str, str]):
+        try:
+            async for message in self.ws:
+                now = time.monotonic()
+                self.received += 1
+                tick = _parse_tick(message)
+                if tick is not None:
+                    self._on_tick(now, *tick, stats, start_times.get(group_of.get(self.player_id)))
+                elif isinstance(message, str) and '"ping"' in message:
+                    # 서버 heartbeat 에 응답하지 않으면 연결이 끊긴다
+                    await self.ws.send('{"action": "pong"}')
+        except websockets.ConnectionClosed:
+            pass
+
+    def _on_tick(self, now: float, now_turn: int, remaining: int, stats: "Stats", started_at: Optional[float]):
+        if self._turn != now_turn:
+            # 턴의 첫 tick
+            if self._turn is None and started_at is not None:
+                stats.first_tick_latency.append(now - started_at)
+            self._turn = now_turn
+            self._origin = (now, remaining)
+            self._last = (now, remaining)
+            return
+
+        origin_time, origin_remaining = self._origin
+        stats.tick_lateness.append(now - (origin_time + (origin_remaining - remaining)))
+        last_time, last_remaining = self._last
+        stats.tick_jitter.append(abs((now - last_time) - (last_remaining - remaining)))
+        self._last = (now, remaining)
+
+
+def _parse_tick(message):
+    """update_timer 이면 (now_turn, remaining_seconds), 아니면 None"""
+    if isinstance(message, bytes):
+        if len(message) == _TICK_STRUCT.size:
+            opcode, now_turn, remaining = _TICK_STRUCT.unpack(message)
+            if opcode == _OP_UPDATE_TIMER:
+                return now_turn, remaining
+        return None
+    if '"update_timer"' not in message:
+        return None
+    data = json.loads(message)
+    return data["now_turn"], data["remaining_seconds"]
+
+
+class Stats:
+    def __init__(self):
+        self.first_tick_latency: List[float] = []
+        self.tick_lateness: List[float] = []
+        self.tick_jitter: List[float] = []
+
+
+def percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"count": 0, "p50": None, "p90": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def pick(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 6)
+
+    return {"count": len(ordered), "p50": pick(0.50), "p90": pick(0.90), "p99": pick(0.99), "max": round(ordered[-1], 6)}
+
+
+async def gather_limited(coros, limit: int):
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros))
+
+
+async def run_scenario(args, base_url: str, groups: int, server: Optional[ServerProcess]) -> dict:
+    split = urlsplit(base_url)
+    host, port = split.hostname, split.port or 80
+    ws_url = f"ws://{host}:{port}/ws?" + urlencode({"protocol": args.protocol, "ticks": args.ticks})
+
+    # 1) 접속: 플레이어마다 그룹이 하나씩 생긴다
+    players = [SimPlayer(i) for i in range(groups * args.players_per_group)]
+    t0 = time.monotonic()
+    await gather_limited([p.connect(ws_url, f"bench-{p.index}") for p in players], args.concurrency)
+    connect_seconds = time.monotonic() - t0
+
+    # 2) 그룹 구성: 각 그룹의 첫 플레이어가 호스트, 나머지는 join
+    hosts = players[::args.players_per_group]
+    group_of: Dict[str, str] = {}
+    joins = []
+    for g, host_player in enumerate(hosts):
+        group_of[host_player.player_id] = host_player.group_name
+        for guest in players[g * args.players_per_group + 1:(g + 1) * args.players_per_group]:
+            group_of[guest.player_id] = host_player.group_name
+            joins.append(http_post(host, port, f"/group/{host_player.group_name}/join", {
+                "host_player_id": host_player.player_id,
+                "guest_player_id": guest.player_id,
+            }))
+    t0 = time.monotonic()
+    await gather_limited(joins, args.concurrency)
+    join_seconds = time.monotonic() - t0
+
+    # 3) 측정 시작
+    stats = Stats()
+    start_times: Dict[str, float] = {}
+    listeners = [asyncio.create_task(p.listen(stats, start_times, group_of)) for p in players]
+
+    await gather_limited([
+        http_post(host, port, f"/timer/set-time/{h.group_name}", {"h": 0, "m": 0, "s": args.turn_seconds})
+        for h in hosts
+    ], args.concurrency)
+
+    cpu_before = server.cpu_seconds() if server else None
+    received_before = sum(p.received for p in players)
+    window_start = time.monotonic()
+
+    async def start(group_name):
+        start_times[group_name] = time.monotonic()
+        return await http_post(host, port, f"/timer/start/{group_name}")
+
+    await gather_limited([start(h.group_name) for h in hosts], args.concurrency)
+
+    if args.turn_over_after is not None and args.turn_over_after < args.duration:
+        await asyncio.sleep(args.turn_over_after - (time.monotonic() - window_start))
+        await gather_limited([
+            http_post(host, port, f"/timer/turn-over/{h.group_name}") for h in hosts
+        ], args.concurrency)
+
+    await asyncio.sleep(max(0.0, args.duration - (time.monotonic() - window_start)))
+    window = time.monotonic() - window_start
+    received = sum(p.received for p in players) - received_before
+    cpu_after = server.cpu_seconds() if server else None
+
+    result = {
+        "groups": groups,
+        "players": len(players),
+        "players_per_group": args.players_per_group,
+        "protocol": args.protocol,
+        "ticks": args.ticks,
+        "duration": round(window, 3),
+        "connect_seconds": round(connect_seconds, 3),
+        "join_seconds": round(join_seconds, 3),
+        "messages": received,
+        "messages_per_sec": round(received / window, 1),
+        "first_tick_latency": percentiles(stats.first_tick_latency),
+        "tick_lateness": percentiles(stats.tick_lateness),
+        "tick_jitter": percentiles(stats.tick_jitter),
+        "server_cpu_percent": (
+            round(100 * (cpu_after - cpu_before) / window, 1)
+            if cpu_before is not None and cpu_after is not None else None
+        ),
+    }
+    if server:
+        result.update(server.memory())
+
+    # 4) 정리
+    await gather_limited([p.ws.close() for p in players], args.concurrency)
+    for task in listeners:
+        task.cancel()
+    await asyncio.gather(*listeners, return_exceptions=True)
+    return result
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="WebSocket group / timer tick load benchmark")
+    parser.add_argument("--groups", default="10,100,1000", help="쉼표로 구분한 그룹 수 목록")
+    parser.add_argument("--players-per-group", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=10.0, help="그룹 수마다 측정 시간 (초)")
+    parser.add_argument("--turn-seconds", type=int, default=30, help="턴 타이머 길이 (초)")
+    parser.add_argument("--turn-over-after", type=float, default=None, help="측정 시작 후 이 시점에 모든 그룹 turn-over")
+    parser.add_argument("--protocol", choices=["json", "binary"], default="json")
+    parser.add_argument("--ticks", choices=["stream", "sync"], default="stream")
+    parser.add_argument("--concurrency", type=int, default=200, help="동시 접속/요청 수 제한")
+    parser.add_argument("--url", default=None, help="이미 떠 있는 서버 (예: http://127.0.0.1:8000). 없으면 uvicorn 을 띄운다")
+    parser.add_argument("--output", default=None, help="결과 JSON lines 를 추가할 파일")
+    args = parser.parse_args(argv)
+
+    for groups in [int(g) for g in args.groups.split(",") if g]:
+        server = None
+        if args.url:
+            base_url = args.url
+        else:
+            # 그룹 수마다 깨끗한 서버로 측정
+            server = ServerProcess(free_port())
+            server.start()
+            base_url = f"http://127.0.0.1:{server.port}"
+        try:
+            result = asyncio.run(run_scenario(args, base_url, groups, server))
+        finally:
+            if server:
+                server.stop()
+
+        result["python"] = platform.python_version()
+        result["timestamp"] = int(time.time())
+        line = json.dumps(result)
+        print(line, flush=True)
+        if args.output:
+            with open(args.output, "a") as f:
+                f.write(line + "\n")
+
+
+if __name__ == "__main__":
+    main()
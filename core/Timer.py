@@ -1,57 +1,230 @@
-import time
+# your_project/core/Timer.py
+#
+# 동기 코드(스크립트, 도구)용 타이머.
+#
+# 타이머마다 스레드를 띄우고 time.sleep 으로 세는 대신, 프로세스에 하나뿐인 엔진 스레드의 이벤트 루프에서
+# AsyncTimer 를 구동하고 Timer 는 그 위의 얇은 동기 인터페이스만 제공한다.
+# 타이머가 몇 개든 스레드는 엔진 하나이고, tick 은 엔진의 TickScheduler 힙에 예약된다.
+#
+#   t = Timer(0, 0, 10, on_timeout=lambda timer: print("done"))
+#   t.start(); t.wait()
+#
+# 콜백(on_tick, on_timeout, add_done_callback)은 엔진 스레드에서 실행되므로 오래 막지 말 것.
+# 콜백 안에서 같은 엔진의 타이머를 제어하면 결과를 기다리지 않고 예약만 한다 (None 반환).
+
+import asyncio
 import threading
+from concurrent.futures import Future
+from typing import Callable, List, Optional
 
-class Timer:
-    def __init__(self, hours, minutes, seconds):
+from core.async_timer import AsyncTimer, TimerState
+from core.log import get_logger
+from core.scheduler import TickScheduler
+
+log = get_logger("sync_timer")
+
+
+class _Engine:
+    """동기 Timer 들이 공유하는 백그라운드 이벤트 루프 스레드 (첫 사용 시 시작)"""
+
+    def __init__(self):
+        self.scheduler = TickScheduler()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run, args=(loop, ready), name="timer-engine", daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def in_engine(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """엔진 루프에서 coro 를 실행하고 결과를 기다린다 (엔진 스레드 안에서는 예약만 하고 None)"""
+        loop = self._ensure()
+        if self.in_engine():
+            self.scheduler.spawn(coro)
+            return None
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
 
-        self.initial_seconds = hours * 3600 + minutes * 60 + seconds
-        self.total_seconds = self.initial_seconds
-        self.remaining_seconds = self.initial_seconds
-        self.running = False
-        self.paused = False
+    def call(self, fn: Callable, *args, timeout: Optional[float] = None):
+        """엔진 스레드에서 fn(*args) 를 실행하고 결과를 기다린다 (타이머 상태 읽기용)"""
+        if self.in_engine() or self._loop is None:
+            return fn(*args)
+        future: Future = Future()
 
-    def start(self):
-        """타이머를 시작하거나 다시 시작합니다."""
-        if self.running:
-            print(f"{self.name} 타이머가 이미 실행 중입니다.")
-            return
+        def invoke():
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
 
-        self.running = True
-        self.paused = False
-        threading.Thread(target=self._run).start()
+        self._loop.call_soon_threadsafe(invoke)
+        return future.result(timeout)
 
     def stop(self):
-        self.running = False
-
-    def pause(self):
-        if not self.running:
-            return
-
-        self.paused = True
-        self.running = False
-        print(f"{self.name} 타이머가 일시 정지되었습니다. 남은 시간: {self._format_time(self.remaining_seconds)}")
-
-    def reset(self):
-        self.remaining_seconds = self.initial_seconds
-        self.running = False
-        self.paused = False
-
-    def _run(self):
-        while self.running and self.remaining_seconds > 0:
-            hours, remainder = divmod(self.remaining_seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            print(f"{self.name}: {hours}시간 {minutes}분 {seconds}초 남음")
-            time.sleep(1)
-            self.remaining_seconds -= 1
-
-        if self.remaining_seconds == 0:
-            print(f"{self.name} 타이머가 종료되었습니다.")
-        self.running = False
-
-    def _format_time(self, total_seconds):
+        """엔진 루프 종료 (다음 사용 시 새로 시작)"""
+        with self._lock:
+            if self._loop is not None and self._thread is not None and self._thread.is_alive():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                if not self.in_engine():
+                    self._thread.join()
+            self._loop = None
+            self._thread = None
+
+
+engine = _Engine()  # 싱글턴 인스턴스
+
+
+class Timer:
+    """
+    AsyncTimer 의 동기 래퍼. 제어 메서드는 엔진 스레드에서 전이를 마친 뒤 결과(bool)를 돌려준다.
+    on_tick(remaining_seconds) 는 매초, on_timeout(timer) 과 add_done_callback 으로 등록한 콜백은 0초 도달 시 호출된다.
+    """
+
+    def __init__(
+        self,
+        hours,
+        minutes,
+        seconds,
+        name: Optional[str] = None,
+        on_tick: Optional[Callable[[int], None]] = None,
+        on_timeout: Optional[Callable[["Timer"], None]] = None
+    ):
+        self.name = name or "timer"
+        self.on_tick = on_tick
+        self._done = threading.Event()
+        self._callbacks: List[Callable[["Timer"], None]] = [on_timeout] if on_timeout else []
+        self._callbacks_lock = threading.Lock()
+        self._timer = AsyncTimer(
+            hours, minutes, seconds,
+            on_tick_callback=self._on_tick,
+            on_timeout_callback=self._on_timeout,
+            scheduler=engine.scheduler
+        )
+
+    # --- 상태 ---
+
+    @property
+    def initial_seconds(self) -> int:
+        return self._timer.initial_seconds
+
+    @property
+    def remaining_seconds(self) -> int:
+        return engine.call(lambda: self._timer.remaining_seconds)
+
+    @property
+    def status(self) -> TimerState:
+        return self._timer.status
+
+    @property
+    def running(self) -> bool:
+        return self._timer.status is TimerState.RUNNING
+
+    @property
+    def paused(self) -> bool:
+        return self._timer.status is TimerState.PAUSED
+
+    @property
+    def done(self) -> bool:
+        """0초에 도달했는지 (reset/start 로 해제)"""
+        return self._done.is_set()
+
+    # --- 제어 ---
+
+    def start(self) -> bool:
+        """타이머를 시작하거나 일시 정지된 타이머를 재개 (0초에 도달한 타이머는 처음부터 다시)"""
+        return engine.run(self._start())
+
+    async def _start(self) -> bool:
+        timer = self._timer
+        if timer.status is TimerState.PAUSED:
+            return await timer.resume()
+        if timer.status is TimerState.RUNNING:
+            log.debug("already running", timer=self.name)
+            return False
+        self._done.clear()
+        if timer.status is TimerState.EXPIRED:
+            return await timer.restart()
+        return await timer.start()
+
+    def stop(self) -> bool:
+        return engine.run(self._timer.stop())
+
+    def pause(self) -> bool:
+        return engine.run(self._timer.pause())
+
+    def reset(self) -> bool:
+        self._done.clear()
+        return engine.run(self._timer.reset())
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """0초에 도달할 때까지 대기 (timeout 안에 끝나면 True)"""
+        if engine.in_engine():
+            raise RuntimeError("엔진 스레드(콜백) 안에서는 wait 할 수 없습니다.")
+        return self._done.wait(timeout)
+
+    def add_done_callback(self, callback: Callable[["Timer"], None]):
+        """0초 도달 시 callback(timer) 호출 (이미 끝났으면 엔진 스레드에서 바로 호출)"""
+        with self._callbacks_lock:
+            self._callbacks.append(callback)
+            finished = self._done.is_set()
+        if finished:
+            engine.call(self._invoke, callback)
+
+    def remove_done_callback(self, callback: Callable[["Timer"], None]):
+        with self._callbacks_lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    # --- 엔진 스레드에서 실행 ---
+
+    def _on_tick(self, remaining_seconds: int):
+        if self.on_tick:
+            try:
+                self.on_tick(remaining_seconds)
+            except Exception:
+                log.exception("tick callback failed", timer=self.name)
+
+    def _on_timeout(self):
+        log.debug("finished", timer=self.name)
+        with self._callbacks_lock:
+            self._done.set()
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            self._invoke(callback)
+
+    def _invoke(self, callback: Callable[["Timer"], None]):
+        try:
+            callback(self)
+        except Exception:
+            log.exception("done callback failed", timer=self.name)
+
+    @staticmethod
+    def _format_time(total_seconds):
         """총 초를 시:분:초 형식의 문자열로 변환합니다."""
         hours, remainder = divmod(total_seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
         return f"{hours}시간 {minutes}분 {seconds}초"
 
-
+    def __repr__(self):
+        return f"<Timer {self.name} {self._timer.status.value} {self._format_time(self.remaining_seconds)}>"
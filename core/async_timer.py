@@ -1,119 +1,365 @@
 # your_project/core/async_timer.py
 
 import asyncio
+import math
+from enum import Enum
+
+from core import metrics
+from core.log import get_logger
+from core.scheduler import scheduler as default_scheduler
+
+
+log = get_logger("timer")
+
+
+class TimerState(str, Enum):
+    IDLE = "idle"                  # 정지 (남은 시간 보존)
+    RUNNING = "running"            # 턴 카운트다운 중
+    PAUSED = "paused"              # 일시 정지 (남은 시간 보존)
+    INTERMISSION = "intermission"  # 턴 사이 대기 카운트다운 중
+    EXPIRED = "expired"            # 턴 시간 소진 (다음 전이를 기다림)
+
+
+# 각 전이를 허용하는 출발 상태
+# EXPIRED 는 남은 시간이 0 이라 start 하면 바로 다시 만료되어 on_timeout 이 한 번 더 불린다 (restart 로만 다시 시작)
+_CAN_START = frozenset((TimerState.IDLE,))
+_CAN_STOP = frozenset((TimerState.RUNNING, TimerState.PAUSED, TimerState.INTERMISSION, TimerState.EXPIRED))
+_CAN_PAUSE = frozenset((TimerState.RUNNING,))
+_CAN_RESUME = frozenset((TimerState.PAUSED,))
+_CAN_WAIT = frozenset((TimerState.IDLE, TimerState.RUNNING, TimerState.PAUSED, TimerState.EXPIRED))
+
+# 클라이언트 프로토콜(timer_sync, 그룹 조회)에 노출하는 상태 이름
+_WIRE_STATES = {
+    TimerState.IDLE: "stopped",
+    TimerState.RUNNING: "running",
+    TimerState.PAUSED: "paused",
+    TimerState.INTERMISSION: "stopped",
+    TimerState.EXPIRED: "stopped"
+}
+
 
 class AsyncTimer:
-    def __init__(self, hours, minutes, seconds, on_tick_callback=None, on_timeout_callback=None):
+    """
+    monotonic 마감 시각(deadline) 기반 카운트다운 타이머.
+
+    남은 시간을 매 tick 마다 1씩 빼는 대신, 실행 중에는 deadline - now 로 계산한다.
+    tick 은 deadline 으로부터의 정수 초 경계에 예약되고, 루프가 밀려 여러 경계를
+    지나쳤다면 한 번의 tick 으로 합쳐진다. 따라서 콜백 시간이나 루프 지연이 누적되지 않는다.
+
+    상태 기계 (TimerState)
+        IDLE --start--> RUNNING --pause--> PAUSED --resume--> RUNNING
+        RUNNING --(0초)--> EXPIRED --intermission--> INTERMISSION --(대기 끝)--> on_wait_end --restart--> RUNNING
+        * --stop--> IDLE, * --reset--> IDLE(초기값), * --restart--> RUNNING(초기값)
+    모든 전이는 version 을 1 올린다. 제어 메서드는 전이했으면 True, 허용되지 않는 상태이거나
+    expected_version 이 현재 version 과 다르면(그사이 다른 전이가 있었음) 아무것도 하지 않고 False 를 돌려준다.
+    전이 하나에 스케줄러 작업은 기존 예약 취소(플래그) 와 새 예약 하나뿐이며 Task 를 만들거나 취소하지 않는다.
+    """
+
+    __slots__ = (
+        "initial_seconds", "status", "version",
+        "on_tick_callback", "on_timeout_callback", "on_state_callback", "on_wait_callback", "on_wait_end_callback",
+        "_scheduler", "_handle", "_next_at", "_remaining", "_deadline"
+    )
+
+    def __init__(
+        self,
+        hours,
+        minutes,
+        seconds,
+        on_tick_callback=None,
+        on_timeout_callback=None,
+        scheduler=None,
+        on_state_callback=None,
+        on_wait_callback=None,
+        on_wait_end_callback=None
+    ):
         # 초기 시간 설정
         self.initial_seconds = hours * 3600 + minutes * 60 + seconds
-        self.remaining_seconds = self.initial_seconds
 
-        # 상태 플래그
-        self.running = False
-        self.paused = False
+        # 상태와 전이 번호
+        self.status = TimerState.IDLE
+        self.version = 0
 
         # 콜백
         self.on_tick_callback = on_tick_callback
         self.on_timeout_callback = on_timeout_callback
+        self.on_state_callback = on_state_callback  # 모든 상태 전이 시 호출
+        self.on_wait_callback = on_wait_callback  # intermission 중 매초 (남은 대기 초)
+        self.on_wait_end_callback = on_wait_end_callback  # intermission 종료 (version) - 없으면 바로 restart
+
+        # 내부용: 공유 스케줄러와 다음 tick 예약 핸들
+        self._scheduler = scheduler or default_scheduler
+        self._handle = None
+        self._next_at = None  # 예약된 다음 tick 경계 (지연 측정용)
+
+        # RUNNING 이 아닐 때의 남은 턴 시간(초, 소수점 포함)과
+        # RUNNING / INTERMISSION 일 때의 마감 시각
+        self._remaining = float(self.initial_seconds)
+        self._deadline = None
+
+    @property
+    def remaining(self) -> float:
+        """남은 턴 시간 (초, 소수점 포함)"""
+        if self.status is not TimerState.RUNNING:
+            return self._remaining
+        # 시작 시각(at)이 아직 오지 않았으면 남은 시간은 시작 값 그대로
+        return max(0.0, min(self._remaining, self._deadline - self._scheduler.now()))
+
+    @property
+    def remaining_seconds(self) -> int:
+        """표시용 남은 시간 (올림한 정수 초)"""
+        return math.ceil(self.remaining)
+
+    @remaining_seconds.setter
+    def remaining_seconds(self, value):
+        """남은 시간 변경. 실행 중이면 새 마감 시각으로 RUNNING 에 다시 들어가는 전이 (version 증가 + 상태 알림)"""
+        if self.status is TimerState.RUNNING:
+            self._freeze()
+            self._remaining = float(value)
+            self._run(None)
+        else:
+            self._remaining = float(value)
+
+    @property
+    def wait_remaining(self):
+        """intermission 중이면 남은 대기 시간 (초), 아니면 None"""
+        if self.status is not TimerState.INTERMISSION:
+            return None
+        if self._deadline is None:
+            return 0.0  # 대기는 끝났고 on_wait_end_callback 이 다음 턴을 시작하기 전
+        return max(0.0, self._deadline - self._scheduler.now())
+
+    @property
+    def running(self) -> bool:
+        """턴 타이머가 시작된 상태인지 (일시 정지 포함)"""
+        return self.status is TimerState.RUNNING or self.status is TimerState.PAUSED
 
-        # 내부용
-        self._task = None              # asyncio.Task (타이머 실행)
-        self._pause_event = asyncio.Event()
-        self._pause_event.set()        # 초기에 pause 상태가 아님
+    @property
+    def paused(self) -> bool:
+        return self.status is TimerState.PAUSED
+
+    @property
+    def state(self) -> str:
+        """클라이언트에 보이는 상태: stopped / running / paused"""
+        return _WIRE_STATES[self.status]
+
+    @property
+    def deadline(self):
+        """실행 중일 때의 monotonic 마감 시각 (그 밖에는 None)"""
+        return self._deadline if self.status is TimerState.RUNNING else None
 
     def set_time(self, hours, minutes, seconds):
         """타이머의 초기/남은 시간을 재설정"""
         self.initial_seconds = hours * 3600 + minutes * 60 + seconds
         self.remaining_seconds = self.initial_seconds
 
-    async def start(self):
-        """비동기로 타이머 시작"""
-        print("[group.py] reset() ",self.running)
-        if self.running:
-            print("[AsyncTimer] 이미 실행 중입니다.")
-            return
+    # --- 전이 ---
 
-        self.running = True
-        self.paused = False
-        self._pause_event.set()  # pause 해제
+    async def start(self, at=None, expected_version=None) -> bool:
+        """
+        IDLE -> RUNNING (남은 시간부터, 남은 시간이 없으면 초기값부터).
+        at(monotonic) 을 주면 그 시각에 시작한 것으로 마감 시각을 잡는다 (여러 타이머의 tick 경계 정렬용).
+        at 이 아직 오지 않았으면 바로 RUNNING 이 되고 첫 tick 만 at 에 나간다.
+        """
+        if not self._accept(_CAN_START, expected_version):
+            return False
+        if self._remaining <= 0:
+            self._remaining = float(self.initial_seconds)
+        self._run(at)
+        log.debug("started", remaining=self._remaining)
+        return True
 
-        # 타이머 코루틴을 Task로 실행
-        print("[async_timer] self.running",self.running)
-        self._task = asyncio.create_task(self._run_timer())
-        print("[AsyncTimer] 타이머 시작")
+    async def restart(self, at=None, expected_version=None) -> bool:
+        """어느 상태에서든 초기값으로 다시 RUNNING (reset + start 를 전이 한 번으로)"""
+        if not self._accept(None, expected_version):
+            return False
+        self._freeze()
+        self._remaining = float(self.initial_seconds)
+        self._run(at)
+        log.debug("restarted", remaining=self._remaining)
+        return True
 
-    async def stop(self):
-        """타이머 완전 중지"""
-        if not self.running:
+    async def stop(self, expected_version=None) -> bool:
+        """타이머 완전 중지 (남은 턴 시간 보존)"""
+        if not self._accept(_CAN_STOP, expected_version):
+            return False
+        self._freeze()
+        self._enter(TimerState.IDLE)
+        log.debug("stopped", remaining=self._remaining)
+        return True
+
+    async def pause(self, expected_version=None) -> bool:
+        """타이머 일시 정지 (남은 시간을 소수점 단위까지 보존)"""
+        if not self._accept(_CAN_PAUSE, expected_version):
+            return False
+        self._freeze()
+        self._enter(TimerState.PAUSED)
+        log.debug("paused", remaining=self._remaining)
+        return True
+
+    async def resume(self, expected_version=None) -> bool:
+        """일시 정지된 타이머 재개"""
+        if not self._accept(_CAN_RESUME, expected_version):
+            return False
+        self._run(None)
+        log.debug("resumed", remaining=self._remaining)
+        return True
+
+    async def reset(self, expected_version=None) -> bool:
+        """타이머 초기화 (초기값으로 복원, IDLE)"""
+        if not self._accept(None, expected_version):
+            return False
+        if self.status is TimerState.IDLE and self._remaining == self.initial_seconds:
+            return False
+        self._freeze()
+        self._remaining = float(self.initial_seconds)
+        self._enter(TimerState.IDLE)
+        log.debug("reset", remaining=self._remaining)
+        return True
+
+    async def intermission(self, seconds, expected_version=None) -> bool:
+        """
+        턴 사이 대기 시작 (이미 대기 중이면 False - 중복 요청은 진행 중인 대기에 합쳐진다).
+        대기 중에는 on_wait_callback 이 매초 호출되고, 끝나면 on_wait_end_callback(version) 이 호출된다.
+        """
+        if not self._accept(_CAN_WAIT, expected_version):
+            return False
+        self._freeze()
+        self._wait(seconds)
+        log.debug("intermission", seconds=seconds)
+        return True
+
+    async def restore(self, initial_seconds, remaining, state, wait=None):
+        """
+        스냅샷 값으로 복원. state 는 TimerState 값 (이전 형식의 "stopped" 는 IDLE).
+        running 이면 남은 시간부터 바로 재개하고, intermission (또는 wait 가 있으면) 남은 대기 wait 초 뒤
+        다음 턴으로 넘어가며, expired 면 저장 전에 끝나지 못한 만료 처리(on_timeout)를 다시 실행한다.
+        """
+        self._freeze()
+        self.initial_seconds = initial_seconds
+        self._remaining = max(0.0, float(remaining))
+        status = TimerState.IDLE if state == "stopped" else TimerState(state)
+        if wait is not None:
+            status = TimerState.INTERMISSION
+        if status is TimerState.RUNNING:
+            self._run(None)
+        elif status is TimerState.INTERMISSION:
+            self._wait(wait or 0.0)
+        elif status is TimerState.EXPIRED:
+            self._expire()
+        else:
+            self._enter(status)
+
+    def cancel(self):
+        """예약된 tick 을 취소하고 정지 (상태 알림 없음, 그룹 삭제 시 사용)"""
+        self._freeze()
+        self._enter(TimerState.IDLE, notify=False)
+
+    # --- 내부 구현 ---
+
+    def _accept(self, allowed, expected_version) -> bool:
+        """전이 가능 여부 (allowed 가 None 이면 모든 상태 허용)"""
+        if expected_version is not None and expected_version != self.version:
+            metrics.TIMER_STALE_OPERATIONS.inc()
+            return False
+        return allowed is None or self.status in allowed
+
+    def _enter(self, status: TimerState, notify: bool = True):
+        self.status = status
+        self.version += 1
+        if notify:
+            self._notify_state()
+
+    def _run(self, at):
+        """남은 턴 시간으로 RUNNING 진입 후 첫 tick (즉시 알림 + 다음 경계 예약 하나, at 이 미래면 그때 첫 tick)"""
+        now = self._scheduler.now()
+        self._deadline = (now if at is None else at) + self._remaining
+        self._enter(TimerState.RUNNING, notify=False)
+        if at is not None and at > now:
+            self._next_at = at
+            self._handle = self._scheduler.call_at(at, self._tick, self.version)
+        else:
+            self._tick(self.version)
+        self._notify_state()
+
+    def _wait(self, seconds):
+        """seconds 뒤에 끝나는 INTERMISSION 진입 후 첫 tick"""
+        self._deadline = self._scheduler.now() + max(0.0, float(seconds))
+        self._enter(TimerState.INTERMISSION, notify=False)
+        self._tick(self.version)
+        self._notify_state()
+
+    def _tick(self, version):
+        """현재 남은 시간을 알리고 다음 정수 초 경계에 tick 예약"""
+        self._handle = None
+        if version != self.version:
+            return  # 그사이 전이가 일어난 오래된 예약
+
+        now = self._scheduler.now()
+        if self._next_at is not None:
+            metrics.TICK_LATENESS_SECONDS.observe(now - self._next_at)
+            self._next_at = None
+
+        remaining = self._deadline - now
+        if self.status is TimerState.RUNNING:
+            if remaining <= 0:
+                self._expire()
+                return
+            callback = self.on_tick_callback
+        elif self.status is TimerState.INTERMISSION:
+            if remaining <= 0:
+                self._end_wait()
+                return
+            callback = self.on_wait_callback
+        else:
             return
 
-        self.running = False
-        self.paused = False
-        self._pause_event.set()  # 혹시 일시정지 중이라면 해제
-
-        if self._task and not self._task.done():
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-        print("[AsyncTimer] 타이머 중지")
-
-    async def pause(self):
-        # """타이머 일시 정지"""
-        # if not self.running or self.paused:
-        #     return
-        # self.paused = True
-        self._pause_event.clear()  # 대기 상태
-        print(f"[AsyncTimer] 일시 정지, 남은 시간: {self.remaining_seconds}초")
-
-    async def resume(self):
-        # print("in resume", self._pause_event)
-        # """일시 정지된 타이머 재개"""
-        # if not self.paused:
-        #     return
-        # self.paused = False
-        self._pause_event.set()
-        print("in resume", self._pause_event)
-        print(f"[AsyncTimer] 재개, 남은 시간: {self.remaining_seconds}초")
-
-    async def reset(self):
-        """타이머 초기화 (초기값으로 복원)"""
-        await self.stop()
-        self.remaining_seconds = self.initial_seconds
-        print(f"[AsyncTimer] 리셋 완료 {self.remaining_seconds}")
-
-    async def _run_timer(self):
-        """비동기 타이머 동작 코루틴"""
-        print("in _run_timer",self.running, self.remaining_seconds)
-        try:
-            while self.running and not self.paused and self.remaining_seconds > 0:
-                # 일시정지 상태라면, 이벤트가 set될 때까지 대기
-                await self._pause_event.wait()
-
-                # 1초마다 남은 시간 감소
-                # Tick 콜백
-                if self.on_tick_callback:
-                    await self._invoke_callback(self.on_tick_callback, self.remaining_seconds)
-                await asyncio.sleep(1)
-                self.remaining_seconds -= 1
-
-            # 타이머가 0초에 도달
-            if self.running and self.remaining_seconds <= 0:
-                print("[AsyncTimer] 타이머가 종료되었습니다.")
-                if self.on_timeout_callback:
-                    await self._invoke_callback(self.on_timeout_callback)
-        except asyncio.CancelledError:
-            # stop() 호출 시 Task가 취소
-            pass
-        # finally:
-        #     print("finally")
-        #     # 종료 시 상태 초기화
-        #     self.running = False
-
-    async def _invoke_callback(self, callback, *args):
-        """동기/비동기 콜백 둘 다 지원"""
+        # 표시값은 올림한 정수 초. 늦게 깨어나 여러 경계를 지났어도 현재 값 한 번만 알린다.
+        shown = math.ceil(remaining)
+        if callback:
+            self._dispatch(callback, shown)
+        self._next_at = self._deadline - (shown - 1)
+        self._handle = self._scheduler.call_at(self._next_at, self._tick, version)
+
+    def _notify_state(self):
+        if self.on_state_callback:
+            self._dispatch(self.on_state_callback)
+
+    def _freeze(self):
+        """예약된 tick 을 취소하고, 실행 중이었다면 남은 턴 시간을 고정"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._next_at = None
+        if self._deadline is not None:
+            if self.status is TimerState.RUNNING:
+                self._remaining = self.remaining
+            self._deadline = None
+
+    def _expire(self):
+        """턴 시간이 0초에 도달"""
+        self._remaining = 0.0
+        self._deadline = None
+        log.debug("expired")
+        self._enter(TimerState.EXPIRED)
+        if self.on_timeout_callback:
+            self._dispatch(self.on_timeout_callback)
+
+    def _end_wait(self):
+        """대기 종료: 다음 턴 시작은 on_wait_end_callback 이 version 을 확인하고 restart 한다"""
+        self._deadline = None
+        if self.on_wait_end_callback:
+            self._dispatch(self.on_wait_end_callback, self.version)
+        else:
+            self._remaining = float(self.initial_seconds)
+            self._run(None)
+
+    def _dispatch(self, callback, *args):
+        """
+        동기 콜백은 바로 호출한다 (그룹의 tick/broadcast 경로는 동기라 tick 마다 Task 가 생기지 않는다).
+        코루틴 함수 콜백(턴 종료 처리, 사용자 콜백)만 스케줄러 Task 로 실행한다.
+        """
         if asyncio.iscoroutinefunction(callback):
-            await callback(*args)
+            self._scheduler.spawn(callback(*args))
         else:
             callback(*args)
@@ -0,0 +1,257 @@
+# your_project/core/backplane.py
+#
+# 워커 프로세스 간 메시지 전달 계층 (pluggable).
+#
+#   LocalBackplane      : 같은 프로세스 안의 워커끼리 (테스트 / 단일 프로세스 다중 매니저)
+#   UnixSocketBackplane : 같은 머신의 워커 프로세스끼리 unix datagram 소켓으로 (큰 메시지는 조각으로 나눠 전송)
+#   RedisBackplane      : Redis pub/sub (redis 패키지가 있을 때만)
+#
+# 메시지는 JSON 으로 직렬화 가능한 dict 이며, 워커 단위로 주소를 지정한다.
+
+import asyncio
+import json
+import os
+import socket
+import struct
+from typing import Callable, Dict, List, Optional
+
+from core.log import get_logger
+
+log = get_logger("backplane")
+
+Handler = Callable[[dict], None]
+
+
+class BackplaneError(Exception):
+    """대상 워커에 메시지를 보낼 수 없음"""
+
+
+def _encode(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode()
+
+
+def _decode(data: bytes) -> dict:
+    return json.loads(data)
+
+
+class Backplane:
+    """모든 backplane 구현의 인터페이스"""
+
+    async def start(self, worker_id: str, handler: Handler):
+        """worker_id 로 수신 시작. 받은 메시지마다 handler(message) 호출"""
+        raise NotImplementedError
+
+    async def stop(self):
+        raise NotImplementedError
+
+    async def send(self, worker_id: str, message: dict):
+        """worker_id 에게 메시지 전송 (실패 시 BackplaneError)"""
+        raise NotImplementedError
+
+    async def workers(self) -> List[str]:
+        """현재 살아 있는 워커 id 목록 (자기 자신 포함)"""
+        raise NotImplementedError
+
+
+class LocalBackplane(Backplane):
+    """프로세스 내부 허브. 직렬화를 거쳐 실제 backplane 과 같은 조건으로 전달한다."""
+
+    _hub: Dict[str, Handler] = {}
+
+    def __init__(self):
+        self.worker_id: Optional[str] = None
+
+    async def start(self, worker_id: str, handler: Handler):
+        self.worker_id = worker_id
+        self._hub[worker_id] = handler
+
+    async def stop(self):
+        if self.worker_id is not None:
+            self._hub.pop(self.worker_id, None)
+
+    async def send(self, worker_id: str, message: dict):
+        handler = self._hub.get(worker_id)
+        if handler is None:
+            raise BackplaneError(f"unknown worker {worker_id}")
+        asyncio.get_running_loop().call_soon(handler, _decode(_encode(message)))
+
+    async def workers(self) -> List[str]:
+        return list(self._hub)
+
+
+class UnixSocketBackplane(Backplane):
+    """
+    워커마다 <directory>/<worker_id>.sock 에 datagram 소켓을 열어 둔다.
+    같은 디렉터리를 쓰는 워커끼리 서로를 발견하고 메시지를 주고받는다.
+
+    커널은 SO_SNDBUF 를 wmem_max 로 잘라 datagram 하나의 크기가 그보다 클 수 없으므로,
+    CHUNK 보다 큰 메시지(큰 목록, 일괄 조회 결과 등)는 조각으로 나눠 보내고 받는 쪽에서 다시 합친다.
+    조각 datagram 은 0 바이트 + (메시지 id, 순번, 조각 수) 헤더로 시작해 JSON('{') 과 구분된다.
+    """
+
+    MAX_DATAGRAM = 1 << 20
+    CHUNK = 64 * 1024
+    # 조립 중인 메시지 수 상한 (보내던 워커가 중간에 죽어 끝나지 않은 메시지는 오래된 것부터 버린다)
+    MAX_PARTIAL = 64
+
+    _HEADER = struct.Struct(">B8sII")
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.worker_id: Optional[str] = None
+        self._sock: Optional[socket.socket] = None
+        self._reader: Optional[asyncio.Task] = None
+        # 조립 중인 메시지: id -> 조각 목록
+        self._partial: Dict[bytes, List[Optional[bytes]]] = {}
+
+    def _path(self, worker_id: str) -> str:
+        return os.path.join(self.directory, f"{worker_id}.sock")
+
+    async def start(self, worker_id: str, handler: Handler):
+        os.makedirs(self.directory, exist_ok=True)
+        self.worker_id = worker_id
+        path = self._path(worker_id)
+        if os.path.exists(path):
+            os.unlink(path)
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.MAX_DATAGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.MAX_DATAGRAM)
+        sock.bind(path)
+        sock.setblocking(False)
+        self._sock = sock
+        self._reader = asyncio.get_running_loop().create_task(self._read(handler))
+
+    async def stop(self):
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            try:
+                os.unlink(self._path(self.worker_id))
+            except FileNotFoundError:
+                pass
+
+    async def send(self, worker_id: str, message: dict):
+        path = self._path(worker_id)
+        loop = asyncio.get_running_loop()
+        data = _encode(message)
+        try:
+            if len(data) <= self.CHUNK:
+                await loop.sock_sendto(self._sock, data, path)
+            else:
+                message_id = os.urandom(8)
+                count = -(-len(data) // self.CHUNK)
+                for index in range(count):
+                    chunk = data[index * self.CHUNK:(index + 1) * self.CHUNK]
+                    await loop.sock_sendto(self._sock, self._HEADER.pack(0, message_id, index, count) + chunk, path)
+        except (ConnectionRefusedError, FileNotFoundError) as e:
+            # 죽은 워커가 남긴 소켓 파일 정리
+            if isinstance(e, ConnectionRefusedError):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            raise BackplaneError(f"worker {worker_id} unreachable") from e
+
+    async def workers(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [name[:-5] for name in names if name.endswith(".sock")]
+
+    async def _read(self, handler: Handler):
+        loop = asyncio.get_running_loop()
+        while True:
+            data, _ = await loop.sock_recvfrom(self._sock, self.MAX_DATAGRAM)
+            if data[:1] == b"\x00":
+                data = self._reassemble(data)
+                if data is None:
+                    continue
+            try:
+                handler(_decode(data))
+            except Exception:
+                log.exception("message handler failed")
+
+    def _reassemble(self, data: bytes) -> Optional[bytes]:
+        """조각 하나를 모으고, 마지막 조각이면 합친 메시지를 돌려준다"""
+        _, message_id, index, count = self._HEADER.unpack_from(data)
+        parts = self._partial.get(message_id)
+        if parts is None:
+            if len(self._partial) >= self.MAX_PARTIAL:
+                dropped = next(iter(self._partial))
+                del self._partial[dropped]
+                log.warning("dropped incomplete message", message_id=dropped.hex())
+            parts = self._partial[message_id] = [None] * count
+        parts[index] = data[self._HEADER.size:]
+        if any(part is None for part in parts):
+            return None
+        del self._partial[message_id]
+        return b"".join(parts)
+
+
+class RedisBackplane(Backplane):
+    """Redis pub/sub 기반. 워커마다 채널 하나, 살아 있는 워커 목록은 set 으로 관리"""
+
+    def __init__(self, url: str, prefix: str = "timer"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:  # redis 는 선택 의존성
+            raise RuntimeError("RedisBackplane requires the 'redis' package") from e
+        self._redis = redis.from_url(url)
+        self.prefix = prefix
+        self.worker_id: Optional[str] = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+
+    def _channel(self, worker_id: str) -> str:
+        return f"{self.prefix}:worker:{worker_id}"
+
+    async def start(self, worker_id: str, handler: Handler):
+        self.worker_id = worker_id
+        self._pubsub = self._redis.pubsub()
+        await self._pubsub.subscribe(self._channel(worker_id))
+        await self._redis.sadd(f"{self.prefix}:workers", worker_id)
+        self._reader = asyncio.get_running_loop().create_task(self._read(handler))
+
+    async def stop(self):
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._pubsub is not None:
+            await self._redis.srem(f"{self.prefix}:workers", self.worker_id)
+            await self._pubsub.close()
+            self._pubsub = None
+
+    async def send(self, worker_id: str, message: dict):
+        receivers = await self._redis.publish(self._channel(worker_id), _encode(message))
+        if not receivers:
+            raise BackplaneError(f"worker {worker_id} unreachable")
+
+    async def workers(self) -> List[str]:
+        return [w.decode() for w in await self._redis.smembers(f"{self.prefix}:workers")]
+
+    async def _read(self, handler: Handler):
+        async for item in self._pubsub.listen():
+            if item.get("type") != "message":
+                continue
+            try:
+                handler(_decode(item["data"]))
+            except Exception:
+                log.exception("message handler failed")
+
+
+def from_url(url: str) -> Optional[Backplane]:
+    """TIMER_BACKPLANE 설정값으로 backplane 생성 ("" 이면 단일 워커)"""
+    if not url:
+        return None
+    if url == "local":
+        return LocalBackplane()
+    if url.startswith("unix:"):
+        return UnixSocketBackplane(url[len("unix:"):])
+    if url.startswith(("redis://", "rediss://")):
+        return RedisBackplane(url)
+    raise ValueError(f"unknown backplane: {url}")
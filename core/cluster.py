@@ -0,0 +1,213 @@
+# your_project/core/cluster.py
+#
+# 다중 워커 (uvicorn --workers N) 구성.
+#
+# 그룹은 자신을 만든 워커(호스트의 WebSocket 이 붙은 워커)가 소유하고, 그 워커에서만
+# AsyncTimer 가 돈다. 클러스터 모드에서는 player_id / group_name 끝에 "@<worker_id>" 를 붙여
+# id 만 보고도 소유 워커를 알 수 있게 한다.
+#
+# 워커 간에는 core.backplane 으로 네 종류의 메시지만 주고받는다.
+#   rpc / rpc_result : 다른 워커가 소유한 그룹에 대한 REST 작업, join 시 플레이어 이동
+#   deliver          : 소유 워커의 브로드캐스트 프레임을 게스트 소켓이 붙은 워커로 전달
+#                      (브로드캐스트 1건당 대상 워커마다 메시지 1건)
+#   feed             : 변경 피드 이벤트를 구독자가 붙은 워커로 전달 (core.feed 참고)
+#
+#   TIMER_BACKPLANE=""                    단일 워커 (기본, 클러스터 비활성)
+#   TIMER_BACKPLANE=unix:/tmp/timer-bp    같은 머신의 워커끼리 unix 소켓으로
+#   TIMER_BACKPLANE=redis://host:6379/0   Redis pub/sub
+#   TIMER_WORKER_ID=                      워커 id (기본: pid)
+#   TIMER_RPC_TIMEOUT=5                   워커 간 호출 타임아웃 (초)
+
+import asyncio
+import itertools
+import os
+import uuid
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from core import backplane as backplanes
+from core import config
+from core.log import get_logger
+from core.protocol import Frame
+
+log = get_logger("cluster")
+
+
+class Cluster:
+    def __init__(
+        self,
+        backplane: Optional[backplanes.Backplane] = None,
+        worker_id: Optional[str] = None,
+        rpc_timeout: Optional[float] = None
+    ):
+        self.backplane = backplane
+        self.worker_id = worker_id or config.WORKER_ID or str(os.getpid())
+        self.rpc_timeout = rpc_timeout or config.RPC_TIMEOUT
+
+        # 원격 호출로 실행할 수 있는 작업과 deliver 메시지 처리기 (매니저/서비스가 등록)
+        self._ops: Dict[str, Callable[..., Awaitable]] = {}
+        self._deliver_handler: Optional[Callable[[List[str], Frame], None]] = None
+        self._feed_handler: Optional[Callable[[str, Frame], None]] = None
+
+        # 응답을 기다리는 호출
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._call_ids = itertools.count(1)
+
+        # 송신 순서를 지키기 위한 단일 writer
+        self._outbox: Deque[Tuple[str, dict]] = deque()
+        self._ready: Optional[asyncio.Event] = None
+        self._writer: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls) -> "Cluster":
+        return cls(backplanes.from_url(config.BACKPLANE))
+
+    @property
+    def enabled(self) -> bool:
+        return self.backplane is not None
+
+    # --- id 와 소유권 ---
+
+    def new_id(self) -> str:
+        """소유 워커가 드러나는 새 id (클러스터 비활성이면 기존과 같은 uuid)"""
+        ident = str(uuid.uuid4())
+        return f"{ident}@{self.worker_id}" if self.enabled else ident
+
+    def owner_of(self, identifier: str) -> str:
+        """player_id / group_name 의 소유 워커 id"""
+        if not self.enabled:
+            return self.worker_id
+        _, sep, worker_id = identifier.rpartition("@")
+        return worker_id if sep else self.worker_id
+
+    def is_local(self, identifier: str) -> bool:
+        return self.owner_of(identifier) == self.worker_id
+
+    # --- 등록 ---
+
+    def register(self, op: str, handler: Callable[..., Awaitable]):
+        """다른 워커가 call(op, ...) 으로 실행할 수 있는 작업 등록"""
+        self._ops[op] = handler
+
+    def on_deliver(self, handler: Callable[[List[str], Frame], None]):
+        self._deliver_handler = handler
+
+    def on_feed(self, handler: Callable[[str, Frame], None]):
+        self._feed_handler = handler
+
+    # --- 수명 ---
+
+    async def start(self):
+        if not self.enabled:
+            return
+        await self.backplane.start(self.worker_id, self._on_message)
+        log.info("worker joined cluster", worker=self.worker_id, backplane=type(self.backplane).__name__)
+
+    async def stop(self):
+        if not self.enabled:
+            return
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(HTTPException(status_code=503, detail="워커가 종료 중입니다."))
+        self._pending.clear()
+        await self.backplane.stop()
+
+    async def workers(self) -> List[str]:
+        if not self.enabled:
+            return [self.worker_id]
+        return await self.backplane.workers()
+
+    # --- 송신 ---
+
+    def deliver(self, worker_id: str, player_ids: List[str], frame: Frame):
+        """worker_id 에 소켓이 있는 플레이어들에게 프레임 전달 (기다리지 않음)"""
+        self._post(worker_id, {"type": "deliver", "players": player_ids, "frame": frame.to_wire()})
+
+    def publish(self, worker_id: str, channel: str, frame: Frame):
+        """worker_id 의 channel 구독자들에게 피드 프레임 전달 (기다리지 않음)"""
+        self._post(worker_id, {"type": "feed", "channel": channel, "frame": frame.to_wire()})
+
+    async def call(self, worker_id: str, op: str, **kwargs):
+        """
+        worker_id 에서 op 를 실행하고 결과를 돌려받는다.
+        원격에서 발생한 HTTPException 은 같은 상태 코드로 다시 발생한다.
+        """
+        call_id = next(self._call_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[call_id] = future
+        self._post(worker_id, {"type": "rpc", "id": call_id, "from": self.worker_id, "op": op, "args": kwargs})
+        try:
+            return await asyncio.wait_for(future, self.rpc_timeout)
+        except asyncio.TimeoutError:
+            log.warning("rpc timeout", worker=worker_id, op=op)
+            raise HTTPException(status_code=504, detail="담당 워커가 응답하지 않습니다.")
+        finally:
+            self._pending.pop(call_id, None)
+
+    def _post(self, worker_id: str, message: dict):
+        self._outbox.append((worker_id, message))
+        if self._writer is None:
+            self._ready = asyncio.Event()
+            self._writer = asyncio.get_running_loop().create_task(self._run())
+        self._ready.set()
+
+    async def _run(self):
+        """보낼 메시지를 순서대로 backplane 에 전달"""
+        while True:
+            if not self._outbox:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            worker_id, message = self._outbox.popleft()
+            try:
+                await self.backplane.send(worker_id, message)
+            except Exception as e:
+                log.warning("backplane send failed", worker=worker_id, type=message["type"], error=repr(e))
+                if message["type"] == "rpc":
+                    future = self._pending.get(message["id"])
+                    if future is not None and not future.done():
+                        future.set_exception(HTTPException(status_code=503, detail="담당 워커에 연결할 수 없습니다."))
+
+    # --- 수신 ---
+
+    def _on_message(self, message: dict):
+        kind = message.get("type")
+        if kind == "deliver":
+            if self._deliver_handler is not None:
+                self._deliver_handler(message["players"], Frame.from_wire(message["frame"]))
+        elif kind == "feed":
+            if self._feed_handler is not None:
+                self._feed_handler(message["channel"], Frame.from_wire(message["frame"]))
+        elif kind == "rpc":
+            asyncio.get_running_loop().create_task(self._serve(message))
+        elif kind == "rpc_result":
+            future = self._pending.get(message["id"])
+            if future is None or future.done():
+                return
+            error = message.get("error")
+            if error is None:
+                future.set_result(message.get("result"))
+            else:
+                future.set_exception(HTTPException(status_code=error["status"], detail=error["detail"]))
+
+    async def _serve(self, message: dict):
+        reply = {"type": "rpc_result", "id": message["id"]}
+        handler = self._ops.get(message["op"])
+        try:
+            if handler is None:
+                raise HTTPException(status_code=501, detail=f"unknown op {message['op']}")
+            reply["result"] = await handler(**message["args"])
+        except HTTPException as e:
+            reply["error"] = {"status": e.status_code, "detail": e.detail}
+        except Exception as e:
+            log.exception("rpc failed", op=message["op"])
+            reply["error"] = {"status": 500, "detail": repr(e)}
+        self._post(message["from"], reply)
+
+
+cluster = Cluster.from_env()  # 싱글턴 인스턴스
@@ -0,0 +1,139 @@
+# your_project/core/commands.py
+#
+# 게임 소켓(/ws) 명령 채널. REST 요청 없이 이미 열린 소켓으로 게임을 제어한다.
+#
+#   요청  {"action": "start" | "stop" | "pause" | "resume" | "turn_over" | "get_group", "id": ...}
+#         {"action": "set_time", "h": 0, "m": 1, "s": 30, "id": ...}
+#         {"action": "join", "group_name": ..., "host_player_id": ..., "id": ...}
+#         {"action": "reorder", "new_order": [player_id, ...], "id": ...}
+#   응답  {"status": "success", "action": ..., "id": ...[, "group_name" | "group": ...]}
+#         {"status": "error", "action": ..., "id": ..., "code": 400 | 404 | 409 | 429 | 500, "detail": ...}
+#
+# join 을 제외한 명령은 보낸 플레이어의 현재 그룹에 적용된다. 실행은 REST 와 같은 GroupService 를 거치므로
+# 다른 워커 소유 그룹도 그대로 동작한다. 응답은 플레이어 송신 큐로 보내 브로드캐스트와 순서가 섞이지 않고,
+# 명령은 받은 순서대로 하나씩 실행된다. "id" 는 그대로 돌려주므로 클라이언트가 응답을 요청에 짝지을 수 있다.
+# 연결마다 token bucket 으로 초당 명령 수를 제한한다 (config.COMMAND_RATE / COMMAND_BURST).
+
+import time
+
+from fastapi import HTTPException
+from pydantic import TypeAdapter, ValidationError
+
+from core import config, metrics
+from core.connection_manager import ConnectionManager, manager as default_manager
+from core.log import get_logger
+from core.player import Player
+from core.protocol import json_frame
+from core.scheduler import scheduler
+from core.service import GroupService, service as default_service
+from models import ClientCommand, Command
+
+log = get_logger("commands")
+
+_commands = TypeAdapter(ClientCommand)
+
+# 명령이 아닌 클라이언트 메시지 (heartbeat 응답 등, 수신 시각만 갱신)
+PASSIVE_ACTIONS = frozenset(("pong",))
+
+
+class CommandChannel:
+    """게임 소켓 하나의 명령 처리기 (연결마다 하나)"""
+
+    __slots__ = ("player", "manager", "service", "_tokens", "_refilled")
+
+    def __init__(
+        self,
+        player: Player,
+        manager: ConnectionManager = default_manager,
+        service: GroupService = default_service
+    ):
+        self.player = player
+        self.manager = manager
+        self.service = service
+        self._tokens = float(config.COMMAND_BURST)
+        self._refilled = scheduler.now()
+
+    def _allow(self) -> bool:
+        """token bucket: 초당 COMMAND_RATE 개씩 채워지고 최대 COMMAND_BURST 개까지 쌓인다"""
+        now = scheduler.now()
+        self._tokens = min(float(config.COMMAND_BURST), self._tokens + (now - self._refilled) * config.COMMAND_RATE)
+        self._refilled = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def handle(self, message) -> bool:
+        """
+        수신한 JSON 메시지 처리. 명령이 아니면 (action 이 없거나 pong) False 를 돌려준다.
+        명령이면 실행하고 결과를 송신 큐에 넣는다.
+        """
+        if not isinstance(message, dict) or "action" not in message or message["action"] in PASSIVE_ACTIONS:
+            return False
+        action = message["action"]
+        request_id = message.get("id")
+
+        if not self._allow():
+            metrics.COMMANDS_RATE_LIMITED.inc()
+            self._reply_error(action, request_id, 429, "명령 전송 속도 제한을 초과했습니다.")
+            return True
+
+        try:
+            command = _commands.validate_python(message)
+        except ValidationError as e:
+            errors = e.errors(include_url=False, include_context=False, include_input=False)
+            self._reply_error(action, request_id, 400, errors if len(errors) > 1 else errors[0]["msg"])
+            return True
+
+        started = time.perf_counter()
+        try:
+            result = await self._run(command)
+        except HTTPException as e:
+            self._reply_error(command.action, command.id, e.status_code, e.detail)
+        except ValueError as e:
+            self._reply_error(command.action, command.id, 409, str(e))
+        except Exception as e:
+            log.exception("command failed", player=self.player.player_id, action=command.action)
+            self._reply_error(command.action, command.id, 500, repr(e))
+        else:
+            self.player.send(json_frame({"status": "success", "action": command.action, "id": command.id, **result}))
+        metrics.COMMAND_SECONDS.observe(time.perf_counter() - started)
+        return True
+
+    async def _run(self, command: Command) -> dict:
+        action = command.action
+        service = self.service
+        player_id = self.player.player_id
+
+        if action == "join":
+            group_name = await service.join_group(
+                group_name=command.group_name, host_player_id=command.host_player_id, guest_player_id=player_id
+            )
+            return {"group_name": group_name}
+
+        group_name = self.manager.current_group(player_id)
+        if group_name is None:
+            raise HTTPException(status_code=404, detail="소속 그룹을 찾을 수 없습니다.")
+
+        if action == "start":
+            return {"group": await service.start_game(group_name=group_name)}
+        elif action == "stop":
+            await service.stop_game(group_name=group_name)
+        elif action == "pause":
+            await service.pause_game(group_name=group_name)
+        elif action == "resume":
+            await service.resume_game(group_name=group_name)
+        elif action == "turn_over":
+            return {"group": await service.turn_over(group_name=group_name)}
+        elif action == "get_group":
+            return {"group": await service.get_group(group_name=group_name)}
+        elif action == "set_time":
+            await service.set_time(group_name=group_name, h=command.h, m=command.m, s=command.s)
+        elif action == "reorder":
+            await service.reorder_group(group_name=group_name, new_order=command.new_order)
+        return {"group_name": group_name}
+
+    def _reply_error(self, action, request_id, code: int, detail):
+        self.player.send(json_frame({
+            "status": "error", "action": action, "id": request_id, "code": code, "detail": detail
+        }))
@@ -0,0 +1,55 @@
+# your_project/core/config.py
+#
+# 환경 변수로 덮어쓸 수 있는 서버 설정값
+
+import os
+
+# 플레이어별 송신 큐 크기와 큐가 가득 찼을 때의 정책 (drop_oldest / coalesce / disconnect)
+SEND_QUEUE_SIZE = int(os.getenv("TIMER_SEND_QUEUE_SIZE", "64"))
+SEND_OVERFLOW_POLICY = os.getenv("TIMER_SEND_OVERFLOW_POLICY", "coalesce")
+
+# sync 모드 클라이언트에게 timer_sync 를 다시 보내는 주기 (초)
+TIMER_RESYNC_INTERVAL = float(os.getenv("TIMER_RESYNC_INTERVAL", "10"))
+
+# 다중 워커 구성 (core.cluster 참고). BACKPLANE 이 비어 있으면 단일 워커로 동작한다.
+BACKPLANE = os.getenv("TIMER_BACKPLANE", "")
+WORKER_ID = os.getenv("TIMER_WORKER_ID", "")
+RPC_TIMEOUT = float(os.getenv("TIMER_RPC_TIMEOUT", "5"))
+
+# 연결이 끊긴 플레이어를 그룹에 남겨 두는 시간 (초). 이 안에 resume_token 으로 다시 붙을 수 있다. 0 이면 즉시 제거
+RESUME_GRACE = float(os.getenv("TIMER_RESUME_GRACE", "30"))
+
+# 그룹/타이머 스냅샷 파일 (비어 있으면 비활성)과 저장 주기 (초)
+SNAPSHOT_PATH = os.getenv("TIMER_SNAPSHOT_PATH", "")
+SNAPSHOT_INTERVAL = float(os.getenv("TIMER_SNAPSHOT_INTERVAL", "5"))
+
+# 유휴 그룹 정리: 플레이어 활동(수신 메시지/heartbeat)과 사용자 조작이 이 시간(초) 동안 없으면 그룹 제거. 0 이면 비활성
+GROUP_IDLE_TIMEOUT = float(os.getenv("TIMER_GROUP_IDLE_TIMEOUT", "1800"))
+
+# 메모리 상한: 워커당 최대 그룹 수와 그룹당 최대 인원 (0 이면 제한 없음)
+MAX_GROUPS = int(os.getenv("TIMER_MAX_GROUPS", "10000"))
+MAX_PLAYERS_PER_GROUP = int(os.getenv("TIMER_MAX_PLAYERS_PER_GROUP", "16"))
+
+# 턴 사이 대기(intermission) 시간 (초). 이 동안 매초 turn_wait 를 보낸 뒤 다음 턴 타이머를 시작한다
+TURN_INTERMISSION = float(os.getenv("TIMER_TURN_INTERMISSION", "3"))
+
+# 서버 heartbeat: interval 초마다 ping, max_missed 번 연속 응답이 없으면 연결 종료 (interval 0 이면 비활성)
+# ?heartbeat=true 로 협상했거나 pong 을 보낸 연결에만 적용된다 (core.heartbeat 참고)
+HEARTBEAT_INTERVAL = float(os.getenv("TIMER_HEARTBEAT_INTERVAL", "10"))
+HEARTBEAT_MAX_MISSED = int(os.getenv("TIMER_HEARTBEAT_MAX_MISSED", "2"))
+
+# 변경 피드: 구독 소켓당 최대 채널 수와 송신 큐 크기 (가득 차면 이벤트가 합쳐지고 seq 공백으로 드러난다)
+FEED_MAX_SUBSCRIPTIONS = int(os.getenv("TIMER_FEED_MAX_SUBSCRIPTIONS", "100"))
+FEED_QUEUE_SIZE = int(os.getenv("TIMER_FEED_QUEUE_SIZE", "256"))
+
+# 일괄 제어 API 한 번에 받을 수 있는 최대 작업 수
+BATCH_MAX_OPERATIONS = int(os.getenv("TIMER_BATCH_MAX_OPERATIONS", "1000"))
+
+# 게임 소켓 명령 채널: 연결당 초당 명령 수와 순간 허용량 (token bucket, 넘으면 429 로 거절)
+COMMAND_RATE = float(os.getenv("TIMER_COMMAND_RATE", "10"))
+COMMAND_BURST = int(os.getenv("TIMER_COMMAND_BURST", "20"))
+
+# 그룹별 이벤트 로그 디렉터리 (비어 있으면 비활성), 쓰기 주기(초)와 주기 전에 바로 쓰는 이벤트 수
+EVENT_LOG_DIR = os.getenv("TIMER_EVENT_LOG_DIR", "")
+EVENT_LOG_FLUSH_INTERVAL = float(os.getenv("TIMER_EVENT_LOG_FLUSH_INTERVAL", "1"))
+EVENT_LOG_BATCH = int(os.getenv("TIMER_EVENT_LOG_BATCH", "1000"))
@@ -1,105 +1,564 @@
 # your_project/core/connection_manager.py
 
-import uuid
+import time
 import asyncio
-from typing import Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 from fastapi import WebSocket, HTTPException
 
-from core.player import Player
+from core import config, metrics
+from core.cluster import Cluster, cluster as default_cluster
+from core.feed import LOBBY, Feed, feed as default_feed
+from core.log import get_logger
+from core.player import Player, RemotePlayer
 from core.group import Group
+from core.protocol import Frame
+from core.scheduler import ScheduledCall, scheduler
+
+log = get_logger("manager")
+
+# 그룹 목록 캐시에 보관할 최대 조건 조합 수 (넘으면 비우고 다시 채운다)
+LISTING_CACHE_SIZE = 32
 
 class ConnectionManager:
-    def __init__(self):
+    """
+    그룹 레지스트리.
+
+    전역 락 대신 그룹별 asyncio.Lock 을 사용한다. 브로드캐스트와 조회는 락 없이
+    dict 를 읽고, 그룹 상태를 바꾸는 작업만 해당 그룹의 락을 잡는다.
+    여러 그룹에 걸친 작업(join_group)은 그룹 이름순으로 락을 잡아 교착을 피한다.
+
+    클러스터 모드에서는 이 워커가 소유한 그룹만 groups 에 있다. 다른 워커의 그룹에
+    합류한 로컬 소켓 플레이어는 _away 에, 이 워커의 그룹에 합류한 다른 워커의
+    플레이어는 RemotePlayer 로 그룹에 들어간다.
+    """
+
+    def __init__(
+        self,
+        send_queue_size: Optional[int] = None,
+        overflow_policy: Optional[str] = None,
+        cluster: Optional[Cluster] = None,
+        resume_grace: Optional[float] = None,
+        feed: Optional[Feed] = None
+    ):
         self.groups: Dict[str, Group] = {}
-        self.lock = asyncio.Lock()
+        self._group_locks: Dict[str, asyncio.Lock] = {}
 
-    async def broadcast_to_group(self, group_name: str, message: str):
-        """동일한 그룹 내 모든 플레이어에게 메시지 전송"""
-        async with self.lock:
-            if group_name not in self.groups:
+        # 색인: player_id -> (player, group_name), websocket -> player, host player_id -> group_name
+        self._players: Dict[str, Tuple[Player, str]] = {}
+        self._sockets: Dict[WebSocket, Player] = {}
+        self._host_groups: Dict[str, str] = {}
+
+        # 다른 워커가 소유한 그룹에 합류한 로컬 소켓 플레이어: player_id -> (player, group_name)
+        self._away: Dict[str, Tuple[Player, str]] = {}
+
+        # 세션 재개: resume_token -> player, 연결이 끊긴 player_id -> 만료 예약
+        self.resume_grace = config.RESUME_GRACE if resume_grace is None else resume_grace
+        self._tokens: Dict[str, Player] = {}
+        self._suspended: Dict[str, ScheduledCall] = {}
+
+        # 마지막 스냅샷 이후 상태가 바뀐(또는 삭제된) 그룹 이름 (core.snapshot 이 가져감)
+        # 스냅샷 저장소가 붙어 있을 때만(track_changes) 기록한다
+        self.track_changes = False
+        self._dirty: Set[str] = set()
+
+        # 그룹 이벤트 기록기 (core.event_log 가 붙어 있을 때만): (group_name, event, fields)
+        self.recorder: Optional[Callable[[str, str, dict], None]] = None
+
+        # 그룹 목록 조회 캐시: 조건 -> (목록 버전, 그룹 이름 목록)
+        # 그룹 생성/삭제, 인원, 진행 여부가 바뀔 때만 버전이 올라가고, 다음 조회 때 다시 만든다
+        self._listing_version = 0
+        self._listings: Dict[tuple, Tuple[int, List[str]]] = {}
+
+        # 유휴 그룹 정리: group_name -> 공유 스케줄러에 예약된 만료 확인 (그룹당 하나)
+        self.idle_timeout = config.GROUP_IDLE_TIMEOUT
+        self._idle_checks: Dict[str, ScheduledCall] = {}
+
+        # 메모리 상한
+        self.max_groups = config.MAX_GROUPS
+        self.max_players_per_group = config.MAX_PLAYERS_PER_GROUP
+
+        self.cluster = cluster or default_cluster
+        self.cluster.register("detach_player", self._rpc_detach_player)
+        self.cluster.register("remove_member", self._rpc_remove_member)
+        self.cluster.on_deliver(self._deliver)
+
+        # 변경 피드 (그룹 채널 구독 시 스냅샷 제공)
+        self.feed = feed or default_feed
+        self.feed.on_snapshot(self._feed_snapshot)
+
+        # 플레이어 송신 큐 설정 (None 이면 core.config 기본값)
+        self.send_queue_size = send_queue_size
+        self.overflow_policy = overflow_policy
+
+        # 모든 Group 이 공유하는 콜백 (그룹마다 클로저를 만들지 않는다)
+        self._group_broadcast = self.broadcast_frame
+        self._group_changed = self._on_group_changed
+        self._group_event = self._on_group_event
+
+    def _group_lock(self, group_name: str) -> asyncio.Lock:
+        lock = self._group_locks.get(group_name)
+        if lock is None:
+            lock = self._group_locks[group_name] = asyncio.Lock()
+        return lock
+
+    @asynccontextmanager
+    async def _lock_groups(self, *group_names: str):
+        """그룹 락들을 이름순으로 획득 (락을 잡은 뒤 그룹 존재 여부는 호출자가 재확인)"""
+        locks = [self._group_lock(name) for name in sorted(set(group_names))]
+        acquired = []
+        requested_at = time.perf_counter()
+        acquired_at = None
+        try:
+            for lock in locks:
+                await lock.acquire()
+                acquired.append(lock)
+            acquired_at = time.perf_counter()
+            metrics.LOCK_WAIT_SECONDS.observe(acquired_at - requested_at)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+            if acquired_at is not None:
+                metrics.LOCK_HOLD_SECONDS.observe(time.perf_counter() - acquired_at)
+
+    def _index_player(self, player: Player, group_name: str):
+        self._players[player.player_id] = (player, group_name)
+        if player.websocket is not None:
+            self._sockets[player.websocket] = player
+
+    def _unindex_player(self, player: Player):
+        self._players.pop(player.player_id, None)
+        if player.websocket is not None and self._sockets.get(player.websocket) is player:
+            del self._sockets[player.websocket]
+
+    def _is_in_group(self, player: Player, group_name: str) -> bool:
+        """색인상 player 가 여전히 group_name 에 속해 있는지 (락 획득 후 재확인용)"""
+        entry = self._players.get(player.player_id)
+        return entry is not None and entry[0] is player and entry[1] == group_name
+
+    def _drop_group(self, group_name: str):
+        """빈 그룹 제거 (해당 그룹 락을 잡은 상태에서 호출)"""
+        group = self.groups.pop(group_name, None)
+        if group is not None:
+            group.close()
+        self._group_locks.pop(group_name, None)
+        self._group_listed(group_name, "group_removed")
+        if self.recorder is not None:
+            self.recorder(group_name, "group_closed", {})
+        if self.feed.watched(group_name):
+            self.feed.publish(group_name, "group_closed")
+            self.feed.close_channel(group_name)
+        handle = self._idle_checks.pop(group_name, None)
+        if handle is not None:
+            handle.cancel()
+        if group is not None and self._host_groups.get(group.host_player.player_id) == group_name:
+            del self._host_groups[group.host_player.player_id]
+        log.info("group removed (empty)", group=group_name)
+
+    def _check_capacity(self, group: Group):
+        if self.max_players_per_group and len(group.players) >= self.max_players_per_group:
+            metrics.GROUPS_REJECTED.inc()
+            raise HTTPException(status_code=409, detail="그룹 인원 제한을 초과했습니다.")
+
+    def _arm_idle_check(self, group: Group):
+        """
+        유휴 만료 색인에 그룹 등록. 색인은 공유 스케줄러의 heap 이며 그룹당 항목 하나뿐이다.
+        활동이 있을 때마다 갱신하지 않고, 만료 시점에 실제 마지막 활동을 보고 다시 미룬다.
+        """
+        if self.idle_timeout <= 0:
+            return
+        self._idle_checks[group.group_name] = scheduler.call_at(
+            group.idle_since() + self.idle_timeout, self._check_idle, group.group_name
+        )
+
+    def _check_idle(self, group_name: str):
+        self._idle_checks.pop(group_name, None)
+        group = self.groups.get(group_name)
+        if group is None:
+            return
+        if scheduler.now() - group.idle_since() < self.idle_timeout:
+            self._arm_idle_check(group)
+            return
+        scheduler.spawn(self._reap_group(group_name))
+
+    async def _reap_group(self, group_name: str):
+        """유휴 그룹의 타이머를 멈추고 남은 플레이어 연결을 정리한 뒤 제거"""
+        async with self._lock_groups(group_name):
+            group = self.groups.get(group_name)
+            if group is None:
                 return
-            group = self.groups[group_name]
-            for p in group.players:
-                if p.websocket:
-                    try:
-                        await p.websocket.send_text(message)
-                    except Exception as e:
-                        print(f"[ConnectionManager] Broadcast failed: {e}")
+            # 락을 기다리는 동안 활동이 있었다면 다시 미룬다
+            if scheduler.now() - group.idle_since() < self.idle_timeout:
+                if group_name not in self._idle_checks:
+                    self._arm_idle_check(group)
+                return
+
+            await group.timer.stop()
+            for player in group.players:
+                self._release_player(player)
+            group.players = []
+            self._drop_group(group_name)
+        metrics.GROUPS_REAPED.inc()
+        log.info("group reaped (idle)", group=group_name)
+
+    def _release_player(self, player: Player):
+        """그룹과 함께 사라지는 플레이어의 색인, 재접속 토큰, 소켓 정리"""
+        self._unindex_player(player)
+        self._tokens.pop(player.resume_token, None)
+        handle = self._suspended.pop(player.player_id, None)
+        if handle is not None:
+            handle.cancel()
+        if player.websocket is not None:
+            scheduler.spawn(self._close_socket(player.websocket))
+        player.close()
+
+    def _on_group_changed(self, group_name: str, listing: bool = False, summary: bool = False):
+        if listing:
+            self._group_listed(group_name, "group_updated")
+        else:
+            self._mark_dirty(group_name)
+            if summary:
+                # 목록 조건은 그대로이고 요약(타이머 상태)만 바뀜: 캐시는 두고 로비에만 알린다
+                self._publish_lobby(group_name, "group_updated")
+
+    def _group_listed(self, group_name: str, event: str):
+        """그룹 목록에 영향을 주는 변경: 목록 캐시 무효화, 스냅샷 대상 표시, 로비 이벤트"""
+        self._listing_version += 1
+        self._mark_dirty(group_name)
+        self._publish_lobby(group_name, event)
 
-    def _make_broadcast_callback(self):
-        """Group에 주입할 콜백 함수. group_name, message -> await broadcast_to_group(group_name, message)"""
-        async def broadcast_cb(group_name: str, msg: str):
-            await self.broadcast_to_group(group_name, msg)
-        return broadcast_cb
+    def _publish_lobby(self, group_name: str, event: str):
+        if self.feed.watched(LOBBY):
+            group = self.groups.get(group_name)
+            if group is None:
+                self.feed.publish(LOBBY, event, group_name=group_name)
+            else:
+                self.feed.publish(LOBBY, event, group=group.summary())
 
-    async def register_player(self, websocket: WebSocket, player_name: str):
+    def _on_group_event(self, group_name: str, event: str, fields: dict):
+        if self.recorder is not None:
+            self.recorder(group_name, event, fields)
+        self.feed.publish(group_name, event, **fields)
+
+    def _feed_snapshot(self, group_name: str) -> Optional[dict]:
+        group = self.groups.get(group_name)
+        return group.to_dict() if group is not None else None
+
+    def _mark_dirty(self, group_name: str):
+        if self.track_changes:
+            self._dirty.add(group_name)
+
+    def take_dirty_groups(self) -> Set[str]:
+        """마지막 호출 이후 바뀐 그룹 이름을 돌려주고 비운다"""
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
+    def return_dirty_groups(self, names: Set[str]):
+        """take_dirty_groups 로 가져간 이름을 되돌린다 (저장 실패 시 다음 주기에 다시 저장)"""
+        if self.track_changes:
+            self._dirty |= names
+
+    async def restore_group(self, data: dict):
+        """
+        Group.snapshot() 으로 저장한 그룹 복원.
+        로컬 플레이어는 소켓 없이 복원되어 resume_grace 안에 resume_token 으로 다시 붙어야 한다.
+        """
+        group_name = data["group_name"]
+        if group_name in self.groups:
+            return
+
+        players = []
+        for p in data["players"]:
+            if p.get("worker"):
+                player = RemotePlayer(
+                    self.cluster, p["worker"], p["player_id"], p["player_name"], p["binary"], p["sync_ticks"]
+                )
+            else:
+                player = Player(
+                    None, p["player_name"], binary=p["binary"], sync_ticks=p["sync_ticks"], player_id=p["player_id"]
+                )
+                player.resume_token = p["resume_token"]
+                self._tokens[player.resume_token] = player
+                self._suspended[player.player_id] = scheduler.call_later(
+                    self.resume_grace, self._expire_session, player
+                )
+            player.is_host = p["is_host"]
+            players.append(player)
+        if not players:
+            return
+        host = next((p for p in players if p.player_id == data["host"]), players[0])
+
+        group = Group(
+            group_name=group_name,
+            host_player=host,
+            broadcast_callback=self._group_broadcast,
+            change_callback=self._group_changed,
+            event_callback=self._group_event
+        )
+        group.now_turn = data["now_turn"]
+        group.is_active = data["is_active"]
+        self.groups[group_name] = group
+        group.set_players(players)
+        self._arm_idle_check(group)
+        self._host_groups.setdefault(host.player_id, group_name)
+        for player in players:
+            self._index_player(player, group_name)
+
+        # 실행 중이던 타이머는 내려가 있던 시간만큼 지난 것으로 계산
+        timer = data["timer"]
+        remaining = timer["remaining"]
+        if timer["state"] == "running":
+            remaining = timer["deadline"] - time.time()
+        wait = data.get("intermission")
+        await group.timer.restore(
+            timer["initial"], remaining, timer["state"], wait=wait - time.time() if wait is not None else None
+        )
+        log.info("group restored", group=group_name, players=len(players), timer_state=timer["state"])
+
+    async def broadcast_to_group(self, group_name: str, message: Union[str, Frame], kind: Optional[str] = None):
+        """REST/서비스용 브로드캐스트 (broadcast_frame 참고)"""
+        self.broadcast_frame(group_name, message, kind)
+
+    def broadcast_frame(self, group_name: str, message: Union[str, Frame], kind: Optional[str] = None):
+        """
+        동일한 그룹 내 모든 플레이어의 송신 큐에 메시지를 넣고 바로 반환 (락 불필요, 기다리지 않음)
+        메시지는 한 번만 Frame 으로 만들어 모든 플레이어가 같은 객체를 공유한다.
+        타이머 tick 경로에서 스케줄러가 동기로 호출한다.
+        """
+        group = self.groups.get(group_name)
+        if group is None:
+            return
+        started = time.perf_counter()
+        frame = Frame.of(message, kind)
+        players = group.players
+        remote = None
+        for p in players:
+            if p.worker_id is None:
+                p.send(frame)
+            else:
+                # 다른 워커의 플레이어는 워커별로 모아 한 번에 전달
+                if remote is None:
+                    remote = {}
+                remote.setdefault(p.worker_id, []).append(p.player_id)
+        if remote:
+            for worker_id, player_ids in remote.items():
+                self.cluster.deliver(worker_id, player_ids, frame)
+        metrics.BROADCAST_MESSAGES.inc(len(players))
+        metrics.BROADCAST_SECONDS.observe(time.perf_counter() - started)
+
+    async def register_player(self, websocket: WebSocket, player_name: str, binary: bool = False, sync_ticks: bool = False):
         """
         새로운 그룹을 생성하고 호스트 플레이어 등록
+        (새 이름의 그룹을 추가할 뿐이므로 락이 필요 없다)
+        binary=True 이면 tick 메시지를 바이너리 프로토콜로 받고,
+        sync_ticks=True 이면 매초 update_timer 대신 timer_sync 만 받는다.
+        워커당 그룹 수가 max_groups 에 도달하면 503.
         """
-        async with self.lock:
-            host_player = Player(websocket, player_name)
-            host_player.is_host = True
+        if self.max_groups and len(self.groups) >= self.max_groups:
+            metrics.GROUPS_REJECTED.inc()
+            raise HTTPException(status_code=503, detail="그룹 수 제한을 초과했습니다.")
 
-            group_name = f"group-{uuid.uuid4()}"
+        host_player = Player(
+            websocket, player_name, self.send_queue_size, self.overflow_policy,
+            binary=binary, sync_ticks=sync_ticks, player_id=self.cluster.new_id()
+        )
+        host_player.is_host = True
 
-            broadcast_cb = self._make_broadcast_callback()
-            new_group = Group(
-                group_name=group_name,
-                host_player=host_player,
-                broadcast_callback=broadcast_cb,
-                h=0, m=0, s=30   # 기본 30초 타이머 예시
-            )
-            self.groups[group_name] = new_group
+        group_name = f"group-{self.cluster.new_id()}"
+
+        new_group = Group(
+            group_name=group_name,
+            host_player=host_player,
+            broadcast_callback=self._group_broadcast,
+            h=0, m=0, s=30,   # 기본 30초 타이머 예시
+            change_callback=self._group_changed,
+            event_callback=self._group_event
+        )
+        self.groups[group_name] = new_group
+        self._group_listed(group_name, "group_created")
+        if self.recorder is not None:
+            self.recorder(group_name, "group_created", {
+                "host": host_player.to_dict(), "initial": new_group.timer.initial_seconds
+            })
+        self._arm_idle_check(new_group)
+        self._host_groups[host_player.player_id] = group_name
+        self._index_player(host_player, group_name)
+        self._tokens[host_player.resume_token] = host_player
 
-            print(f"[ConnectionManager] New group '{group_name}' created by '{player_name}'")
-            return group_name, host_player
+        log.info("group created", group=group_name, player=player_name, player_id=host_player.player_id)
+        return group_name, host_player
+
+    def get_group(self, group_name: str) -> Group:
+        """이 워커가 소유한 그룹 조회 (없으면 404)"""
+        group = self.groups.get(group_name)
+        if group is None:
+            raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
+        return group
+
+    def get_player(self, player_id: str) -> Optional[Player]:
+        """player_id 로 플레이어 조회 (O(1))"""
+        entry = self._players.get(player_id)
+        return entry[0] if entry else None
+
+    def get_player_group(self, player_id: str) -> Optional[str]:
+        """player_id 로 소속 그룹 이름 조회 (O(1))"""
+        entry = self._players.get(player_id)
+        return entry[1] if entry else None
 
     async def join_group(self, host_player_id: str, guest_player_id: str):
         """
         호스트 그룹을 찾은 뒤, 게스트 플레이어를 그 그룹으로 이동
+        (호스트 그룹은 이 워커 소유여야 한다. 게스트는 다른 워커에 있어도 된다)
         """
-        async with self.lock:
-            host_group_name = None
-            for g_name, grp in self.groups.items():
-                if grp.host_player.player_id == host_player_id:
-                    host_group_name = g_name
-                    break
+        if guest_player_id not in self._players:
+            return await self._join_detached_guest(host_player_id, guest_player_id)
+
+        while True:
+            host_group_name = self._host_groups.get(host_player_id)
             if not host_group_name:
                 raise HTTPException(status_code=404, detail="호스트 그룹을 찾을 수 없습니다.")
 
-            guest_player = None
-            guest_group_name = None
-            for g_name, grp in self.groups.items():
-                for p in grp.players:
-                    if p.player_id == guest_player_id:
-                        guest_player = p
-                        guest_group_name = g_name
-                        break
-                if guest_player:
-                    break
-            if not guest_player:
+            entry = self._players.get(guest_player_id)
+            if not entry:
                 raise HTTPException(status_code=404, detail="게스트 플레이어를 찾을 수 없습니다.")
+            guest_player, guest_group_name = entry
 
-            # 기존 그룹에서 제거
-            if guest_group_name:
+            async with self._lock_groups(host_group_name, guest_group_name):
+                # 락을 기다리는 동안 다른 작업이 그룹을 바꿨다면 다시 찾는다
+                if (self._host_groups.get(host_player_id) != host_group_name
+                        or not self._is_in_group(guest_player, guest_group_name)):
+                    continue
+                host_grp = self.groups[host_group_name]
                 old_grp = self.groups[guest_group_name]
+                if host_grp is not old_grp:
+                    self._check_capacity(host_grp)
+                host_grp.touch()
+
+                # 기존 그룹에서 제거
                 old_grp.remove_player(guest_player_id)
-                print(f"[ConnectionManager] Player '{guest_player_id}' removed from '{guest_group_name}'")
+                log.info("player left group", player_id=guest_player_id, group=guest_group_name)
                 if not old_grp.players:
-                    del self.groups[guest_group_name]
-                    print(f"[ConnectionManager] Group '{guest_group_name}' removed (empty)")
+                    self._drop_group(guest_group_name)
+
+                # 호스트 그룹에 추가
+                guest_player.is_host = False
+                host_grp.add_player(guest_player)
+                self._index_player(guest_player, host_group_name)
+                if guest_player.sync_ticks:
+                    # sync 모드 클라이언트는 다음 재동기화까지 기다리지 않도록 현재 상태를 바로 보낸다
+                    guest_player.send(host_grp.timer_sync_frame())
+                log.info("player joined group", player_id=guest_player_id, group=host_group_name)
 
-            # 호스트 그룹에 추가
+                return host_group_name, guest_player
+
+    async def _join_detached_guest(self, host_player_id: str, guest_player_id: str):
+        """이 워커의 그룹에 속하지 않은 게스트(다른 워커 그룹 소속 또는 다른 워커 소켓)를 합류"""
+        host_group_name = self._host_groups.get(host_player_id)
+        if not host_group_name:
+            raise HTTPException(status_code=404, detail="호스트 그룹을 찾을 수 없습니다.")
+        self._check_capacity(self.groups[host_group_name])
+
+        if guest_player_id in self._away:
+            # 로컬 소켓이지만 다른 워커의 그룹에 있던 플레이어
+            # (합류가 끝날 때까지 _away 에 남겨 두어 그 사이 연결이 끊겨도 정리되게 한다)
+            guest_player, old_group_name = self._away[guest_player_id]
+            await self._leave_remote_group(guest_player_id, old_group_name)
+        elif not self.cluster.is_local(guest_player_id):
+            # 소켓이 있는 워커에서 기존 그룹을 떠나게 한 뒤 대리 객체로 합류
+            worker_id = self.cluster.owner_of(guest_player_id)
+            info = await self.cluster.call(
+                worker_id, "detach_player", player_id=guest_player_id, group_name=host_group_name
+            )
+            guest_player = RemotePlayer(self.cluster, worker_id, **info)
+        else:
+            raise HTTPException(status_code=404, detail="게스트 플레이어를 찾을 수 없습니다.")
+
+        async with self._lock_groups(host_group_name):
+            host_grp = self.groups.get(host_group_name)
+            if host_grp is None or (guest_player.outbox is not None and guest_player.outbox.closed):
+                raise HTTPException(status_code=404, detail="호스트 그룹을 찾을 수 없습니다.")
+            self._check_capacity(host_grp)
+            host_grp.touch()
+            self._away.pop(guest_player_id, None)
             guest_player.is_host = False
-            host_grp = self.groups[host_group_name]
             host_grp.add_player(guest_player)
-            print(f"[ConnectionManager] Player '{guest_player_id}' joined '{host_group_name}'")
-
+            self._index_player(guest_player, host_group_name)
+            if guest_player.sync_ticks:
+                guest_player.send(host_grp.timer_sync_frame())
+            log.info("player joined group", player_id=guest_player_id, group=host_group_name)
             return host_group_name, guest_player
 
+    async def _leave_remote_group(self, player_id: str, group_name: str):
+        """다른 워커가 소유한 그룹에서 플레이어 제거 요청 (실패해도 진행)"""
+        try:
+            await self.cluster.call(
+                self.cluster.owner_of(group_name), "remove_member", player_id=player_id, group_name=group_name
+            )
+        except HTTPException as e:
+            log.warning("remote leave failed", player_id=player_id, group=group_name, detail=e.detail)
+
+    async def _rpc_detach_player(self, player_id: str, group_name: str) -> dict:
+        """
+        (소켓이 있는 워커에서 실행) 플레이어를 현재 그룹에서 빼고, 다른 워커의
+        group_name 에 합류한 것으로 기록한 뒤 대리 객체를 만들 정보를 돌려준다.
+        """
+        while True:
+            entry = self._players.get(player_id)
+            if entry is None:
+                break
+            player, old_group_name = entry
+            async with self._lock_groups(old_group_name):
+                if not self._is_in_group(player, old_group_name):
+                    continue
+                old_grp = self.groups[old_group_name]
+                old_grp.remove_player(player_id)
+                del self._players[player_id]
+                self._away[player_id] = (player, group_name)
+                log.info("player left group", player_id=player_id, group=old_group_name)
+                if not old_grp.players:
+                    self._drop_group(old_group_name)
+                break
+
+        if entry is None:
+            away = self._away.get(player_id)
+            if away is None:
+                raise HTTPException(status_code=404, detail="게스트 플레이어를 찾을 수 없습니다.")
+            player, old_group_name = away
+            self._away[player_id] = (player, group_name)
+            if old_group_name != group_name:
+                await self._leave_remote_group(player_id, old_group_name)
+
+        return {
+            "player_id": player.player_id,
+            "player_name": player.player_name,
+            "binary": player.binary,
+            "sync_ticks": player.sync_ticks
+        }
+
+    async def _rpc_remove_member(self, player_id: str, group_name: str):
+        """(그룹 소유 워커에서 실행) 다른 워커로 떠났거나 연결이 끊긴 멤버 제거"""
+        async with self._lock_groups(group_name):
+            entry = self._players.get(player_id)
+            if entry is None or entry[1] != group_name:
+                return
+            grp = self.groups[group_name]
+            grp.remove_player(player_id)
+            self._unindex_player(entry[0])
+            log.info("player left group", player_id=player_id, group=group_name)
+            if not grp.players:
+                self._drop_group(group_name)
+
+    def _deliver(self, player_ids: List[str], frame: Frame):
+        """다른 워커의 그룹에서 온 프레임을 로컬 소켓 플레이어에게 전달"""
+        for player_id in player_ids:
+            entry = self._away.get(player_id)
+            if entry is not None:
+                entry[0].send(frame)
+
     async def reorder_group(self, group_name: str, new_order: List[str]) -> None:
         """그룹 플레이어 순서를 new_order 순으로 재정렬"""
-        async with self.lock:
+        async with self._lock_groups(group_name):
             if group_name not in self.groups:
                 raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
 
@@ -112,72 +571,228 @@ class ConnectionManager:
                     raise HTTPException(status_code=400, detail=f"잘못된 플레이어 ID: {pid}")
                 reordered.append(player_dict[pid])
 
-            group.players = reordered
-            print(f"[ConnectionManager] Group '{group_name}' reorder -> {[p.player_name for p in reordered]}")
+            group.set_players(reordered)
+            group.touch()
+            self._on_group_event(group_name, "reordered", {"order": [p.player_id for p in reordered]})
+            log.info("group reordered", group=group_name, order=[p.player_name for p in reordered])
 
     async def remove_connection_from_group(self, websocket: WebSocket) -> Optional[str]:
-        """WebSocket이 끊긴 플레이어를 소속 그룹에서 제거"""
-        async with self.lock:
-            for g_name, grp in list(self.groups.items()):
-                for p in grp.players:
-                    if p.websocket == websocket:
-                        grp.remove_player(p.player_id)
-                        print(f"[ConnectionManager] Player '{p.player_id}' removed from '{g_name}'")
-                        if not grp.players:
-                            del self.groups[g_name]
-                            print(f"[ConnectionManager] Group '{g_name}' removed (empty)")
-                        return g_name
+        """
+        WebSocket이 끊긴 플레이어 처리.
+        resume_grace 동안은 소켓만 떼어 내고 그룹 내 자리(와 그룹, 타이머)를 유지한다.
+        그 안에 resume_token 으로 다시 붙지 않으면 그룹에서 제거한다.
+        """
+        player = self._sockets.get(websocket)
+        if not player:
             return None
+        if self.resume_grace <= 0:
+            return await self._remove_player(player)
 
-    def get_all_player(self):
-        """모든 플레이어 조회"""
-        players = []
-        for grp in self.groups.values():
-            players.extend(grp.players)
-        return players
+        del self._sockets[websocket]
+        player.detach()
+        self._suspended[player.player_id] = scheduler.call_later(self.resume_grace, self._expire_session, player)
+        g_name = self._group_of(player.player_id)
+        if g_name in self.groups:
+            self._mark_dirty(g_name)
+        log.info("player suspended", player_id=player.player_id, group=g_name, grace=self.resume_grace)
+        return g_name
+
+    async def resume_player(self, websocket: WebSocket, resume_token: str, binary: bool = False) -> Optional[Tuple[str, Player]]:
+        """
+        resume_token 의 플레이어에 새 소켓을 붙인다 (토큰이 없거나 만료됐으면 None).
+        이전 소켓이 아직 살아 있으면 끊고 새 소켓으로 교체한다.
+        """
+        player = self._tokens.pop(resume_token, None)
+        if player is None:
+            return None
+        g_name = self._group_of(player.player_id)
+        if g_name is None:
+            return None
+
+        handle = self._suspended.pop(player.player_id, None)
+        if handle is not None:
+            handle.cancel()
+        if player.websocket is not None:
+            old = player.websocket
+            self._sockets.pop(old, None)
+            scheduler.spawn(self._close_socket(old))
+
+        player.attach(websocket, self.send_queue_size, self.overflow_policy, binary)
+        group = self.groups.get(g_name)
+        if group is not None:
+            player.set_streaming(group.streaming)
+            # 새로 발급한 resume_token 이 다음 스냅샷에 들어가도록
+            self._mark_dirty(g_name)
+        self._tokens[player.resume_token] = player
+        self._sockets[websocket] = player
+        log.info("player resumed", player_id=player.player_id, group=g_name)
+        return g_name, player
+
+    async def group_snapshot(self, group_name: str) -> dict:
+        """재접속한 클라이언트에게 보낼 그룹 상태 (다른 워커 소유면 소유 워커에서 조회)"""
+        group = self.groups.get(group_name)
+        if group is not None:
+            return group.to_dict()
+        return await self.cluster.call(self.cluster.owner_of(group_name), "get_group", group_name=group_name)
+
+    def _group_of(self, player_id: str) -> Optional[str]:
+        """로컬 소켓 플레이어의 소속 그룹 (다른 워커 소유 그룹 포함)"""
+        entry = self._players.get(player_id) or self._away.get(player_id)
+        return entry[1] if entry else None
+
+    def current_group(self, player_id: str) -> Optional[str]:
+        """소켓 명령의 대상 그룹: 이 워커에 연결된 플레이어의 현재 그룹 (다른 워커 소유 그룹 포함)"""
+        return self._group_of(player_id)
+
+    def _expire_session(self, player: Player):
+        """재접속 유예 시간 만료"""
+        self._suspended.pop(player.player_id, None)
+        self._tokens.pop(player.resume_token, None)
+        scheduler.spawn(self._remove_player(player))
+
+    @staticmethod
+    async def _close_socket(websocket: WebSocket):
+        try:
+            await websocket.close(code=1000)
+        except Exception:
+            pass
+
+    async def _remove_player(self, player: Player) -> Optional[str]:
+        """로컬 소켓 플레이어를 소속 그룹에서 제거"""
+        self._tokens.pop(player.resume_token, None)
+        handle = self._suspended.pop(player.player_id, None)
+        if handle is not None:
+            handle.cancel()
+        player.close()
+
+        away = self._away.pop(player.player_id, None)
+        if away is not None:
+            # 다른 워커가 소유한 그룹의 멤버였다
+            if player.websocket is not None:
+                self._sockets.pop(player.websocket, None)
+            await self._leave_remote_group(player.player_id, away[1])
+            log.info("player disconnected", player_id=player.player_id, group=away[1])
+            return away[1]
+
+        while True:
+            entry = self._players.get(player.player_id)
+            if entry is None or entry[0] is not player:
+                return None
+            g_name = entry[1]
+
+            async with self._lock_groups(g_name):
+                if not self._is_in_group(player, g_name):
+                    continue
+                grp = self.groups[g_name]
+                grp.remove_player(player.player_id)
+                self._unindex_player(player)
+                log.info("player disconnected", player_id=player.player_id, group=g_name)
+                if not grp.players:
+                    self._drop_group(g_name)
+                return g_name
+
+    def get_all_player(self) -> Iterator[Player]:
+        """모든 플레이어 조회 (색인을 그대로 순회하며 목록을 새로 만들지 않는다)"""
+        return (p for p, _ in self._players.values())
 
     def get_players_in_group(self, group_name: str):
-        if group_name in self.groups:
-            return [p.to_dict() for p in self.groups[group_name].players]
+        group = self.groups.get(group_name)
+        if group is not None:
+            return group.player_dicts()
         return []
 
+    def list_group_names(
+        self,
+        active: Optional[bool] = None,
+        min_players: Optional[int] = None,
+        max_players: Optional[int] = None
+    ) -> List[str]:
+        """
+        조건에 맞는 이 워커의 그룹 이름 (생성 순서, 캐시 공유이므로 수정 금지).
+        목록에 영향을 주는 변경이 없으면 다시 만들지 않는다.
+        """
+        key = (active, min_players, max_players)
+        cached = self._listings.get(key)
+        if cached is not None and cached[0] == self._listing_version:
+            return cached[1]
+
+        if key == (None, None, None):
+            names = list(self.groups)
+        else:
+            names = [
+                name for name, group in self.groups.items()
+                if (active is None or group.is_active == active)
+                and (min_players is None or len(group.players) >= min_players)
+                and (max_players is None or len(group.players) <= max_players)
+            ]
+        if len(self._listings) >= LISTING_CACHE_SIZE:
+            self._listings.clear()
+        self._listings[key] = (self._listing_version, names)
+        return names
+
     # --- 비동기로 그룹의 메서드를 호출 ---
 
-    async def start_game(self, group_name: str):
+    async def start_game(self, group_name: str, at: Optional[float] = None):
         if group_name not in self.groups:
             raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
         group = self.groups[group_name]
-        await group.start_game()
-        print(f"[ConnectionManager] start_game -> '{group_name}'")
+        group.touch()
+        await group.start_game(at)
+        log.info("start_game", group=group_name)
         return group
 
     async def stop_game(self, group_name: str):
         if group_name not in self.groups:
             raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
         group = self.groups[group_name]
+        group.touch()
         await group.stop_game()
-        print(f"[ConnectionManager] stop_game -> '{group_name}'")
+        log.info("stop_game", group=group_name)
 
     async def pause_game(self, group_name: str):
         if group_name not in self.groups:
             raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
         group = self.groups[group_name]
+        group.touch()
         await group.pause_game()
-        print(f"[ConnectionManager] pause_game -> '{group_name}'")
+        log.info("pause_game", group=group_name)
 
     async def resume_game(self, group_name: str):
         if group_name not in self.groups:
             raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
         group = self.groups[group_name]
+        group.touch()
         await group.resume_game()
-        print(f"[ConnectionManager] resume_game -> '{group_name}'")
+        log.info("resume_game", group=group_name)
 
     async def turn_over(self, group_name: str):
         if group_name not in self.groups:
             raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
         group = self.groups[group_name]
+        group.touch()
         await group.turn_over()
-        print(f"[ConnectionManager] turn_over -> '{group_name}'")
+        log.info("turn_over", group=group_name)
         return group
 
 manager = ConnectionManager()  # 싱글턴 인스턴스
+
+
+def _register_gauges(mgr: ConnectionManager):
+    """집계 게이지는 scrape 시점에만 계산한다"""
+    metrics.registry.gauge("timer_active_groups", "Groups currently registered", lambda: len(mgr.groups))
+    metrics.registry.gauge("timer_active_players", "Players currently registered", lambda: len(mgr._players))
+    metrics.registry.gauge(
+        "timer_running_timers", "Group timers currently running",
+        lambda: sum(1 for g in mgr.groups.values() if g.timer.running)
+    )
+    metrics.registry.gauge(
+        "timer_send_queue_depth", "Frames waiting in all player send queues",
+        lambda: sum(len(p.outbox) for p, _ in mgr._players.values() if p.outbox is not None)
+    )
+    metrics.registry.gauge(
+        "timer_send_queue_depth_max", "Deepest single player send queue",
+        lambda: max((len(p.outbox) for p, _ in mgr._players.values() if p.outbox is not None), default=0)
+    )
+
+
+_register_gauges(manager)
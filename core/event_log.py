@@ -0,0 +1,244 @@
+# your_project/core/event_log.py
+#
+# 그룹별 이벤트 로그 (게임 기록 조회와 특정 시점 상태 재구성용).
+#
+# 그룹마다 <dir>/<group_name>.jsonl 에 JSON 한 줄짜리 레코드를 덧붙이기만 한다.
+#   {"seq":1,"ts":1700000000.123,"event":"group_created","host":{...},"initial":30}
+#   {"seq":2,"ts":...,"event":"player_joined","player":{...}}
+#   ... reordered / time_set / game_started / game_paused / game_resumed / turn_changed / player_left / game_stopped
+#   {"seq":n,"ts":...,"event":"group_closed"}
+# seq 는 그룹마다 1부터 1씩 증가한다.
+#
+# 이벤트는 메모리에 모았다가 flush 주기(또는 쌓인 수가 EVENT_LOG_BATCH 를 넘을 때)마다 스레드에서 한 번에 쓴다.
+# 이벤트 루프는 파일 I/O 를 기다리지 않고, 종료 시 남은 이벤트를 마지막으로 쓴다 (fsync 는 하지 않는다).
+# 읽기(iter_events, replay)는 파일을 한 줄씩 읽는 지연 이터레이터라 기록이 길어도 메모리에 전부 올리지 않는다.
+# 클러스터에서는 그룹을 소유한 워커만 그 그룹의 파일에 쓰므로 같은 디렉터리를 공유해도 된다.
+#
+#   TIMER_EVENT_LOG_DIR=/var/lib/timer/events   (비어 있으면 비활성)
+#   TIMER_EVENT_LOG_FLUSH_INTERVAL=1             쓰기 주기 (초)
+
+import asyncio
+import json
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from core import config
+from core.connection_manager import ConnectionManager, manager as default_manager
+from core.log import get_logger
+from core.scheduler import ScheduledCall, scheduler
+
+log = get_logger("event_log")
+
+# 파일 끝에서 마지막 seq 를 찾을 때 읽는 크기
+_TAIL_BYTES = 4096
+
+
+def _dumps(record: dict) -> str:
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+
+class EventLog:
+    def __init__(self, manager: ConnectionManager, directory: str, interval: Optional[float] = None):
+        self.manager = manager
+        self.manager.recorder = self.record  # 이때부터 그룹 이벤트를 넘겨받는다
+        self.directory = directory
+        self.interval = interval or config.EVENT_LOG_FLUSH_INTERVAL
+        os.makedirs(directory, exist_ok=True)
+
+        # 아직 쓰지 않은 이벤트: group_name -> [(ts, event, fields)]
+        self._pending: Dict[str, List[Tuple[float, str, dict]]] = {}
+        self._pending_count = 0
+        # 그룹별 마지막 seq (쓰기 스레드에서만 사용, 처음 쓰는 그룹은 파일 끝에서 읽는다)
+        self._seq: Dict[str, int] = {}
+
+        self._lock = asyncio.Lock()
+        self._handle: Optional[ScheduledCall] = None
+        self._closed = False
+
+    @classmethod
+    def from_env(cls, manager: ConnectionManager) -> Optional["EventLog"]:
+        if not config.EVENT_LOG_DIR:
+            return None
+        return cls(manager, config.EVENT_LOG_DIR)
+
+    def path(self, group_name: str) -> str:
+        """그룹 로그 파일 경로 (그룹 이름이 파일 이름으로 쓸 수 없으면 404)"""
+        if not group_name or group_name.startswith(".") or os.path.basename(group_name) != group_name:
+            raise HTTPException(status_code=404, detail="그룹 기록을 찾을 수 없습니다.")
+        return os.path.join(self.directory, f"{group_name}.jsonl")
+
+    # --- 기록 ---
+
+    def record(self, group_name: str, event: str, fields: dict):
+        """이벤트를 쓰기 대기열에 넣는다 (I/O 없음)"""
+        if self._closed:
+            return
+        self._pending.setdefault(group_name, []).append((time.time(), event, fields))
+        self._pending_count += 1
+        if self._pending_count == config.EVENT_LOG_BATCH:
+            self._schedule(0)
+        elif self._handle is None:
+            self._schedule(self.interval)
+
+    def _schedule(self, delay: float):
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = scheduler.call_later(delay, self._on_interval)
+
+    def _on_interval(self):
+        self._handle = None
+        scheduler.spawn(self._periodic())
+
+    async def _periodic(self):
+        try:
+            await self.flush()
+        except Exception:
+            log.exception("event log write failed", directory=self.directory)
+
+    async def flush(self):
+        """쌓인 이벤트를 그룹 파일마다 한 번의 쓰기로 덧붙인다"""
+        async with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            self._pending_count = 0
+            await asyncio.to_thread(self._write, pending)
+
+    async def stop(self):
+        """주기적 쓰기를 멈추고 남은 이벤트를 쓴다"""
+        self._closed = True
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        await self.flush()
+
+    # --- 읽기 ---
+
+    def iter_events(self, group_name: str, since: int = 0, until: Optional[int] = None) -> Iterator[dict]:
+        """seq 가 since 초과 until 이하인 레코드를 파일에서 한 줄씩 읽는다 (아직 쓰지 않은 이벤트는 제외)"""
+        path = self.path(group_name)
+        if not os.path.exists(path):
+            raise HTTPException(status_code=404, detail="그룹 기록을 찾을 수 없습니다.")
+        return _read(path, since, until)
+
+    def replay(self, group_name: str, seq: Optional[int] = None) -> dict:
+        """seq 시점의 그룹 상태 (None 이면 기록된 마지막 상태)"""
+        state = replay(self.iter_events(group_name, until=seq))
+        state["group_name"] = group_name
+        return state
+
+    # --- 파일 I/O (스레드에서 실행) ---
+
+    def _write(self, pending: Dict[str, List[Tuple[float, str, dict]]]):
+        for group_name, events in pending.items():
+            try:
+                path = self.path(group_name)
+            except HTTPException:
+                continue
+            seq = self._seq.get(group_name)
+            torn = False
+            if seq is None:
+                seq, torn = _tail(path)
+            lines = []
+            for ts, event, fields in events:
+                seq += 1
+                lines.append(_dumps({"seq": seq, "ts": round(ts, 3), "event": event, **fields}))
+            with open(path, "a", encoding="utf-8") as f:
+                if torn:
+                    f.write("\n")
+                f.write("\n".join(lines) + "\n")
+            if events[-1][1] == "group_closed":
+                self._seq.pop(group_name, None)
+            else:
+                self._seq[group_name] = seq
+
+
+def _tail(path: str) -> Tuple[int, bool]:
+    """파일의 마지막 seq 와 마지막 줄이 잘려 있는지 (파일이 없으면 0)"""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return 0, False
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return 0, False
+        f.seek(max(0, size - _TAIL_BYTES))
+        chunk = f.read()
+    torn = not chunk.endswith(b"\n")
+    for line in reversed(chunk.splitlines()):
+        try:
+            return json.loads(line)["seq"], torn
+        except (ValueError, KeyError, TypeError):
+            continue  # 잘린 줄
+    return 0, torn
+
+
+def _read(path: str, since: int, until: Optional[int]) -> Iterator[dict]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # 쓰는 도중 종료되어 잘린 줄
+            seq = record["seq"]
+            if seq <= since:
+                continue
+            if until is not None and seq > until:
+                return
+            yield record
+
+
+def replay(records: Iterator[dict]) -> dict:
+    """레코드를 차례로 적용해 그룹 상태를 재구성 (Group.to_dict 와 같은 필드 + seq/ts)"""
+    state = {
+        "group_name": None, "seq": 0, "ts": None, "host_player": None, "players": [],
+        "now_turn": 0, "is_active": False, "timer_state": "stopped", "initial_time": 0,
+        "remaining_ms": 0, "closed": False
+    }
+    for record in records:
+        apply_event(state, record)
+    return state
+
+
+def apply_event(state: dict, record: dict):
+    """레코드 하나를 state 에 적용 (remaining_ms 는 마지막 전이 시점의 값)"""
+    event = record["event"]
+    state["seq"] = record["seq"]
+    state["ts"] = record["ts"]
+    if event == "group_created":
+        state["host_player"] = record["host"]
+        state["players"] = [record["host"]]
+        state["initial_time"] = record["initial"]
+        state["remaining_ms"] = record["initial"] * 1000
+    elif event == "player_joined":
+        state["players"].append(record["player"])
+    elif event == "player_left":
+        state["players"] = [p for p in state["players"] if p["player_id"] != record["player_id"]]
+    elif event == "reordered":
+        by_id = {p["player_id"]: p for p in state["players"]}
+        state["players"] = [by_id[pid] for pid in record["order"] if pid in by_id]
+    elif event == "time_set":
+        state["initial_time"] = record["initial"]
+        state["remaining_ms"] = record["initial"] * 1000
+    elif event == "game_started" or event == "turn_changed":
+        state["is_active"] = True
+        state["now_turn"] = record["now_turn"]
+        state["timer_state"] = "running"
+        state["remaining_ms"] = state["initial_time"] * 1000
+    elif event == "game_paused" or event == "game_resumed":
+        state["timer_state"] = "paused" if event == "game_paused" else "running"
+        state["remaining_ms"] = record["remaining_ms"]
+    elif event == "game_stopped":
+        state["is_active"] = False
+        state["now_turn"] = 0
+        state["timer_state"] = "stopped"
+    elif event == "group_closed":
+        state["closed"] = True
+        state["timer_state"] = "stopped"
+
+
+event_log = EventLog.from_env(default_manager)  # 싱글턴 인스턴스 (비활성이면 None)
@@ -0,0 +1,271 @@
+# your_project/core/feed.py
+#
+# 변경 피드 (REST 폴링 대신 /ws/feed 소켓으로 로비 또는 그룹을 구독).
+#
+#   채널 "lobby"       : group_created / group_updated (group 요약: 인원, 진행 여부, 타이머 상태가 바뀔 때) / group_removed (group_name)
+#   채널 <group_name>  : player_joined / player_left / reordered / time_set / game_started / game_stopped /
+#                        game_paused / game_resumed / turn_changed / group_closed
+#
+#   이벤트 {"action": "feed", "channel": ..., "seq": n, "event": ..., ...}
+#   seq 는 채널마다 1씩 증가한다. 클러스터에서는 채널을 발행한 워커마다 따로 증가하며 "worker" 필드가 붙는다
+#   (그룹 채널은 소유 워커 하나, 로비는 모든 워커가 자기 그룹의 이벤트를 발행).
+#   구독 응답의 seq 이하 이벤트는 이미 스냅샷에 반영된 것이고, 번호가 건너뛰면 놓친 이벤트가 있는 것이므로
+#   다시 구독하거나 REST 로 조회한다 (느린 구독자의 송신 큐가 가득 차면 이벤트가 합쳐진다).
+#
+# 이벤트는 채널을 소유한 워커가 발행하고, 구독자가 없는 채널은 seq 도 두지 않고 바로 건너뛴다.
+# 다른 워커의 구독자에게는 그 워커가 관심을 등록(feed_watch)한 채널만 워커당 메시지 1건으로 전달된다.
+
+import asyncio
+from typing import Callable, Dict, List, Optional, Set
+
+from fastapi import HTTPException, WebSocket
+
+from core import config
+from core.cluster import Cluster, cluster as default_cluster
+from core.log import get_logger
+from core.protocol import Frame, json_frame
+from core.scheduler import scheduler
+from core.send_queue import OverflowPolicy, SendQueue
+
+log = get_logger("feed")
+
+LOBBY = "lobby"
+FEED_KIND = "feed"
+FEED_CLOSE_KIND = "feed_close"  # 채널의 마지막 이벤트 (group_closed)
+
+
+class Watcher:
+    """피드 구독 소켓 (플레이어가 아니므로 그룹에 속하지 않는다)"""
+
+    __slots__ = ("websocket", "outbox", "channels", "_held")
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.outbox = SendQueue(websocket, config.FEED_QUEUE_SIZE, OverflowPolicy.COALESCE)
+        self.channels: Set[str] = set()
+        # 구독 응답을 보내기 전에 도착한 채널별 이벤트 (응답 뒤에 보낸다)
+        self._held: Optional[Dict[str, List[Frame]]] = None
+
+    def send(self, frame: Frame) -> bool:
+        return self.outbox.put(frame)
+
+    def deliver(self, channel: str, frame: Frame):
+        held = self._held
+        if held is not None and channel in held:
+            held[channel].append(frame)
+            return
+        self.outbox.put(frame)
+
+    def hold(self, channel: str):
+        if self._held is None:
+            self._held = {}
+        self._held[channel] = []
+
+    def release(self, channel: str, flush: bool = True):
+        if self._held is None:
+            return
+        frames = self._held.pop(channel, [])
+        if not self._held:
+            self._held = None
+        if flush:
+            for frame in frames:
+                self.outbox.put(frame)
+
+    def close(self):
+        self.outbox.close()
+
+
+class Feed:
+    def __init__(self, cluster: Cluster):
+        self.cluster = cluster
+
+        # channel -> 이 워커의 구독자
+        self._local: Dict[str, Set[Watcher]] = {}
+        # channel -> 구독자가 있는 다른 워커 (이 워커가 발행하는 채널만)
+        self._remote: Dict[str, Set[str]] = {}
+        # 이 워커가 발행하는 채널 중 구독자가 있는 채널의 마지막 seq
+        self._seq: Dict[str, int] = {}
+
+        # 그룹 채널 구독 시 보낼 스냅샷 (manager 가 등록, 그룹이 없으면 None)
+        self._snapshot: Optional[Callable[[str], Optional[dict]]] = None
+
+        cluster.register("feed_watch", self._rpc_watch)
+        cluster.register("feed_unwatch", self._rpc_unwatch)
+        cluster.on_feed(self._on_remote)
+
+    def on_snapshot(self, handler: Callable[[str], Optional[dict]]):
+        self._snapshot = handler
+
+    def watched(self, channel: str) -> bool:
+        """이 워커가 발행하는 channel 에 구독자가 있는지 (이벤트 내용을 만들기 전에 확인용)"""
+        return channel in self._seq
+
+    def _owned(self, channel: str) -> bool:
+        return channel == LOBBY or self.cluster.is_local(channel)
+
+    # --- 발행 ---
+
+    def publish(self, channel: str, event: str, **fields):
+        """channel 에 이벤트 발행 (한 번 인코딩해 모든 구독자가 공유)"""
+        seq = self._seq.get(channel)
+        if seq is None:
+            return
+        seq += 1
+        self._seq[channel] = seq
+
+        payload = {"action": "feed", "channel": channel, "seq": seq, "event": event, **fields}
+        if self.cluster.enabled:
+            payload["worker"] = self.cluster.worker_id
+        frame = json_frame(payload, FEED_CLOSE_KIND if event == "group_closed" else FEED_KIND)
+
+        for watcher in self._local.get(channel, ()):
+            watcher.deliver(channel, frame)
+        for worker_id in self._remote.get(channel, ()):
+            self.cluster.publish(worker_id, channel, frame)
+
+    def close_channel(self, channel: str):
+        """그룹 삭제 후 채널 정리 (group_closed 발행 뒤 호출)"""
+        self._seq.pop(channel, None)
+        self._remote.pop(channel, None)
+        for watcher in self._local.pop(channel, ()):
+            watcher.channels.discard(channel)
+
+    def _on_remote(self, channel: str, frame: Frame):
+        """다른 워커가 발행한 이벤트를 이 워커의 구독자에게 전달"""
+        for watcher in self._local.get(channel, ()):
+            watcher.deliver(channel, frame)
+        if frame.kind == FEED_CLOSE_KIND:
+            for watcher in self._local.pop(channel, ()):
+                watcher.channels.discard(channel)
+
+    # --- 구독 ---
+
+    async def subscribe(self, watcher: Watcher, channel: str):
+        """
+        구독 등록 후 시작 상태(seq, 그룹 스냅샷)를 응답으로 보낸다.
+        응답 전에 도착한 이벤트는 응답 뒤로 미뤄 순서를 지킨다.
+        """
+        if channel in watcher.channels:
+            raise HTTPException(status_code=409, detail="이미 구독 중인 채널입니다.")
+        if len(watcher.channels) >= config.FEED_MAX_SUBSCRIPTIONS:
+            raise HTTPException(status_code=429, detail="구독 채널 수 제한을 초과했습니다.")
+
+        reply = {"status": "success", "action": "subscribe", "channel": channel}
+        if channel != LOBBY and self.cluster.is_local(channel):
+            # 로컬 그룹: 스냅샷과 seq 를 같은 루프 턴에서 잡는다
+            snapshot = self._snapshot(channel) if self._snapshot else None
+            if snapshot is None:
+                raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
+            self._add_local(watcher, channel)
+            reply.update(seq=self._seq[channel], group=snapshot)
+            watcher.send(json_frame(reply))
+            return
+
+        watcher.hold(channel)
+        self._add_local(watcher, channel)
+        try:
+            if channel == LOBBY:
+                reply["seq"] = self._seq[LOBBY]
+                if self.cluster.enabled:
+                    reply["seqs"] = await self._watch_lobby()
+            else:
+                result = await self.cluster.call(
+                    self.cluster.owner_of(channel), "feed_watch", channel=channel, worker=self.cluster.worker_id
+                )
+                reply.update(result)
+        except HTTPException:
+            watcher.release(channel, flush=False)
+            self._remove_local(watcher, channel)
+            raise
+        watcher.send(json_frame(reply))
+        watcher.release(channel)
+
+    async def _watch_lobby(self) -> Dict[str, int]:
+        """다른 모든 워커에 로비 관심 등록, 워커별 현재 seq 반환 (응답 없는 워커는 제외)"""
+        seqs = {self.cluster.worker_id: self._seq[LOBBY]}
+        others = [w for w in await self.cluster.workers() if w != self.cluster.worker_id]
+        results = await asyncio.gather(
+            *(self.cluster.call(w, "feed_watch", channel=LOBBY, worker=self.cluster.worker_id) for w in others),
+            return_exceptions=True
+        )
+        for worker_id, result in zip(others, results):
+            if isinstance(result, HTTPException):
+                log.warning("lobby watch failed", worker=worker_id, detail=result.detail)
+            elif isinstance(result, dict):
+                seqs[worker_id] = result["seq"]
+        return seqs
+
+    def unsubscribe(self, watcher: Watcher, channel: str):
+        if channel in watcher.channels:
+            watcher.release(channel, flush=False)
+            self._remove_local(watcher, channel)
+
+    def drop(self, watcher: Watcher):
+        """구독 소켓 종료"""
+        for channel in list(watcher.channels):
+            self._remove_local(watcher, channel)
+        watcher.close()
+
+    def _add_local(self, watcher: Watcher, channel: str):
+        self._local.setdefault(channel, set()).add(watcher)
+        watcher.channels.add(channel)
+        if self._owned(channel):
+            self._seq.setdefault(channel, 0)
+
+    def _remove_local(self, watcher: Watcher, channel: str):
+        watcher.channels.discard(channel)
+        watchers = self._local.get(channel)
+        if watchers is None:
+            return
+        watchers.discard(watcher)
+        if watchers:
+            return
+        del self._local[channel]
+
+        # 이 워커의 마지막 구독자: 다른 워커에 등록한 관심 해제
+        if self.cluster.enabled:
+            if channel == LOBBY:
+                scheduler.spawn(self._unwatch_all(channel))
+            elif not self.cluster.is_local(channel):
+                scheduler.spawn(self._unwatch(self.cluster.owner_of(channel), channel))
+        self._forget(channel)
+
+    def _forget(self, channel: str):
+        if not self._local.get(channel) and not self._remote.get(channel):
+            self._seq.pop(channel, None)
+            self._remote.pop(channel, None)
+
+    async def _unwatch(self, worker_id: str, channel: str):
+        try:
+            await self.cluster.call(worker_id, "feed_unwatch", channel=channel, worker=self.cluster.worker_id)
+        except HTTPException:
+            pass
+
+    async def _unwatch_all(self, channel: str):
+        for worker_id in await self.cluster.workers():
+            if worker_id != self.cluster.worker_id:
+                await self._unwatch(worker_id, channel)
+
+    # --- 다른 워커의 관심 등록 ---
+
+    async def _rpc_watch(self, channel: str, worker: str) -> dict:
+        result = {}
+        if channel != LOBBY:
+            snapshot = self._snapshot(channel) if self._snapshot else None
+            if snapshot is None:
+                raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
+            result["group"] = snapshot
+        self._remote.setdefault(channel, set()).add(worker)
+        result["seq"] = self._seq.setdefault(channel, 0)
+        return result
+
+    async def _rpc_unwatch(self, channel: str, worker: str):
+        workers = self._remote.get(channel)
+        if workers is not None:
+            workers.discard(worker)
+            if not workers:
+                del self._remote[channel]
+        self._forget(channel)
+
+
+feed = Feed(default_cluster)  # 싱글턴 인스턴스
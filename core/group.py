@@ -1,20 +1,32 @@
 # your_project/core/group.py
 
-import json
-import asyncio
-from typing import List, Callable
+import time
+from typing import Callable, List, Optional
 from core.player import Player
-from core.async_timer import AsyncTimer
+from core.async_timer import AsyncTimer, TimerState
+from core.scheduler import scheduler
+from core import config, protocol
+from core.log import get_logger
+
+log = get_logger("group")
 
 class Group:
+    __slots__ = (
+        "group_name", "players", "host_player", "now_turn", "is_active",
+        "broadcast_callback", "change_callback", "event_callback", "last_activity",
+        "_sync_pending", "_last_sync", "_streaming", "_view", "_listed", "timer"
+    )
+
     def __init__(
         self,
         group_name: str,
         host_player: Player,
-        broadcast_callback: Callable[[str, str], asyncio.Future],
+        broadcast_callback: Callable[[str, protocol.Frame], None],
         h=0,
         m=0,
-        s=0
+        s=0,
+        change_callback: Optional[Callable[[str, bool, bool], None]] = None,
+        event_callback: Optional[Callable[[str, str, dict], None]] = None
     ):
         self.group_name = group_name
         self.players: List[Player] = [host_player]
@@ -24,51 +36,162 @@ class Group:
 
         # 메시지 전송을 위한 콜백 함수 (manager에서 주입)
         self.broadcast_callback = broadcast_callback
+        # 상태가 바뀌었음을 알리는 콜백 (manager에서 주입).
+        # 두 번째 인자는 목록 조회 조건(인원, 진행 여부)이 바뀌었는지, 세 번째는 목록 요약(summary)이 바뀌었는지
+        self.change_callback = change_callback
+        # 변경 피드 이벤트 콜백 (manager에서 주입, core.feed 참고)
+        self.event_callback = event_callback
+
+        # to_dict() 의 변하지 않는 부분 캐시 (상태가 바뀔 때만 비운다)
+        self._view: Optional[dict] = None
+
+        # 마지막 사용자 조작 시각 (monotonic, 유휴 그룹 판정용. 타이머가 스스로 넘긴 턴은 포함하지 않음)
+        self.last_activity = scheduler.now()
+
+        # timer_sync 전송 상태 (sync 모드 클라이언트용)
+        self._sync_pending = False
+        self._last_sync = 0.0
+
+        # 타이머가 tick 을 내보내는 중인지 (플레이어 송신 writer 유지 여부)
+        self._streaming = False
 
-        # 비동기 타이머
+        # 비동기 타이머 (턴 사이 대기도 타이머의 intermission 상태로 진행)
         self.timer = AsyncTimer(
             h, m, s,
             on_tick_callback=self.broadcast_remaining_time,
-            on_timeout_callback=self.on_timer_timeout
+            on_timeout_callback=self.on_timer_timeout,
+            on_state_callback=self.on_timer_state,
+            on_wait_callback=self.broadcast_turn_wait,
+            on_wait_end_callback=self._next_turn
         )
 
-    async def broadcast_remaining_time(self, remaining_seconds: int):
-        """타이머 tick 콜백 (비동기)"""
-        msg = json.dumps({
-            "action": "update_timer",
-            "now_turn": self.now_turn,
-            "remaining_seconds": remaining_seconds
-        })
-        await self.broadcast_callback(self.group_name, msg)
+        # 마지막으로 알린 목록 요약 값 (진행 여부, 인원, 타이머 상태)
+        self._listed = (self.is_active, len(self.players), self.timer.state)
+
+    def broadcast_remaining_time(self, remaining_seconds: int):
+        """
+        타이머 tick 콜백. 프레임은 그룹당 한 번만 인코딩하고 송신 큐에 넣기만 하므로
+        스케줄러가 동기로 바로 호출한다 (tick 마다 Task 를 만들지 않는다).
+        """
+        frame = protocol.update_timer_frame(self.now_turn, remaining_seconds)
+        self.broadcast_callback(self.group_name, frame)
+
+        # sync 모드 클라이언트를 위한 주기적 재동기화
+        if not self._sync_pending and scheduler.now() - self._last_sync >= config.TIMER_RESYNC_INTERVAL:
+            self.broadcast_timer_sync()
+
+    def on_timer_state(self):
+        """타이머 상태 변경 콜백. 같은 루프 턴 안의 연속 변경(reset+start 등)은 한 번의 timer_sync 로 합친다."""
+        self._changed()
+        streaming = self.timer.status is TimerState.RUNNING
+        if streaming != self._streaming:
+            self._streaming = streaming
+            for player in self.players:
+                player.set_streaming(streaming)
+        if self._sync_pending:
+            return
+        self._sync_pending = True
+        scheduler.call_later(0, self._flush_timer_sync)
+
+    def _flush_timer_sync(self):
+        self._sync_pending = False
+        self.broadcast_timer_sync()
+
+    def broadcast_timer_sync(self):
+        """절대 마감 시각과 상태를 담은 timer_sync 전송 (sync 모드 클라이언트만 수신)"""
+        self._last_sync = scheduler.now()
+        self.broadcast_callback(self.group_name, self.timer_sync_frame())
+
+    def timer_sync_frame(self) -> protocol.Frame:
+        """현재 타이머 상태의 timer_sync 프레임"""
+        return protocol.timer_sync_frame(self.now_turn, self.timer.state, self.timer.remaining)
+
+    def broadcast_turn_wait(self, remaining_seconds: int):
+        """intermission 중 매초 남은 대기 시간 알림"""
+        self.broadcast_callback(self.group_name, protocol.turn_wait_frame(self.now_turn, remaining_seconds))
 
     async def on_timer_timeout(self):
-        """타이머가 0초 도달 시 (비동기)"""
-        print(f"[Group {self.group_name}] Timer expired, switching turn.")
+        """타이머가 0초 도달 시 (비동기). 실행되기 전에 게임이 정지/재시작되어 만료 상태가 아니면 무시"""
+        if self.timer.status is not TimerState.EXPIRED or not self.is_active:
+            return
+        log.debug("timer expired, switching turn", group=self.group_name)
         await self.turn_over()
 
+    @property
+    def streaming(self) -> bool:
+        return self._streaming
+
+    @property
+    def phase(self) -> str:
+        """turn (턴 진행 중) / intermission (턴 사이 대기)"""
+        return "intermission" if self.timer.status is TimerState.INTERMISSION else "turn"
+
+    def touch(self):
+        self.last_activity = scheduler.now()
+
+    def idle_since(self) -> float:
+        """그룹 조작과 플레이어 활동 중 가장 최근 시각"""
+        return max(self.last_activity, max((p.last_seen for p in self.players), default=0.0))
+
+    def _changed(self, listing: bool = False):
+        """
+        상태 변경 알림. 목록 요약 값이 바뀌었는지는 여기서 비교하므로 타이머 전이(턴 진행, 정지 등)도
+        로비에 반영되고, 진행 여부나 인원이 바뀌었으면 listing 을 주지 않아도 목록 조건 변경으로 알린다.
+        """
+        self._view = None
+        listed = (self.is_active, len(self.players), self.timer.state)
+        summary = listing or listed != self._listed
+        if listed[:2] != self._listed[:2]:
+            listing = True
+        self._listed = listed
+        if self.change_callback:
+            self.change_callback(self.group_name, listing, summary)
+
+    def _emit(self, event: str, **fields):
+        if self.event_callback:
+            self.event_callback(self.group_name, event, fields)
+
     def add_player(self, player: Player):
         self.players.append(player)
+        player.set_streaming(self._streaming)
+        self._changed(listing=True)
+        self._emit("player_joined", player=player.to_dict())
+
+    def set_players(self, players: List[Player]):
+        """플레이어 목록 교체 (순서 변경, 복원)"""
+        self.players = players
+        self._changed(listing=True)
 
     def remove_player(self, player_id: str):
-        self.players = [p for p in self.players if p.player_id != player_id]
+        remaining = []
+        for p in self.players:
+            if p.player_id == player_id:
+                p.set_streaming(False)
+            else:
+                remaining.append(p)
+        removed = len(remaining) != len(self.players)
+        self.players = remaining
+        self._changed(listing=True)
+        if removed:
+            self._emit("player_left", player_id=player_id)
 
     def set_time(self, h: int, m: int, s: int):
         """타이머 시간 재설정"""
         self.timer.set_time(h, m, s)
+        self._changed()
+        self._emit("time_set", initial=self.timer.initial_seconds)
 
-    async def start_game(self):
-        """게임 시작"""
+    async def start_game(self, at: Optional[float] = None):
+        """게임 시작 (at: 타이머 시작 기준 시각, monotonic). 진행 중이면 현재 턴을 처음부터 다시 시작"""
         if self.is_active:
-            # 이미 진행 중이면 리셋 후 재시작
-            print(f"[Group {self.group_name}] Already active, resetting timer.")
-            await self.timer.reset()
-            await self.timer.start()
-            return
-
-        self.is_active = True
-        self.now_turn = 0
-        await self.timer.reset()
-        await self.timer.start()
+            log.info("already active, restarting timer", group=self.group_name)
+        else:
+            self.is_active = True
+            self.now_turn = 0
+        await self.timer.restart(at)
+        # 타이머 전이 뒤에 알려 로비 요약이 실행 중인 타이머 상태를 담는다
+        self._changed()
+        self._emit("game_started", now_turn=self.now_turn)
 
     async def stop_game(self):
         """게임 정지"""
@@ -77,47 +200,97 @@ class Group:
         self.is_active = False
         self.now_turn = 0
         await self.timer.stop()
+        self._changed()
+        self._emit("game_stopped")
 
     async def pause_game(self):
-        await self.timer.pause()
+        if await self.timer.pause():
+            self._emit("game_paused", remaining_ms=int(self.timer.remaining * 1000))
 
     async def resume_game(self):
-        await self.timer.resume()
+        if await self.timer.resume():
+            self._emit("game_resumed", remaining_ms=int(self.timer.remaining * 1000))
 
     async def turn_over(self):
-        """턴 전환 로직 (3초 대기 후 다음 턴)"""
+        """
+        턴 전환 시작 (turn -> intermission -> turn).
+        타이머를 intermission 상태로 넘기고 바로 반환한다. 대기 중의 매초 turn_wait 와 대기 종료는 타이머가 진행하고,
+        intermission 중에 들어온 turn_over 는 전이가 거절되어 진행 중인 전환에 합쳐진다.
+        """
         if not self.is_active:
             raise ValueError("[Group] Game is not active.")
+        await self.timer.intermission(config.TURN_INTERMISSION)
 
-        # 타이머 일시 정지
-        await self.timer.stop()
+    async def _next_turn(self, version: int):
+        """대기 종료 콜백: 그사이 게임이 정지/재시작되었으면 (version 이 바뀜) 무시"""
+        if self.timer.version != version or not self.players:
+            return
+        self.now_turn = (self.now_turn + 1) % len(self.players)
+        self._changed()
+        self._emit("turn_changed", now_turn=self.now_turn)
+        log.debug("turn switched", group=self.group_name, now_turn=self.now_turn)
 
-        # 3초 대기 + 브로드캐스트
-        for i in range(3, 0, -1):
-            msg = json.dumps({
-                "action": "turn_wait",
-                "now_turn": self.now_turn,
-                "remaining_wait_seconds": i,
-            })
-            await self.broadcast_callback(self.group_name, msg)
-            await asyncio.sleep(1)
+        # 대기 -> 다음 턴 (초기값으로 재시작)
+        await self.timer.restart(expected_version=version)
 
-        # 턴 전환
-        self.now_turn = (self.now_turn + 1) % len(self.players)
-        print(f"[Group {self.group_name}] Turn switched to player {self.now_turn}")
+    def close(self):
+        """그룹 삭제 시 예약된 tick 과 턴 전환 취소"""
+        self.timer.cancel()
 
-        # 타이머 재설정(예: 30초) 원하는 값으로 설정
-        await self.timer.reset()
-        print("[group.py] reset() ",self.timer.running)
-        # 타이머 재시작
-        await self.timer.start()
+    def snapshot(self) -> dict:
+        """
+        재시작 후 복원용 상태. 타이머는 내부 상태(TimerState) 그대로 저장해 intermission/expired 도
+        복원되고, 실행 중인 턴과 턴 사이 대기는 epoch 기준 마감 시각으로 저장한다.
+        """
+        state = self.timer.status.value
+        remaining = self.timer.remaining
+        wait = self.timer.wait_remaining
+        return {
+            "group_name": self.group_name,
+            "host": self.host_player.player_id,
+            "players": [p.snapshot() for p in self.players],
+            "now_turn": self.now_turn,
+            "is_active": self.is_active,
+            "timer": {
+                "initial": self.timer.initial_seconds,
+                "state": state,
+                "remaining": round(remaining, 3),
+                "deadline": round(time.time() + remaining, 3) if state == "running" else None
+            },
+            # 턴 사이 대기 중이면 epoch 기준 대기 종료 시각
+            "intermission": round(time.time() + wait, 3) if wait is not None else None
+        }
+
+    def _cached_view(self) -> dict:
+        view = self._view
+        if view is None:
+            view = self._view = {
+                "group_name": self.group_name,
+                "host_player": self.host_player.to_dict(),
+                "players": [p.to_dict() for p in self.players],
+                "now_turn": self.now_turn,
+                "is_active": self.is_active
+            }
+        return view
+
+    def player_dicts(self) -> List[dict]:
+        """직렬화된 플레이어 목록 (캐시 공유, 수정 금지)"""
+        return self._cached_view()["players"]
 
     def to_dict(self):
+        # 플레이어 목록 등은 바뀔 때만 다시 만들고, 매 순간 변하는 타이머 값만 새로 읽는다
+        return {
+            **self._cached_view(),
+            "remaining_time": self.timer.remaining_seconds,
+            "timer_state": self.timer.state,
+            "phase": self.phase
+        }
+
+    def summary(self) -> dict:
+        """그룹 목록용 요약"""
         return {
             "group_name": self.group_name,
-            "host_player": self.host_player.to_dict(),
-            "players": [p.to_dict() for p in self.players],
-            "now_turn": self.now_turn,
+            "players": len(self.players),
             "is_active": self.is_active,
-            "remaining_time": self.timer.remaining_seconds
+            "timer_state": self.timer.state
         }
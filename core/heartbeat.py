@@ -0,0 +1,80 @@
+# your_project/core/heartbeat.py
+#
+# 서버 측 WebSocket heartbeat (앱 수준 ping/pong, 참여한 연결에만 적용).
+# 소켓마다 Task 를 두지 않고, 공유 스케줄러의 예약 하나가 interval 마다 참여한 연결을 한 번 훑는다.
+#   - 참여: 접속 시 ?heartbeat=true 로 협상했거나 {"action": "pong"} 을 한 번이라도 보낸 연결 (Player.heartbeat)
+#   - 나머지 연결(tick 만 받는 기존 클라이언트)은 건드리지 않는다. 이들의 생존 확인은 uvicorn 의
+#     프로토콜 ping (--ws-ping-interval / --ws-ping-timeout) 에 맡긴다
+#   - 지난 ping 이후 아무 메시지도 받지 못했으면 missed_pings 증가, 받았으면 0 으로
+#   - missed_pings 가 max_missed 에 도달하면 바로 송신 큐를 닫아 브로드캐스트 대상에서 빼고
+#     일반 연결 종료 경로(remove_connection_from_group)를 실행한 뒤 소켓을 닫는다
+#   - 나머지 연결에는 라운드마다 한 번 인코딩한 ping 프레임을 넣는다
+
+from typing import Optional
+
+from fastapi import WebSocket
+
+from core import config, metrics
+from core.connection_manager import ConnectionManager, manager as default_manager
+from core.log import get_logger
+from core.protocol import ping_frame
+from core.scheduler import ScheduledCall, scheduler
+
+log = get_logger("heartbeat")
+
+
+class Heartbeat:
+    def __init__(self, manager: ConnectionManager, interval: Optional[float] = None, max_missed: Optional[int] = None):
+        self.manager = manager
+        self.interval = config.HEARTBEAT_INTERVAL if interval is None else interval
+        self.max_missed = max_missed or config.HEARTBEAT_MAX_MISSED
+
+        self._handle: Optional[ScheduledCall] = None
+        self._last_round = scheduler.now()
+
+    def start(self):
+        if self.interval <= 0:
+            return
+        self._last_round = scheduler.now()
+        self._handle = scheduler.call_later(self.interval, self._round)
+
+    def stop(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _round(self):
+        now = scheduler.now()
+        frame = ping_frame()
+        dead = []
+        for websocket, player in self.manager._sockets.items():
+            if not player.heartbeat:
+                continue
+            if player.last_seen >= self._last_round:
+                player.missed_pings = 0
+            else:
+                player.missed_pings += 1
+                if player.missed_pings >= self.max_missed:
+                    # 즉시 브로드캐스트 대상에서 제외 (이후 send 는 무시됨)
+                    player.close()
+                    dead.append((websocket, player))
+                    continue
+            player.send(frame)
+
+        for websocket, player in dead:
+            log.info("heartbeat timeout", player_id=player.player_id, missed=player.missed_pings)
+            metrics.HEARTBEAT_TIMEOUTS.inc()
+            scheduler.spawn(self._drop(websocket))
+
+        self._last_round = now
+        self._handle = scheduler.call_later(self.interval, self._round)
+
+    async def _drop(self, websocket: WebSocket):
+        await self.manager.remove_connection_from_group(websocket)
+        try:
+            await websocket.close(code=1001)
+        except Exception:
+            pass
+
+
+heartbeat = Heartbeat(default_manager)  # 싱글턴 인스턴스
@@ -0,0 +1,150 @@
+# your_project/core/log.py
+#
+# 이벤트 루프를 막지 않는 구조화 로거.
+#
+# 로그 레코드는 QueueHandler 로 큐에 넣기만 하고, 포맷팅과 stdout 쓰기는
+# QueueListener 백그라운드 스레드에서 한다. 출력은 JSON 한 줄.
+#
+#   TIMER_LOG_LEVEL=INFO                            전체 기본 레벨
+#   TIMER_LOG_LEVELS="timer=WARNING,ws=DEBUG"       서브시스템별 레벨 (이름은 "timer." 생략 가능)
+#   TIMER_LOG_RATE_INTERVAL=1.0                     rate_limited 이벤트의 최소 간격 (초)
+#
+# 사용:
+#   log = get_logger("manager")
+#   log.info("group created", group=group_name, player=player_name)
+#   log.rate_limited(logging.DEBUG, "ws received", player=player_name)   # 초당 최대 1회 + 생략 건수
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+from typing import Dict, Optional
+
+ROOT_LOGGER = "timer"
+RATE_INTERVAL = float(os.getenv("TIMER_LOG_RATE_INTERVAL", "1.0"))
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_loggers: Dict[str, "StructLogger"] = {}
+
+
+class _EnqueueOnlyHandler(logging.handlers.QueueHandler):
+    """레코드를 포맷하지 않고 그대로 큐에 넣는다 (포맷은 리스너 스레드에서)"""
+
+    def prepare(self, record):
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class StructLogger:
+    """이벤트 이름 + 키워드 필드로 기록하는 얇은 래퍼"""
+
+    __slots__ = ("_logger", "_last", "_suppressed")
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+        self._last: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = {}
+
+    def is_enabled(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def log(self, level: int, event: str, exc_info=None, **fields):
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, event, exc_info=exc_info, extra={"fields": fields})
+
+    def debug(self, event: str, **fields):
+        self.log(logging.DEBUG, event, **fields)
+
+    def info(self, event: str, **fields):
+        self.log(logging.INFO, event, **fields)
+
+    def warning(self, event: str, **fields):
+        self.log(logging.WARNING, event, **fields)
+
+    def error(self, event: str, **fields):
+        self.log(logging.ERROR, event, **fields)
+
+    def exception(self, event: str, **fields):
+        self.log(logging.ERROR, event, exc_info=True, **fields)
+
+    def rate_limited(self, level: int, event: str, interval: Optional[float] = None, **fields):
+        """
+        tick/메시지 단위로 자주 발생하는 이벤트용.
+        같은 이벤트는 interval 초에 한 번만 기록하고, 그 사이 생략된 건수를 suppressed 필드로 남긴다.
+        """
+        if not self._logger.isEnabledFor(level):
+            return
+        now = time.monotonic()
+        if now - self._last.get(event, float("-inf")) < (RATE_INTERVAL if interval is None else interval):
+            self._suppressed[event] = self._suppressed.get(event, 0) + 1
+            return
+        self._last[event] = now
+        suppressed = self._suppressed.pop(event, 0)
+        if suppressed:
+            fields["suppressed"] = suppressed
+        self._logger.log(level, event, extra={"fields": fields})
+
+
+def configure(stream=None):
+    """루트 로거에 큐 핸들러와 백그라운드 리스너를 연결 (한 번만)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter())
+
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=False)
+    _listener.start()
+    atexit.register(shutdown)
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.handlers = [_EnqueueOnlyHandler(log_queue)]
+    root.propagate = False
+    root.setLevel(os.getenv("TIMER_LOG_LEVEL", "INFO").upper())
+
+    # 서브시스템별 레벨
+    for item in os.getenv("TIMER_LOG_LEVELS", "").split(","):
+        if "=" not in item:
+            continue
+        name, level = (part.strip() for part in item.split("=", 1))
+        if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + "."):
+            name = f"{ROOT_LOGGER}.{name}"
+        logging.getLogger(name).setLevel(level.upper())
+
+
+def shutdown():
+    """남은 로그를 모두 쓰고 리스너 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(subsystem: str) -> StructLogger:
+    """서브시스템 로거 (예: "scheduler" -> timer.scheduler)"""
+    logger = _loggers.get(subsystem)
+    if logger is None:
+        configure()
+        logger = _loggers[subsystem] = StructLogger(logging.getLogger(f"{ROOT_LOGGER}.{subsystem}"))
+    return logger
@@ -0,0 +1,135 @@
+# your_project/core/metrics.py
+#
+# 핫 패스 계측용 경량 메트릭 (Prometheus text format 출력).
+# 카운터/히스토그램 갱신은 속성 덧셈과 bisect 한 번뿐이고,
+# 그룹/플레이어 수 같은 집계 값은 scrape 시점에만 콜백으로 계산한다.
+
+from bisect import bisect_left
+from typing import Callable, List, Sequence
+
+# 초 단위 지연 측정용 기본 버킷
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class Counter:
+    __slots__ = ("name", "description", "value")
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} counter",
+            f"{self.name} {self.value}",
+        ]
+
+
+class Gauge:
+    """scrape 시점에 callback() 으로 값을 읽는 게이지"""
+
+    __slots__ = ("name", "description", "callback")
+
+    def __init__(self, name: str, description: str, callback: Callable[[], float]):
+        self.name = name
+        self.description = description
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {self.callback()}",
+        ]
+
+
+class Histogram:
+    __slots__ = ("name", "description", "buckets", "counts", "sum", "count")
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {self.sum}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = {}
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self._register(Counter(name, description))
+
+    def gauge(self, name: str, description: str, callback: Callable[[], float]) -> Gauge:
+        return self._register(Gauge(name, description, callback))
+
+    def histogram(self, name: str, description: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, description, buckets))
+
+    def _register(self, metric):
+        # 같은 이름으로 다시 등록하면 (예: 테스트용 매니저 재생성) 새 것으로 교체
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()  # 싱글턴 인스턴스
+
+# --- 핫 패스 메트릭 ---
+
+BROADCAST_SECONDS = registry.histogram(
+    "timer_broadcast_fanout_seconds", "Time spent fanning a frame out to a group's send queues")
+BROADCAST_MESSAGES = registry.counter(
+    "timer_broadcast_messages_total", "Frames enqueued to player send queues")
+SEND_FAILURES = registry.counter(
+    "timer_send_failures_total", "WebSocket sends that raised and closed the player's writer")
+SEND_DROPPED = registry.counter(
+    "timer_send_dropped_total", "Frames dropped or coalesced by send queue overflow policy")
+SEND_OVERFLOW_DISCONNECTS = registry.counter(
+    "timer_send_overflow_disconnects_total", "Clients disconnected because their send queue overflowed")
+LOCK_WAIT_SECONDS = registry.histogram(
+    "timer_group_lock_wait_seconds", "Time waiting to acquire ConnectionManager group locks")
+LOCK_HOLD_SECONDS = registry.histogram(
+    "timer_group_lock_hold_seconds", "Time ConnectionManager group locks are held")
+GROUPS_REAPED = registry.counter(
+    "timer_groups_reaped_total", "Idle groups removed by the reaper")
+GROUPS_REJECTED = registry.counter(
+    "timer_groups_rejected_total", "Registrations or joins refused by group limits")
+HEARTBEAT_TIMEOUTS = registry.counter(
+    "timer_heartbeat_timeouts_total", "Connections closed after missing too many heartbeat pings")
+TIMER_STALE_OPERATIONS = registry.counter(
+    "timer_stale_operations_total", "Timer transitions rejected because their expected version was stale")
+TICK_LATENESS_SECONDS = registry.histogram(
+    "timer_tick_lateness_seconds", "Delay between a tick's scheduled boundary and when it ran")
+COMMAND_SECONDS = registry.histogram(
+    "timer_ws_command_seconds", "Time to execute a WebSocket command and enqueue its acknowledgement")
+COMMANDS_RATE_LIMITED = registry.counter(
+    "timer_ws_commands_rate_limited_total", "WebSocket commands rejected by the per-connection rate limit")
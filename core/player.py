@@ -1,15 +1,111 @@
 # your_project/core/player.py
 
+import secrets
 import uuid
+from typing import Optional
 from fastapi import WebSocket
 
+from core.protocol import SYNC_KIND, TICK_KIND, Frame
+from core.scheduler import scheduler
+from core.send_queue import SendQueue
+
 class Player:
-    def __init__(self, websocket: WebSocket, player_name: str):
+    # 그룹/플레이어 수만큼 만들어지는 객체이므로 __dict__ 없이 고정 슬롯만 둔다
+    __slots__ = (
+        "websocket", "player_id", "player_name", "is_host", "resume_token",
+        "last_seen", "missed_pings", "heartbeat", "worker_id", "sync_ticks", "binary", "outbox"
+    )
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        player_name: str,
+        queue_size: Optional[int] = None,
+        overflow_policy: Optional[str] = None,
+        binary: bool = False,
+        sync_ticks: bool = False,
+        player_id: Optional[str] = None
+    ):
         self.websocket = websocket
-        self.player_id = str(uuid.uuid4())
+        self.player_id = player_id or str(uuid.uuid4())
         self.player_name = player_name
         self.is_host = False
 
+        # 연결이 끊긴 뒤 같은 자리로 다시 붙을 때 쓰는 토큰 (재접속마다 새로 발급)
+        self.resume_token = secrets.token_urlsafe(16)
+
+        # 마지막으로 클라이언트에게서 무언가를 받은 시각 (monotonic, 유휴 그룹 판정용)
+        self.last_seen = scheduler.now()
+        self.missed_pings = 0
+        # 앱 수준 heartbeat 에 참여하는 연결인지 (?heartbeat=true 로 협상했거나 pong 을 보낸 적 있음).
+        # 참여하지 않는 연결에는 ping 을 보내지 않고 응답도 요구하지 않는다 (프로토콜 ping 에 맡김)
+        self.heartbeat = False
+
+        # 소켓이 붙은 워커 (None 이면 이 워커의 로컬 플레이어)
+        self.worker_id: Optional[str] = None
+
+        # True 이면 매초 update_timer 대신 timer_sync 만 받는다 (클라이언트가 직접 보간)
+        self.sync_ticks = sync_ticks
+
+        # 송신 전용 큐 (writer Task 가 websocket 으로 전송)
+        self.binary = binary
+        self.outbox = SendQueue(websocket, queue_size, overflow_policy, binary) if websocket is not None else None
+
+    def send(self, frame: Frame) -> bool:
+        """프레임을 송신 큐에 넣고 바로 반환"""
+        if self.outbox is None:
+            return False
+        # tick 전송 방식에 맞지 않는 타이머 메시지는 건너뛴다
+        if frame.kind == (TICK_KIND if self.sync_ticks else SYNC_KIND):
+            return False
+        return self.outbox.put(frame)
+
+    def set_streaming(self, streaming: bool):
+        """그룹 타이머가 돌고 있는 동안에는 송신 writer 를 유지하고, 멈추면 놓아 준다"""
+        if self.outbox is not None:
+            self.outbox.set_linger(streaming)
+
+    def touch(self):
+        self.last_seen = scheduler.now()
+
+    def close(self):
+        """송신 큐와 writer Task 정리"""
+        if self.outbox is not None:
+            self.outbox.close()
+
+    @property
+    def connected(self) -> bool:
+        return self.outbox is not None
+
+    def detach(self):
+        """소켓만 떼어 낸다 (그룹 내 자리는 유지, 이후 send 는 무시됨)"""
+        self.close()
+        self.websocket = None
+        self.outbox = None
+
+    def attach(self, websocket: WebSocket, queue_size: Optional[int] = None, overflow_policy: Optional[str] = None, binary: bool = False):
+        """새 소켓을 붙이고 resume_token 재발급"""
+        self.close()
+        self.websocket = websocket
+        self.binary = binary
+        self.outbox = SendQueue(websocket, queue_size, overflow_policy, binary)
+        self.resume_token = secrets.token_urlsafe(16)
+        self.touch()
+
+    def snapshot(self) -> dict:
+        """재시작 후 복원용 상태 (소켓은 복원되지 않으므로 resume_token 으로 다시 붙는다)"""
+        data = {
+            "player_id": self.player_id,
+            "player_name": self.player_name,
+            "is_host": self.is_host,
+            "binary": self.binary,
+            "sync_ticks": self.sync_ticks,
+            "resume_token": self.resume_token
+        }
+        if self.worker_id is not None:
+            data["worker"] = self.worker_id
+        return data
+
     def to_dict(self) -> dict:
         return {
             "player_id": self.player_id,
@@ -21,3 +117,23 @@ class Player:
         if player_name is None:
             return False
         return self.player_name == player_name
+
+
+class RemotePlayer(Player):
+    """
+    다른 워커에 소켓이 붙어 있는 그룹 멤버의 대리 객체 (core.cluster 참고).
+    send() 는 프레임을 소켓이 있는 워커로 넘기고, 그쪽의 실제 Player 가 큐에 넣는다.
+    """
+
+    __slots__ = ("_cluster",)
+
+    def __init__(self, cluster, worker_id: str, player_id: str, player_name: str, binary: bool = False, sync_ticks: bool = False):
+        super().__init__(None, player_name, binary=binary, sync_ticks=sync_ticks, player_id=player_id)
+        self.worker_id = worker_id
+        self._cluster = cluster
+
+    def send(self, frame: Frame) -> bool:
+        if frame.kind == (TICK_KIND if self.sync_ticks else SYNC_KIND):
+            return False
+        self._cluster.deliver(self.worker_id, [self.player_id], frame)
+        return True
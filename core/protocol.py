@@ -0,0 +1,162 @@
+# your_project/core/protocol.py
+#
+# 서버 -> 클라이언트 메시지 인코딩.
+# 브로드캐스트 메시지는 그룹당 한 번만 인코딩해 Frame 으로 만들고,
+# 같은 Frame 객체를 그룹 내 모든 플레이어의 송신 큐에 넣는다.
+#
+# 바이너리 프로토콜 (접속 시 ?protocol=binary 또는 subprotocol "timer.bin.v1" 로 협상)
+#   update_timer / turn_wait 를 JSON 대신 7바이트 고정 길이 binary 프레임으로 보낸다.
+#   | opcode: u8 | now_turn: u16 | seconds: u32 |   (network byte order)
+#   opcode 1 = update_timer (seconds = remaining_seconds)
+#   opcode 2 = turn_wait    (seconds = remaining_wait_seconds)
+#   timer_sync 는 16바이트 고정 길이 프레임으로 보낸다.
+#   | opcode=3: u8 | now_turn: u16 | state: u8 | remaining_ms: u32 | deadline_ms: u64 |
+#   state 0 = stopped, 1 = running, 2 = paused / deadline_ms 는 epoch 기준 (running 이 아니면 0)
+#   그 밖의 메시지는 바이너리 클라이언트에게도 JSON 텍스트로 전송된다.
+#
+# tick 전송 방식 (접속 시 ?ticks=sync 로 협상)
+#   stream (기본) : 매초 update_timer 를 받는다.
+#   sync          : update_timer 대신 시작/일시정지/재개/리셋/턴 전환 시와 주기적 재동기화 때만
+#                   timer_sync (절대 마감 시각 + 상태) 를 받고, 클라이언트가 직접 보간한다.
+#
+# heartbeat
+#   서버는 주기적으로 {"action": "ping", "server_time": <epoch ms>} 를 보낸다.
+#   클라이언트는 아무 메시지(예: {"action": "pong"})로 응답하면 되고, 정해진 횟수 이상
+#   응답이 없으면 연결이 끊긴 것으로 처리된다.
+
+import json
+import struct
+import time
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # orjson 은 선택 의존성
+    orjson = None
+
+# 메시지 종류
+TICK_KIND = "update_timer"
+TURN_WAIT_KIND = "turn_wait"
+SYNC_KIND = "timer_sync"
+PING_KIND = "ping"
+
+# 바이너리 프로토콜
+BINARY_SUBPROTOCOL = "timer.bin.v1"
+OP_UPDATE_TIMER = 1
+OP_TURN_WAIT = 2
+OP_TIMER_SYNC = 3
+_TICK_STRUCT = struct.Struct("!BHI")
+_SYNC_STRUCT = struct.Struct("!BHBIQ")
+_SYNC_STATES = {"stopped": 0, "running": 1, "paused": 2}
+_STRUCTS = {s.format: s for s in (_TICK_STRUCT, _SYNC_STRUCT)}
+
+# tick 메시지는 초당 가장 많이 나가는 메시지이므로 고정 템플릿으로 만든다.
+# (json.dumps 결과와 바이트 단위로 동일)
+_UPDATE_TIMER_TEMPLATE = '{"action": "update_timer", "now_turn": %d, "remaining_seconds": %d}'
+_TURN_WAIT_TEMPLATE = '{"action": "turn_wait", "now_turn": %d, "remaining_wait_seconds": %d}'
+
+
+class Frame:
+    """한 번 인코딩되어 여러 플레이어가 공유하는 송신 프레임"""
+
+    __slots__ = ("kind", "text", "message", "_binary_struct", "_fields", "_binary_message")
+
+    def __init__(
+        self,
+        text: str,
+        kind: Optional[str] = None,
+        binary_struct: Optional[struct.Struct] = None,
+        fields: tuple = ()
+    ):
+        self.kind = kind
+        self.text = text
+        # ASGI send 메시지를 미리 만들어 두고 writer 가 그대로 전달한다
+        self.message = {"type": "websocket.send", "text": text}
+
+        # 바이너리 표현은 바이너리 클라이언트가 처음 요청할 때 한 번만 만든다 (fields[0] 은 opcode)
+        self._binary_struct = binary_struct
+        self._fields = fields
+        self._binary_message = None
+
+    def message_for(self, binary: bool) -> dict:
+        """클라이언트 프로토콜에 맞는 ASGI 메시지 반환"""
+        if not binary or self._binary_struct is None:
+            return self.message
+        if self._binary_message is None:
+            data = self._binary_struct.pack(*self._fields)
+            self._binary_message = {"type": "websocket.send", "bytes": data}
+        return self._binary_message
+
+    def to_wire(self) -> dict:
+        """다른 워커로 전달하기 위한 JSON 표현 (바이너리 표현은 받는 쪽에서 다시 만든다)"""
+        wire = {"text": self.text, "kind": self.kind}
+        if self._binary_struct is not None:
+            wire["struct"] = self._binary_struct.format
+            wire["fields"] = list(self._fields)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict) -> "Frame":
+        fmt = wire.get("struct")
+        if fmt is None:
+            return cls(wire["text"], wire.get("kind"))
+        binary_struct = _STRUCTS.get(fmt) or struct.Struct(fmt)
+        return cls(wire["text"], wire.get("kind"), binary_struct, tuple(wire["fields"]))
+
+    @classmethod
+    def of(cls, message, kind: Optional[str] = None) -> "Frame":
+        """문자열이면 Frame 으로 감싸고, 이미 Frame 이면 그대로 반환"""
+        if isinstance(message, Frame):
+            return message
+        return cls(message, kind)
+
+
+def dumps(payload: dict) -> str:
+    """JSON 직렬화 (orjson 이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload)
+
+
+def json_frame(payload: dict, kind: Optional[str] = None) -> Frame:
+    return Frame(dumps(payload), kind)
+
+
+def ping_frame() -> Frame:
+    return json_frame({"action": "ping", "server_time": int(time.time() * 1000)}, PING_KIND)
+
+
+def update_timer_frame(now_turn: int, remaining_seconds: int) -> Frame:
+    return Frame(
+        _UPDATE_TIMER_TEMPLATE % (now_turn, remaining_seconds), TICK_KIND,
+        _TICK_STRUCT, (OP_UPDATE_TIMER, now_turn, remaining_seconds)
+    )
+
+
+def turn_wait_frame(now_turn: int, remaining_wait_seconds: int) -> Frame:
+    return Frame(
+        _TURN_WAIT_TEMPLATE % (now_turn, remaining_wait_seconds), TURN_WAIT_KIND,
+        _TICK_STRUCT, (OP_TURN_WAIT, now_turn, remaining_wait_seconds)
+    )
+
+
+def timer_sync_frame(now_turn: int, state: str, remaining: float) -> Frame:
+    """
+    절대 마감 시각 기반 동기화 메시지.
+    deadline/server_time 은 epoch 밀리초이며, 클라이언트는 server_time 으로 시계 오차를 보정한다.
+    """
+    server_time = int(time.time() * 1000)
+    remaining_ms = int(remaining * 1000)
+    deadline = server_time + remaining_ms if state == "running" else None
+    text = dumps({
+        "action": "timer_sync",
+        "now_turn": now_turn,
+        "state": state,
+        "remaining_ms": remaining_ms,
+        "deadline": deadline,
+        "server_time": server_time
+    })
+    return Frame(
+        text, SYNC_KIND,
+        _SYNC_STRUCT, (OP_TIMER_SYNC, now_turn, _SYNC_STATES[state], remaining_ms, deadline or 0)
+    )
@@ -0,0 +1,177 @@
+# your_project/core/scheduler.py
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Callable, List, Optional, Set, Tuple
+
+from core.log import get_logger
+
+log = get_logger("scheduler")
+
+
+class ScheduledCall:
+    """스케줄러에 예약된 단일 호출 (cancel() 로 취소 가능한 핸들)"""
+
+    __slots__ = ("when", "callback", "args", "cancelled", "_scheduler")
+
+    def __init__(self, scheduler: "TickScheduler", when: float, callback: Callable, args: tuple):
+        self._scheduler = scheduler
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """예약 취소. 힙에서는 만기 시점에 lazy하게 제거된다."""
+        if self.cancelled:
+            return
+        self.cancelled = True
+        self.callback = None
+        self.args = ()
+        if self._scheduler is not None:  # 아직 힙에 남아 있는 경우에만 집계
+            self._scheduler._on_cancel()
+
+
+class TickScheduler:
+    """
+    프로세스 전역 타이머 스케줄러.
+
+    모든 AsyncTimer 를 하나의 최소 힙과 하나의 이벤트 루프 타이머로 구동한다.
+    타이머마다 Task 를 띄우고 asyncio.sleep 으로 기다리는 대신, 힙의 가장 이른 만기
+    시각에만 루프 타이머를 걸어두고 깨어나면 만기된 항목만 꺼내 실행한다.
+    따라서 한 번 깨어날 때의 비용은 전체 타이머 수가 아니라 만기된 타이머 수에 비례한다.
+    """
+
+    # 취소된 항목이 힙의 절반을 넘으면 힙을 재구성한다.
+    _COMPACT_MIN_SIZE = 1024
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, ScheduledCall]] = []
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._running = False  # _run_due 실행 중에는 힙을 교체(compaction)하지 않는다
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._wakeup_at: Optional[float] = None
+
+        # 비동기 콜백 실행용 Task (참조 유지용)
+        self._tasks: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def now() -> float:
+        """스케줄러 기준 시각 (monotonic)"""
+        return time.monotonic()
+
+    def __len__(self):
+        return len(self._heap) - self._cancelled
+
+    def call_at(self, when: float, callback: Callable, *args) -> ScheduledCall:
+        """monotonic 시각 when 에 callback(*args) 실행 예약"""
+        self._bind_loop()
+        call = ScheduledCall(self, when, callback, args)
+        heapq.heappush(self._heap, (when, next(self._counter), call))
+        if self._wakeup_at is None or when < self._wakeup_at:
+            self._arm(when)
+        return call
+
+    def call_later(self, delay: float, callback: Callable, *args) -> ScheduledCall:
+        """delay 초 뒤 callback(*args) 실행 예약"""
+        return self.call_at(self.now() + delay, callback, *args)
+
+    def spawn(self, coro) -> asyncio.Task:
+        """스케줄된 콜백에서 비동기 작업을 띄울 때 사용 (완료 시 자동 정리)"""
+        self._bind_loop()
+        task = self._loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    # --- 내부 구현 ---
+
+    def _bind_loop(self):
+        """현재 실행 중인 이벤트 루프에 바인딩 (루프가 바뀌면 상태 초기화)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        self._loop = loop
+        self._heap = []
+        self._cancelled = 0
+        self._wakeup = None
+        self._wakeup_at = None
+        self._tasks = set()
+
+    def _arm(self, when: float):
+        """가장 이른 만기 시각에 맞춰 루프 타이머 하나만 유지"""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        self._wakeup_at = when
+        self._wakeup = self._loop.call_later(max(0.0, when - self.now()), self._run_due)
+
+    def _on_cancel(self):
+        self._cancelled += 1
+        if not self._running:
+            self._maybe_compact()
+
+    def _maybe_compact(self):
+        if self._cancelled > self._COMPACT_MIN_SIZE and self._cancelled * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def _run_due(self):
+        """만기된 항목만 꺼내 실행한 뒤 다음 만기 시각으로 재무장"""
+        self._wakeup = None
+        self._wakeup_at = None
+
+        now = self.now()
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= now:
+            call = heapq.heappop(heap)[2]
+            if call.cancelled:
+                self._cancelled -= 1
+                continue
+            call._scheduler = None  # 힙에서 빠졌음을 표시
+            due.append(call)
+
+        # 콜백이 다른 항목을 취소해도 힙은 이 루프가 끝날 때까지 교체하지 않는다
+        self._running = True
+        try:
+            for call in due:
+                if call.cancelled:
+                    continue
+                callback, args = call.callback, call.args
+                call.cancelled = True  # 실행 완료된 핸들은 다시 취소되지 않도록
+                call.callback = None
+                call.args = ()
+                try:
+                    callback(*args)
+                except Exception:
+                    log.exception("callback failed", callback=getattr(callback, "__qualname__", repr(callback)))
+        finally:
+            self._running = False
+        self._maybe_compact()
+        heap = self._heap
+
+        # 맨 앞의 취소된 항목은 바로 버린다
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        if heap and (self._wakeup_at is None or heap[0][0] < self._wakeup_at):
+            self._arm(heap[0][0])
+
+    def _on_task_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            log.error("task failed", error=repr(exc))
+
+
+scheduler = TickScheduler()  # 싱글턴 인스턴스
@@ -0,0 +1,156 @@
+# your_project/core/send_queue.py
+
+import asyncio
+import logging
+from collections import deque
+from enum import Enum
+from typing import Deque, Optional
+
+from fastapi import WebSocket
+
+from core import config, metrics
+from core.protocol import TICK_KIND, Frame
+from core.log import get_logger
+from core.scheduler import scheduler
+
+log = get_logger("send_queue")
+
+
+class OverflowPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"   # 가장 오래된 update_timer 를 버림
+    COALESCE = "coalesce"         # 같은 종류의 대기 메시지를 최신 값 하나로 합침 (합칠 것이 없으면 DROP_OLDEST 처럼)
+    DISCONNECT = "disconnect"     # 느린 클라이언트 연결 종료
+
+
+class SendQueue:
+    """
+    플레이어별 bounded 송신 큐와 writer Task.
+
+    브로드캐스트는 put() 으로 Frame 을 큐에 넣고 바로 반환하며, 실제 전송은
+    플레이어마다 하나씩 있는 writer Task 가 순서대로 처리한다.
+    느린 소켓은 자기 큐만 채울 뿐 다른 플레이어나 그룹을 막지 않는다.
+
+    큐(deque), 대기 Event, writer Task 는 보낼 프레임이 있을 때만 만들어진다.
+    linger=True(그룹 타이머 실행 중) 이면 writer 가 큐가 비어도 남아 다음 tick 을 기다리고,
+    그 밖에는 큐를 비우는 즉시 종료하며 자원을 놓아 준다.
+    """
+
+    __slots__ = ("websocket", "binary", "maxsize", "policy", "linger", "closed", "dropped", "_items", "_ready", "_writer")
+
+    def __init__(self, websocket: WebSocket, maxsize: Optional[int] = None, policy: Optional[str] = None, binary: bool = False):
+        self.websocket = websocket
+        self.binary = binary  # 바이너리 tick 프로토콜 사용 여부
+        self.maxsize = maxsize or config.SEND_QUEUE_SIZE
+        self.policy = OverflowPolicy(policy or config.SEND_OVERFLOW_POLICY)
+
+        self.linger = False
+        self._items: Optional[Deque[Frame]] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._writer: Optional[asyncio.Task] = None
+
+        self.closed = False
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._items) if self._items else 0
+
+    def put(self, frame: Frame) -> bool:
+        """프레임을 큐에 넣는다. 연결이 닫혔거나 정책에 의해 끊기면 False"""
+        if self.closed:
+            return False
+
+        if self._items is None:
+            self._items = deque()
+        elif len(self._items) >= self.maxsize and not self._make_room(frame.kind):
+            log.rate_limited(logging.WARNING, "queue overflow, disconnecting slow client", policy=self.policy.value)
+            metrics.SEND_OVERFLOW_DISCONNECTS.inc()
+            self._disconnect()
+            return False
+
+        self._items.append(frame)
+        if self._writer is None:
+            self._writer = asyncio.get_running_loop().create_task(self._run())
+        elif self._ready is not None:
+            self._ready.set()
+        return True
+
+    def set_linger(self, linger: bool):
+        """큐가 비어도 writer 를 남겨 둘지 설정 (False 로 바꾸면 대기 중인 writer 를 깨워 종료시킨다)"""
+        self.linger = linger
+        if not linger and self._ready is not None:
+            self._ready.set()
+
+    def close(self):
+        """writer Task 종료 및 대기 메시지 폐기"""
+        self.closed = True
+        self._items = None
+        self._ready = None
+        if self._writer is not None and not self._writer.done():
+            self._writer.cancel()
+        self._writer = None
+
+    def _make_room(self, kind: Optional[str]) -> bool:
+        """overflow 정책에 따라 빈 자리를 만든다. 만들지 못하면 False"""
+        if self.policy == OverflowPolicy.DROP_OLDEST:
+            return self._drop_oldest_tick()
+
+        if self.policy == OverflowPolicy.COALESCE:
+            if kind is not None:
+                before = len(self._items)
+                self._items = deque(queued for queued in self._items if queued.kind != kind)
+                removed = before - len(self._items)
+                if removed:
+                    self.dropped += removed
+                    metrics.SEND_DROPPED.inc(removed)
+                    return True
+            # 종류가 없는 메시지(명령 응답, REST 브로드캐스트)나 대기 중에 같은 종류가 없으면 가장 오래된 tick 을 버린다
+            return self._drop_oldest_tick()
+
+        return False
+
+    def _drop_oldest_tick(self) -> bool:
+        for i, queued in enumerate(self._items):
+            if queued.kind == TICK_KIND:
+                del self._items[i]
+                self.dropped += 1
+                metrics.SEND_DROPPED.inc()
+                return True
+        return False
+
+    def _disconnect(self):
+        websocket = self.websocket
+        self.close()
+        scheduler.spawn(self._close_socket(websocket))
+
+    @staticmethod
+    async def _close_socket(websocket: WebSocket):
+        try:
+            await websocket.close(code=1008)
+        except Exception:
+            pass
+
+    async def _run(self):
+        """큐에 쌓인 메시지를 순서대로 전송"""
+        try:
+            while True:
+                if self._items:
+                    # 미리 만들어 둔 ASGI 메시지를 그대로 전달 (플레이어마다 다시 만들지 않음)
+                    await self.websocket.send(self._items.popleft().message_for(self.binary))
+                    continue
+                if not self.linger:
+                    break
+                if self._ready is None:
+                    self._ready = asyncio.Event()
+                self._ready.clear()
+                await self._ready.wait()
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            log.rate_limited(logging.WARNING, "send failed", error=repr(e))
+            metrics.SEND_FAILURES.inc()
+            self.closed = True
+
+        # 큐를 다 비웠다: 다음 put() 이 다시 만들 때까지 자원 해제
+        self._writer = None
+        self._ready = None
+        self._items = None
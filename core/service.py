@@ -0,0 +1,244 @@
+# your_project/core/service.py
+#
+# REST 라우터가 사용하는 그룹/타이머 작업.
+# 요청이 그룹을 소유하지 않은 워커에 도착하면 backplane 으로 소유 워커에 넘겨 실행하고,
+# 결과(JSON 으로 직렬화 가능한 값)를 그대로 돌려준다. 단일 워커에서는 바로 실행한다.
+#
+# 일괄 작업(batch)은 작업들을 소유 워커별로 나눠 워커마다 한 번의 호출로 실행하고,
+# 작업별 결과({group_name, op, status[, detail, group]})를 요청 순서대로 모아 돌려준다.
+# 한 작업의 실패는 해당 결과에만 기록되고 나머지 작업은 계속 실행된다.
+
+import asyncio
+import functools
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from core import config
+from core.cluster import Cluster, cluster as default_cluster
+from core.connection_manager import ConnectionManager, manager as default_manager
+from core.log import get_logger
+from core.scheduler import scheduler
+
+log = get_logger("service")
+
+
+def routed(key: str):
+    """key 인자(group_name 또는 player_id)의 소유 워커에서 실행되도록 하는 데코레이터"""
+    def decorator(method):
+        op = method.__name__
+
+        @functools.wraps(method)
+        async def wrapper(self, **kwargs):
+            if not self.cluster.is_local(kwargs[key]):
+                return await self.cluster.call(self.cluster.owner_of(kwargs[key]), op, **kwargs)
+            return await method(self, **kwargs)
+
+        wrapper.routed_op = op
+        return wrapper
+    return decorator
+
+
+class GroupService:
+    def __init__(self, manager: ConnectionManager, cluster: Cluster):
+        self.manager = manager
+        self.cluster = cluster
+
+        # 다른 워커에서 넘어온 요청도 같은 메서드로 처리
+        for name in dir(type(self)):
+            method = getattr(self, name)
+            if getattr(method, "routed_op", None):
+                cluster.register(method.routed_op, method)
+        cluster.register("local_listing", self._local_listing)
+        cluster.register("batch_local", self._batch_local)
+
+    async def _local_listing(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        summaries: bool = False,
+        **filters
+    ) -> dict:
+        """이 워커의 조건에 맞는 그룹 수와 [offset, offset+limit) 구간"""
+        names = self.manager.list_group_names(**filters)
+        page = names[offset:] if limit is None else names[offset:offset + limit]
+        if summaries:
+            page = [self.manager.groups[name].summary() for name in page]
+        return {"total": len(names), "items": page}
+
+    async def _listing(self, offset: int, limit: Optional[int], summaries: bool, filters: dict) -> dict:
+        """
+        모든 워커에 걸친 그룹 목록 페이지.
+        이 워커, 그다음 나머지 워커(id 순)를 이어 붙인 순서로 offset/limit 을 적용한다.
+        각 워커는 캐시된 목록에서 필요한 구간만 잘라 보낸다.
+        """
+        workers = [self.cluster.worker_id]
+        if self.cluster.enabled:
+            workers += sorted(w for w in await self.cluster.workers() if w != self.cluster.worker_id)
+
+        total = 0
+        items = []
+        for worker_id in workers:
+            remaining = None if limit is None else max(0, limit - len(items))
+            kwargs = dict(filters, offset=max(0, offset - total), limit=remaining, summaries=summaries)
+            if worker_id == self.cluster.worker_id:
+                part = await self._local_listing(**kwargs)
+            else:
+                part = await self.cluster.call(worker_id, "local_listing", **kwargs)
+            total += part["total"]
+            items.extend(part["items"])
+        return {"total": total, "items": items}
+
+    async def list_groups(self, offset: int = 0, limit: Optional[int] = None, **filters) -> List[str]:
+        """모든 워커의 그룹 이름 (filters: active, min_players, max_players)"""
+        return (await self._listing(offset, limit, False, filters))["items"]
+
+    async def list_group_summaries(self, offset: int = 0, limit: int = 50, **filters) -> dict:
+        """모든 워커의 그룹 요약 페이지와 조건에 맞는 전체 그룹 수"""
+        page = await self._listing(offset, limit, True, filters)
+        return {"total": page["total"], "offset": offset, "limit": limit, "groups": page["items"]}
+
+    @routed("group_name")
+    async def get_group(self, group_name: str) -> dict:
+        return self.manager.get_group(group_name).to_dict()
+
+    @routed("group_name")
+    async def get_players_in_group(self, group_name: str) -> List[dict]:
+        self.manager.get_group(group_name)
+        return self.manager.get_players_in_group(group_name)
+
+    @routed("group_name")
+    async def join_group(self, group_name: str, host_player_id: str, guest_player_id: str) -> str:
+        self.manager.get_group(group_name)
+        joined_group_name, _ = await self.manager.join_group(host_player_id, guest_player_id)
+        return joined_group_name
+
+    @routed("group_name")
+    async def reorder_group(self, group_name: str, new_order: List[str]):
+        await self.manager.reorder_group(group_name, new_order)
+
+    @routed("group_name")
+    async def broadcast(self, group_name: str, message: str):
+        self.manager.get_group(group_name).touch()
+        await self.manager.broadcast_to_group(group_name, message)
+
+    @routed("group_name")
+    async def set_time(self, group_name: str, h: int, m: int, s: int):
+        group = self.manager.get_group(group_name)
+        group.touch()
+        group.set_time(h, m, s)
+
+    @routed("group_name")
+    async def start_game(self, group_name: str) -> dict:
+        return (await self.manager.start_game(group_name)).to_dict()
+
+    @routed("group_name")
+    async def stop_game(self, group_name: str):
+        await self.manager.stop_game(group_name)
+
+    @routed("group_name")
+    async def pause_game(self, group_name: str):
+        await self.manager.pause_game(group_name)
+
+    @routed("group_name")
+    async def resume_game(self, group_name: str):
+        await self.manager.resume_game(group_name)
+
+    @routed("group_name")
+    async def turn_over(self, group_name: str) -> dict:
+        return (await self.manager.turn_over(group_name)).to_dict()
+
+    # --- 일괄 작업 ---
+
+    async def batch(self, operations: List[dict], align: bool = False) -> dict:
+        """
+        여러 그룹에 대한 작업을 한 번에 실행.
+        align=True 이면 모든 start 가 다음 정각 초(epoch)를 공통 시작 시각으로 사용해
+        tick 경계가 맞춰지고, 공유 스케줄러가 한 번 깨어날 때 함께 처리된다.
+        """
+        if len(operations) > config.BATCH_MAX_OPERATIONS:
+            raise HTTPException(status_code=413, detail=f"작업 수는 {config.BATCH_MAX_OPERATIONS}개를 넘을 수 없습니다.")
+        start_at = math.ceil(time.time()) if align else None
+
+        by_worker: Dict[str, List[Tuple[int, dict]]] = {}
+        for index, operation in enumerate(operations):
+            by_worker.setdefault(self.cluster.owner_of(operation["group_name"]), []).append((index, operation))
+
+        results: List[Optional[dict]] = [None] * len(operations)
+
+        async def run(worker_id: str, entries: List[Tuple[int, dict]]):
+            ops = [operation for _, operation in entries]
+            try:
+                if worker_id == self.cluster.worker_id:
+                    worker_results = await self._batch_local(operations=ops, start_at=start_at)
+                else:
+                    worker_results = await self.cluster.call(worker_id, "batch_local", operations=ops, start_at=start_at)
+            except HTTPException as e:
+                # 워커 호출 자체가 실패하면 그 워커의 작업 전부 같은 오류
+                worker_results = [_result(op, e.status_code, e.detail) for op in ops]
+            for (index, _), result in zip(entries, worker_results):
+                results[index] = result
+
+        await asyncio.gather(*(run(worker_id, entries) for worker_id, entries in by_worker.items()))
+        return {
+            "start_at": start_at * 1000 if start_at is not None else None,
+            "results": results
+        }
+
+    async def _batch_local(self, operations: List[dict], start_at: Optional[float] = None) -> List[dict]:
+        """이 워커 소유 그룹의 작업을 순서대로 실행 (start_at: epoch 초)"""
+        at = None
+        if start_at is not None:
+            # epoch 기준 시작 시각을 이 워커의 monotonic 시각으로 바꾼다.
+            # 배치를 그때까지 재우지 않고 start 에만 넘기므로 나머지 작업은 바로 적용되고 타이머의 첫 tick 만 at 에 나간다.
+            at = scheduler.now() + (start_at - time.time())
+
+        results = []
+        for operation in operations:
+            try:
+                results.append(await self._apply(operation, at))
+            except HTTPException as e:
+                results.append(_result(operation, e.status_code, e.detail))
+            except ValueError as e:
+                results.append(_result(operation, 409, str(e)))
+            except Exception as e:
+                log.exception("batch operation failed", group=operation.get("group_name"), op=operation.get("op"))
+                results.append(_result(operation, 500, repr(e)))
+        return results
+
+    async def _apply(self, operation: dict, at: Optional[float]) -> dict:
+        group_name = operation["group_name"]
+        op = operation["op"]
+        manager = self.manager
+        if op == "set_time":
+            group = manager.get_group(group_name)
+            group.touch()
+            group.set_time(operation.get("h", 0), operation.get("m", 0), operation.get("s", 0))
+        elif op == "start":
+            await manager.start_game(group_name, at)
+        elif op == "stop":
+            await manager.stop_game(group_name)
+        elif op == "pause":
+            await manager.pause_game(group_name)
+        elif op == "resume":
+            await manager.resume_game(group_name)
+        elif op == "get":
+            return {**_result(operation, 200), "group": manager.get_group(group_name).to_dict()}
+        elif op == "broadcast":
+            manager.get_group(group_name).touch()
+            await manager.broadcast_to_group(group_name, operation.get("message") or "")
+        else:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 작업: {op}")
+        return _result(operation, 200)
+
+
+def _result(operation: dict, status: int, detail: Optional[str] = None) -> dict:
+    result = {"group_name": operation.get("group_name"), "op": operation.get("op"), "status": status}
+    if detail is not None:
+        result["detail"] = detail
+    return result
+
+
+service = GroupService(default_manager, default_cluster)  # 싱글턴 인스턴스
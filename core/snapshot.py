@@ -0,0 +1,174 @@
+# your_project/core/snapshot.py
+#
+# 그룹/타이머 상태의 주기적 스냅샷과 시작 시 복원.
+#
+# 파일은 JSON 한 줄짜리 레코드를 덧붙이기만 하는 로그다.
+#   {"op":"put","group":{...Group.snapshot()...}}   그룹 상태 (같은 그룹의 마지막 put 이 유효)
+#   {"op":"del","name":"group-..."}                   그룹 삭제
+# 주기마다 바뀐 그룹만 덧붙이므로 쓰기 비용은 전체 상태가 아니라 변경량에 비례한다.
+# 레코드 수가 살아 있는 그룹 수보다 충분히 많아지면 현재 상태만으로 파일을 새로 쓴다 (compaction).
+#
+#   TIMER_SNAPSHOT_PATH=/var/lib/timer/state.jsonl   (비어 있으면 비활성, 단일 워커에서만 사용 가능)
+#   TIMER_SNAPSHOT_INTERVAL=5                         저장 주기 (초)
+#
+# 다중 워커(TIMER_BACKPLANE)와 함께 쓸 수 없다. 그룹/플레이어 id 에 붙는 워커 id 가 기본값으로 pid 라
+# 재시작하면 바뀌므로 이전 워커의 파일도, 복원한 그룹의 소유 워커도 다시 찾을 수 없기 때문이다.
+# (uvicorn --workers N 에서는 워커마다 다른 TIMER_WORKER_ID 를 줄 수도 없다.)
+
+import asyncio
+import json
+import os
+from typing import List, Optional
+
+from core import config
+from core.connection_manager import ConnectionManager, manager as default_manager
+from core.log import get_logger
+from core.scheduler import ScheduledCall, scheduler
+
+log = get_logger("snapshot")
+
+# 레코드 수가 max(COMPACT_MIN_RECORDS, 살아 있는 그룹 수 * COMPACT_RATIO) 를 넘으면 compaction
+COMPACT_MIN_RECORDS = 1000
+COMPACT_RATIO = 4
+
+
+def _dumps(record: dict) -> str:
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+
+class SnapshotStore:
+    def __init__(self, manager: ConnectionManager, path: str, interval: Optional[float] = None):
+        self.manager = manager
+        self.manager.track_changes = True  # 이때부터 변경된 그룹을 기록하게 한다
+        self.path = path
+        self.interval = interval or config.SNAPSHOT_INTERVAL
+
+        self._records = 0  # 파일에 있는 레코드 수
+        self._torn = False  # 마지막 줄이 잘려 있음 (다음 append 전에 줄바꿈 필요)
+        self._lock = asyncio.Lock()
+        self._handle: Optional[ScheduledCall] = None
+
+    @classmethod
+    def from_env(cls, manager: ConnectionManager) -> Optional["SnapshotStore"]:
+        if not config.SNAPSHOT_PATH:
+            return None
+        if manager.cluster.enabled:
+            raise RuntimeError(
+                "TIMER_SNAPSHOT_PATH 는 단일 워커에서만 사용할 수 있습니다 (TIMER_BACKPLANE 과 함께 설정됨)."
+            )
+        return cls(manager, config.SNAPSHOT_PATH)
+
+    async def start(self):
+        """파일에서 그룹을 복원하고 주기적 저장 시작"""
+        await self.restore()
+        self._schedule()
+
+    async def stop(self):
+        """주기적 저장을 멈추고 마지막 변경분 저장"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        await self.flush()
+
+    async def restore(self) -> int:
+        groups = await asyncio.to_thread(self._read)
+        for data in groups.values():
+            try:
+                await self.manager.restore_group(data)
+            except Exception:
+                log.exception("restore failed", group=data.get("group_name"))
+        # 복원 자체로 생긴 변경은 이미 파일에 있다
+        self.manager.take_dirty_groups()
+        log.info("snapshot restored", path=self.path, groups=len(groups), records=self._records)
+        return len(groups)
+
+    async def flush(self):
+        """마지막 저장 이후 바뀐 그룹만 파일 끝에 덧붙인다"""
+        async with self._lock:
+            dirty = self.manager.take_dirty_groups()
+            if not dirty:
+                return
+            try:
+                lines = []
+                for name in dirty:
+                    group = self.manager.groups.get(name)
+                    if group is None:
+                        lines.append(_dumps({"op": "del", "name": name}))
+                    else:
+                        lines.append(_dumps({"op": "put", "group": group.snapshot()}))
+                await asyncio.to_thread(self._append, lines)
+            except BaseException:
+                # 이번에 못 쓴 그룹은 다음 주기에 다시 쓴다
+                self.manager.return_dirty_groups(dirty)
+                raise
+            self._records += len(lines)
+
+            if self._records > max(COMPACT_MIN_RECORDS, len(self.manager.groups) * COMPACT_RATIO):
+                await self._compact()
+
+    async def _compact(self):
+        """현재 상태만으로 파일을 새로 쓴다 (self._lock 을 잡은 상태에서 호출)"""
+        lines = [_dumps({"op": "put", "group": g.snapshot()}) for g in self.manager.groups.values()]
+        await asyncio.to_thread(self._rewrite, lines)
+        log.info("snapshot compacted", records_before=self._records, records_after=len(lines))
+        self._records = len(lines)
+
+    def _schedule(self):
+        self._handle = scheduler.call_later(self.interval, self._on_interval)
+
+    def _on_interval(self):
+        self._handle = None
+        scheduler.spawn(self._periodic())
+
+    async def _periodic(self):
+        try:
+            await self.flush()
+        except Exception:
+            log.exception("snapshot failed", path=self.path)
+        self._schedule()
+
+    # --- 파일 I/O (스레드에서 실행) ---
+
+    def _read(self) -> dict:
+        groups = {}
+        self._records = 0
+        try:
+            f = open(self.path, encoding="utf-8")
+        except FileNotFoundError:
+            return groups
+        with f:
+            for line in f:
+                self._torn = not line.endswith("\n")
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 쓰는 도중 종료되어 잘린 마지막 줄
+                    continue
+                self._records += 1
+                if record["op"] == "put":
+                    groups[record["group"]["group_name"]] = record["group"]
+                elif record["op"] == "del":
+                    groups.pop(record["name"], None)
+        return groups
+
+    def _append(self, lines: List[str]):
+        with open(self.path, "a", encoding="utf-8") as f:
+            if self._torn:
+                f.write("\n")
+                self._torn = False
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite(self, lines: List[str]):
+        tmp = f"{self.path}.tmp"
+        self._torn = False
+        with open(tmp, "w", encoding="utf-8") as f:
+            if lines:
+                f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+
+snapshots = SnapshotStore.from_env(default_manager)  # 싱글턴 인스턴스 (비활성이면 None)
@@ -1,11 +1,35 @@
 # your_project/main.py
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from routes.group_router import router as group_router
-from routes.timer_router import router as timer_router
-from routes.websocket_router import router as websocket_router
+from core.cluster import cluster
+from core.event_log import event_log
+from core.heartbeat import heartbeat
+from core.snapshot import snapshots
+from routers.group_router import router as group_router
+from routers.timer_router import router as timer_router
+from routers.websocket_router import router as websocket_router
+from routers.metrics_router import router as metrics_router
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 다중 워커 구성이면 backplane 에 참여 (core.cluster 참고)
+    await cluster.start()
+    # 스냅샷 파일이 설정돼 있으면 그룹/타이머 복원 후 주기적 저장
+    if snapshots is not None:
+        await snapshots.start()
+    heartbeat.start()
+    yield
+    heartbeat.stop()
+    if snapshots is not None:
+        await snapshots.stop()
+    # 그룹 이벤트 로그가 설정돼 있으면 남은 이벤트를 쓴다
+    if event_log is not None:
+        await event_log.stop()
+    await cluster.stop()
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # 그룹 관련 라우터
 app.include_router(group_router, prefix="/group", tags=["group"])
@@ -13,5 +37,8 @@ app.include_router(group_router, prefix="/group", tags=["group"])
 app.include_router(timer_router, prefix="/timer", tags=["timer"])
 # WebSocket 라우터
 app.include_router(websocket_router, tags=["websocket"])
+# 메트릭 (Prometheus)
+app.include_router(metrics_router, tags=["metrics"])
 
 # 실행: uvicorn your_project.main:app --reload
+# 다중 워커: TIMER_BACKPLANE=unix:/tmp/timer-bp uvicorn main:app --workers 4
@@ -1,5 +1,6 @@
 # models.py
-from pydantic import BaseModel
+from typing import Annotated, List, Literal, Optional, Union
+from pydantic import BaseModel, Field
 
 class ClientInfo(BaseModel):
     client_id: str
@@ -11,3 +12,52 @@ class BroadcastMessage(BaseModel):
 class ClientAddRequest(BaseModel):
     inviter_client_id: str  # ID of the client who is inviting
     client_name: str        # Name of the new client to be added
+
+class TimerOperation(BaseModel):
+    group_name: str
+    op: Literal["set_time", "start", "stop", "pause", "resume"]
+    h: int = 0  # set_time 에서만 사용
+    m: int = 0
+    s: int = 0
+
+class TimerBatchRequest(BaseModel):
+    operations: List[TimerOperation]
+    align: bool = False  # True 이면 start 를 다음 정각 초에 한꺼번에 시작 (tick 경계 정렬)
+
+class GroupOperation(BaseModel):
+    group_name: str
+    op: Literal["get", "broadcast"]
+    message: Optional[str] = None  # broadcast 에서만 사용
+
+class GroupBatchRequest(BaseModel):
+    operations: List[GroupOperation]
+
+# --- 게임 소켓 명령 (/ws, core.commands 참고) ---
+
+class Command(BaseModel):
+    id: Optional[Union[str, int]] = None  # 응답에 그대로 돌려주는 요청 ID
+
+class GameCommand(Command):
+    # 보낸 플레이어의 현재 그룹에 적용
+    action: Literal["start", "stop", "pause", "resume", "turn_over", "get_group"]
+
+class SetTimeCommand(Command):
+    action: Literal["set_time"]
+    h: int = Field(0, ge=0)
+    m: int = Field(0, ge=0)
+    s: int = Field(0, ge=0)
+
+class JoinCommand(Command):
+    # 보낸 플레이어가 host_player_id 의 그룹에 합류
+    action: Literal["join"]
+    group_name: str
+    host_player_id: str
+
+class ReorderCommand(Command):
+    action: Literal["reorder"]
+    new_order: List[str]
+
+ClientCommand = Annotated[
+    Union[GameCommand, SetTimeCommand, JoinCommand, ReorderCommand],
+    Field(discriminator="action")
+]
@@ -1,45 +1,83 @@
 # your_project/routes/group_router.py
 
-from fastapi import APIRouter, HTTPException
-from typing import List
-from core.connection_manager import manager
+import asyncio
+import json
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from core.event_log import EventLog, event_log
+from core.service import service
+from models import GroupBatchRequest
 
 router = APIRouter()
 
 @router.get("/", response_model=List[str])
-async def list_groups():
-    return list(manager.groups.keys())
+async def list_groups(
+    active: Optional[bool] = None,
+    min_players: Optional[int] = None,
+    max_players: Optional[int] = None,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=0)
+):
+    return await service.list_groups(
+        offset=offset, limit=limit, active=active, min_players=min_players, max_players=max_players
+    )
+
+@router.get("/listing")
+async def list_group_summaries(
+    active: Optional[bool] = None,
+    min_players: Optional[int] = None,
+    max_players: Optional[int] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=0, le=500)
+):
+    """그룹 요약(인원, 진행 여부, 타이머 상태) 페이지"""
+    return await service.list_group_summaries(
+        offset=offset, limit=limit, active=active, min_players=min_players, max_players=max_players
+    )
+
+@router.post("/batch")
+async def batch(request: GroupBatchRequest):
+    """여러 그룹의 조회/브로드캐스트를 한 번에 실행하고 작업별 결과 반환"""
+    return await service.batch([op.model_dump() for op in request.operations])
 
 @router.get("/{group_name}/players")
 async def get_players_in_group(group_name: str):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    players = manager.get_players_in_group(group_name)
+    players = await service.get_players_in_group(group_name=group_name)
     return {"group_name": group_name, "players": players}
 
 @router.post("/{group_name}/join")
 async def join_group(group_name: str, host_player_id: str, guest_player_id: str):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    await manager.join_group(host_player_id, guest_player_id)
+    await service.join_group(group_name=group_name, host_player_id=host_player_id, guest_player_id=guest_player_id)
     return {"message": f"'{guest_player_id}' joined group '{group_name}'"}
 
 @router.post("/{group_name}/reorder")
 async def reorder_group(group_name: str, new_order_id: List[str]):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    await manager.reorder_group(group_name, new_order_id)
+    await service.reorder_group(group_name=group_name, new_order=new_order_id)
     return {"message": f"'{group_name}' player reorder"}
 
+@router.get("/{group_name}/history")
+async def get_group_history(group_name: str, since: int = Query(0, ge=0), until: Optional[int] = Query(None, ge=0)):
+    """그룹 이벤트 기록 (seq 가 since 초과 until 이하, 한 줄에 하나씩 스트리밍)"""
+    events = _event_log().iter_events(group_name, since, until)
+    lines = (json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n" for record in events)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+@router.get("/{group_name}/history/state")
+async def get_group_state_at(group_name: str, seq: Optional[int] = Query(None, ge=0)):
+    """이벤트 기록을 seq 까지 재생한 그룹 상태 (seq 가 없으면 기록된 마지막 상태)"""
+    return await asyncio.to_thread(_event_log().replay, group_name, seq)
+
 @router.get("/{group_name}")
 async def get_play_group(group_name: str):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    return manager.groups[group_name].to_dict()
+    return await service.get_group(group_name=group_name)
 
 @router.post("/{group_name}/broadcast")
 async def broadcast_message(group_name: str, message: str):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    await manager.broadcast_to_group(group_name, message)
+    await service.broadcast(group_name=group_name, message=message)
     return {"message": "broadcast success"}
+
+def _event_log() -> EventLog:
+    if event_log is None:
+        raise HTTPException(status_code=404, detail="이벤트 로그가 설정되어 있지 않습니다.")
+    return event_log
@@ -0,0 +1,12 @@
+# your_project/routes/metrics_router.py
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from core.metrics import registry
+
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus text format 메트릭"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -1,48 +1,42 @@
 # your_project/routes/timer_router.py
 
-from fastapi import APIRouter, HTTPException
-from core.connection_manager import manager
+from fastapi import APIRouter
+from core.service import service
+from models import TimerBatchRequest
 
 router = APIRouter()
 
+@router.post("/batch")
+async def batch(request: TimerBatchRequest):
+    """여러 그룹의 set_time/start/stop/pause/resume 을 한 번에 실행하고 작업별 결과 반환"""
+    return await service.batch([op.model_dump() for op in request.operations], align=request.align)
+
 @router.post("/set-time/{group_name}")
 async def set_time(group_name: str, h: int, m: int, s: int):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    manager.groups[group_name].set_time(h, m, s)
+    await service.set_time(group_name=group_name, h=h, m=m, s=s)
     return {"message": f"Set timer for '{group_name}' to {h}:{m}:{s}"}
 
 @router.post("/start/{group_name}")
 async def start_game(group_name: str):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    group = await manager.start_game(group_name)
-    return {"message": f"Game started in '{group_name}'", "group": group.to_dict()}
+    group = await service.start_game(group_name=group_name)
+    return {"message": f"Game started in '{group_name}'", "group": group}
 
 @router.post("/stop/{group_name}")
 async def stop_game(group_name: str):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    await manager.stop_game(group_name)
+    await service.stop_game(group_name=group_name)
     return {"message": f"Game stopped in '{group_name}'"}
 
 @router.post("/pause/{group_name}")
 async def pause_game(group_name: str):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    await manager.pause_game(group_name)
+    await service.pause_game(group_name=group_name)
     return {"message": f"Game paused in '{group_name}'"}
 
 @router.post("/resume/{group_name}")
 async def resume_game(group_name: str):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    await manager.resume_game(group_name)
+    await service.resume_game(group_name=group_name)
     return {"message": f"Game resumed in '{group_name}'"}
 
 @router.post("/turn-over/{group_name}")
 async def turn_over(group_name: str):
-    if group_name not in manager.groups:
-        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다.")
-    group = await manager.turn_over(group_name)
-    return {"message": f"Turn over in '{group_name}'", "group": group.to_dict()}
+    group = await service.turn_over(group_name=group_name)
+    return {"message": f"Turn over in '{group_name}'", "group": group}
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 import json
 from core.connection_manager import manager  # Import the connection manager
+from core.log import get_logger
 
 router = APIRouter()
+log = get_logger("ws")
 
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket, player_name: str = Query(...)):
@@ -24,4 +26,4 @@ async def websocket_endpoint(websocket: WebSocket, player_name: str = Query(...)
         # Remove the WebSocket connection from the group on disconnect
         group_name = await manager.remove_connection_from_group(websocket)
         if group_name:
-            print(f"Connection for player in group '{group_name}' has been removed.")
+            log.info("connection removed", group=group_name)
@@ -1,34 +1,138 @@
 # your_project/routes/websocket_router.py
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 import json
+import logging
+from typing import Optional
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Query
+from core.commands import CommandChannel
 from core.connection_manager import manager
+from core.feed import Watcher, feed
+from core.protocol import BINARY_SUBPROTOCOL, json_frame
+from core.log import get_logger
 
 router = APIRouter()
+log = get_logger("ws")
 
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket, player_name: str = Query(...)):
-    await websocket.accept()
+async def websocket_endpoint(
+    websocket: WebSocket,
+    player_name: str = Query(...),
+    protocol: str = Query("json"),
+    ticks: str = Query("stream"),
+    resume_token: Optional[str] = Query(None),
+    heartbeat: bool = Query(False)
+):
+    # tick 메시지 형식 협상: subprotocol 또는 ?protocol=binary (기본은 JSON)
+    subprotocol = BINARY_SUBPROTOCOL if BINARY_SUBPROTOCOL in websocket.scope.get("subprotocols", []) else None
+    binary = subprotocol is not None or protocol == "binary"
+    # tick 전송 방식: stream (매초 update_timer) / sync (timer_sync 만, 클라이언트 보간)
+    sync_ticks = ticks == "sync"
+    await websocket.accept(subprotocol=subprotocol)
 
     try:
-        # 호스트 플레이어로 등록하여 새 그룹 생성
-        group_name, player = await manager.register_player(websocket, player_name)
+        # 유예 시간 안에 재접속하면 기존 자리로 복귀하고 그룹 상태 스냅샷 하나만 받는다
+        resumed = await manager.resume_player(websocket, resume_token, binary) if resume_token else None
+        if resumed:
+            group_name, player = resumed
+            player.send(json_frame({
+                "status": "success",
+                "action": "resume_player",
+                "group_name": group_name,
+                "player_info": player.to_dict(),
+                "resume_token": player.resume_token,
+                "group": await manager.group_snapshot(group_name),
+                "protocol": "binary" if binary else "json",
+                "ticks": "sync" if player.sync_ticks else "stream"
+            }))
+            group = manager.groups.get(group_name)
+            if player.sync_ticks and group is not None:
+                player.send(group.timer_sync_frame())
+        else:
+            # 호스트 플레이어로 등록하여 새 그룹 생성 (그룹 수 제한에 걸리면 1013 으로 종료)
+            try:
+                group_name, player = await manager.register_player(websocket, player_name, binary, sync_ticks)
+            except HTTPException as e:
+                await websocket.send_json({"status": "error", "action": "register_player", "detail": e.detail})
+                await websocket.close(code=1013)
+                return
+
+            # 이후 브로드캐스트와 순서가 섞이지 않도록 송신 큐를 통해 전송
+            player.send(json_frame({
+                "status": "success",
+                "action": "register_player",
+                "group_name": group_name,
+                "player_info": player.to_dict(),
+                "resume_token": player.resume_token,
+                "protocol": "binary" if binary else "json",
+                "ticks": "sync" if sync_ticks else "stream"
+            }))
 
-        await websocket.send_text(json.dumps({
-            "status": "success",
-            "action": "register_player",
-            "group_name": group_name,
-            "player_info": player.to_dict()
-        }))
+        # 앱 수준 ping/pong 은 협상한 연결에만 (core.heartbeat 참고)
+        player.heartbeat = heartbeat
+        player.missed_pings = 0
 
+        # 이후 메시지는 명령 채널로 처리 (core.commands 참고)
+        commands = CommandChannel(player)
         while True:
             data = await websocket.receive_text()
-            print(f"[WebSocket] Received from {player_name}: {data}")
+            player.touch()
+            try:
+                message = json.loads(data)
+            except ValueError:
+                message = None
+            if isinstance(message, dict) and message.get("action") == "pong":
+                player.heartbeat = True
+            if not await commands.handle(message):
+                log.rate_limited(logging.DEBUG, "received", player=player_name, data=data)
 
     except WebSocketDisconnect:
-        print(f"[WebSocket] Disconnected: {player_name}")
+        log.info("disconnected", player=player_name)
         removed_group = await manager.remove_connection_from_group(websocket)
         if removed_group:
-            print(f"[WebSocket] Removed from group {removed_group}")
-    except Exception as e:
-        print(f"[WebSocket] Unexpected error: {e}")
+            log.debug("removed from group", player=player_name, group=removed_group)
+    except Exception:
+        log.exception("unexpected error", player=player_name)
+
+
+@router.websocket("/ws/feed")
+async def feed_endpoint(websocket: WebSocket, channel: Optional[str] = Query(None)):
+    """
+    변경 피드 구독 소켓 (그룹을 만들지 않는다, core.feed 참고).
+    {"action": "subscribe" | "unsubscribe", "channel": "lobby" | <group_name>} 로 채널을 관리하고,
+    ?channel= 로 접속과 동시에 하나를 구독할 수 있다.
+    """
+    await websocket.accept()
+    watcher = Watcher(websocket)
+    try:
+        if channel:
+            await _subscribe(watcher, channel)
+        while True:
+            data = await websocket.receive_text()
+            try:
+                message = json.loads(data)
+                action = message.get("action")
+                target = message.get("channel")
+            except (ValueError, AttributeError):
+                watcher.send(json_frame({"status": "error", "detail": "잘못된 메시지 형식입니다."}))
+                continue
+            if action == "subscribe" and isinstance(target, str):
+                await _subscribe(watcher, target)
+            elif action == "unsubscribe" and isinstance(target, str):
+                feed.unsubscribe(watcher, target)
+                watcher.send(json_frame({"status": "success", "action": "unsubscribe", "channel": target}))
+            elif action != "pong":
+                watcher.send(json_frame({"status": "error", "action": action, "detail": "지원하지 않는 요청입니다."}))
+
+    except WebSocketDisconnect:
+        log.debug("feed disconnected", channels=len(watcher.channels))
+    except Exception:
+        log.exception("unexpected error in feed")
+    finally:
+        feed.drop(watcher)
+
+
+async def _subscribe(watcher: Watcher, channel: str):
+    try:
+        await feed.subscribe(watcher, channel)
+    except HTTPException as e:
+        watcher.send(json_frame({"status": "error", "action": "subscribe", "channel": channel, "detail": e.detail}))
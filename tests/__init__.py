@@ -0,0 +1,4 @@
+# your_project/tests/__init__.py
+#
+# 스케줄러, 타이머 상태 기계, 송신 큐 테스트. 저장소 루트에서 python -m pytest -q 로 실행한다.
+# 비동기 코드는 테스트마다 asyncio.run 으로 새 루프에서 돌린다 (추가 플러그인 없이 pytest 만 필요).
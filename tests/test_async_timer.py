@@ -0,0 +1,197 @@
+# your_project/tests/test_async_timer.py
+
+import asyncio
+
+from core import config
+from core.async_timer import AsyncTimer, TimerState
+from core.group import Group
+from core.player import Player
+from core.scheduler import TickScheduler
+
+
+def _timer(seconds, **callbacks) -> AsyncTimer:
+    return AsyncTimer(0, 0, seconds, scheduler=TickScheduler(), **callbacks)
+
+
+# --- 전이 거절 ---
+
+def test_transitions_rejected_from_wrong_state():
+    async def main():
+        t = _timer(10)
+        results = [await t.pause(), await t.resume()]  # IDLE 에서는 불가
+        await t.start()
+        results += [await t.start(), await t.resume()]  # RUNNING 에서는 불가
+        t.cancel()
+        return results, t.status
+
+    assert asyncio.run(main()) == ([False, False, False, False], TimerState.IDLE)
+
+
+def test_every_transition_bumps_version():
+    async def main():
+        t = _timer(10)
+        versions = [t.version]
+        for op in (t.start, t.pause, t.resume, t.stop):
+            assert await op()
+            versions.append(t.version)
+        return versions
+
+    versions = asyncio.run(main())
+    assert versions == sorted(set(versions))
+
+
+def test_stale_expected_version_is_rejected():
+    """그사이 다른 전이가 있었으면 expected_version 을 준 요청은 아무것도 하지 않는다"""
+    async def main():
+        t = _timer(10)
+        await t.start()
+        seen = t.version
+        await t.pause()
+        await t.resume()
+        results = [await t.pause(expected_version=seen), await t.stop(expected_version=seen)]
+        status = t.status
+        results.append(await t.pause(expected_version=t.version))
+        t.cancel()
+        return results, status
+
+    assert asyncio.run(main()) == ([False, False, True], TimerState.RUNNING)
+
+
+def test_set_time_while_running_is_a_transition():
+    """실행 중 시간 변경은 version 을 올리고 상태 알림(timer_sync)을 보낸다"""
+    async def main():
+        states = []
+        t = _timer(10, on_state_callback=lambda: states.append(t.state))
+        await t.start()
+        seen = t.version
+        t.set_time(0, 0, 3)
+        result = (t.version > seen, states, t.remaining_seconds, await t.pause(expected_version=seen))
+        t.cancel()
+        return result
+
+    assert asyncio.run(main()) == (True, ["running", "running"], 3, False)
+
+
+def test_start_rejected_after_expiry_and_timeout_fires_once():
+    async def main():
+        timeouts = []
+        t = _timer(0.05, on_timeout_callback=lambda: timeouts.append(t.version))
+        await t.start()
+        await asyncio.sleep(0.1)
+        status = t.status
+        started = await t.start()
+        await asyncio.sleep(0.1)
+        return status, started, len(timeouts)
+
+    assert asyncio.run(main()) == (TimerState.EXPIRED, False, 1)
+
+
+def test_start_at_future_time_delays_first_tick():
+    """at 이 미래면 바로 RUNNING 이지만 첫 tick 은 at 에 나가고 그때까지 남은 시간은 시작 값 그대로"""
+    async def main():
+        ticks = []
+        t = _timer(5, on_tick_callback=ticks.append)
+        await t.start(t._scheduler.now() + 0.05)
+        before = (t.status, list(ticks), t.remaining)
+        await asyncio.sleep(0.08)
+        t.cancel()
+        return before, ticks
+
+    before, ticks = asyncio.run(main())
+    assert before == (TimerState.RUNNING, [], 5.0)
+    assert ticks == [5]
+
+
+# --- intermission -> 다음 턴 ---
+
+def test_intermission_ends_with_next_turn():
+    async def main():
+        waits, ended = [], []
+
+        async def on_wait_end(version):
+            ended.append(version)
+            await t.restart(expected_version=version)
+
+        t = _timer(10, on_wait_callback=waits.append, on_wait_end_callback=on_wait_end)
+        await t.start()
+        assert await t.intermission(0.05)
+        assert not await t.intermission(0.05)  # 대기 중의 중복 요청은 합쳐진다
+        in_wait = (t.status, t.wait_remaining is not None)
+        await asyncio.sleep(0.1)
+        result = in_wait, waits, len(ended), t.status, t.remaining_seconds
+        t.cancel()
+        return result
+
+    assert asyncio.run(main()) == ((TimerState.INTERMISSION, True), [1], 1, TimerState.RUNNING, 10)
+
+
+def test_stop_during_intermission_drops_next_turn():
+    async def main():
+        ended = []
+
+        async def on_wait_end(version):
+            ended.append(await t.restart(expected_version=version))
+
+        t = _timer(10, on_wait_end_callback=on_wait_end)
+        await t.intermission(0.05)
+        await t.stop()
+        await asyncio.sleep(0.1)
+        return ended, t.status, t.wait_remaining
+
+    assert asyncio.run(main()) == ([], TimerState.IDLE, None)
+
+
+class _Socket:
+    async def send(self, message):
+        pass
+
+    async def close(self, code=1000):
+        pass
+
+
+def test_group_turn_passes_through_intermission(monkeypatch):
+    monkeypatch.setattr(config, "TURN_INTERMISSION", 0.05)
+
+    async def main():
+        group = Group("g", Player(_Socket(), "a"), lambda name, frame: None, s=10)
+        group.add_player(Player(_Socket(), "b"))
+        await group.start_game()
+        await group.turn_over()
+        phase = group.phase
+        await asyncio.sleep(0.1)
+        result = phase, group.phase, group.now_turn, group.timer.status
+        group.close()
+        return result
+
+    assert asyncio.run(main()) == ("intermission", "turn", 1, TimerState.RUNNING)
+
+
+def test_group_timeout_after_stop_is_ignored():
+    async def main():
+        group = Group("g", Player(_Socket(), "a"), lambda name, frame: None, s=10)
+        await group.start_game()
+        await group.stop_game()
+        await group.on_timer_timeout()  # stop 과 경쟁에서 진 만료 처리
+        return group.timer.status
+
+    assert asyncio.run(main()) is TimerState.IDLE
+
+
+def test_lobby_summary_reflects_timer_state():
+    """start/stop 후 알리는 요약은 전이 뒤의 타이머 상태를 담는다"""
+    async def main():
+        changes = []
+        group = Group(
+            "g", Player(_Socket(), "a"), lambda name, frame: None, s=10,
+            change_callback=lambda name, listing, summary: changes.append((listing, summary, group.summary()))
+        )
+        await group.start_game()
+        started = [c for c in changes if c[1]]
+        changes.clear()
+        await group.stop_game()
+        stopped = [c for c in changes if c[1]]
+        return started, stopped
+
+    started, stopped = asyncio.run(main())
+    assert [(s["is_active"], s["timer_state"]) for _, _, s in started] == [(True, "running")]
+    assert [(s["is_active"], s["timer_state"]) for _, _, s in stopped] == [(False, "stopped")]
@@ -0,0 +1,126 @@
+# your_project/tests/test_scheduler.py
+
+import asyncio
+
+from core.scheduler import TickScheduler
+
+
+def _scheduler(compact_min_size=None) -> TickScheduler:
+    s = TickScheduler()
+    if compact_min_size is not None:
+        s._COMPACT_MIN_SIZE = compact_min_size
+    return s
+
+
+def test_due_calls_run_in_deadline_order():
+    """만기 시각 순서대로, 같은 시각이면 예약한 순서대로 실행"""
+    async def main():
+        s = _scheduler()
+        order = []
+        now = s.now()
+        s.call_at(now + 0.03, order.append, "c")
+        s.call_at(now + 0.01, order.append, "a1")
+        s.call_at(now + 0.02, order.append, "b")
+        s.call_at(now + 0.01, order.append, "a2")
+        await asyncio.sleep(0.06)
+        return order
+
+    assert asyncio.run(main()) == ["a1", "a2", "b", "c"]
+
+
+def test_calls_due_together_run_in_one_wakeup():
+    """루프가 늦게 깨어나 여러 항목이 만기되었으면 한 번에 순서대로 실행"""
+    async def main():
+        s = _scheduler()
+        order = []
+        now = s.now()
+        for i in range(5):
+            s.call_at(now - 0.01 * (5 - i), order.append, i)
+        await asyncio.sleep(0.01)
+        return order
+
+    assert asyncio.run(main()) == [0, 1, 2, 3, 4]
+
+
+def test_cancelled_call_does_not_run():
+    async def main():
+        s = _scheduler()
+        ran = []
+        handle = s.call_later(0.01, ran.append, "x")
+        s.call_later(0.01, ran.append, "y")
+        handle.cancel()
+        handle.cancel()  # 두 번 취소해도 한 번만 집계
+        await asyncio.sleep(0.03)
+        return ran, s._cancelled, len(s)
+
+    assert asyncio.run(main()) == (["y"], 0, 0)
+
+
+def test_callback_can_cancel_a_later_due_call():
+    """같은 배치에서 먼저 실행된 콜백이 뒤의 만기 항목을 취소하면 그 항목은 실행되지 않는다"""
+    async def main():
+        s = _scheduler()
+        ran = []
+        now = s.now()
+        s.call_at(now, lambda: (ran.append("first"), second.cancel()))
+        second = s.call_at(now, ran.append, "second")
+        s.call_at(now, ran.append, "third")
+        await asyncio.sleep(0.01)
+        return ran
+
+    assert asyncio.run(main()) == ["first", "third"]
+
+
+def test_compaction_is_deferred_until_due_loop_finishes():
+    """콜백 안에서 대량 취소로 compaction 조건이 되어도 실행 중에는 힙을 교체하지 않고 루프가 끝난 뒤 정리한다"""
+    async def main():
+        s = _scheduler(compact_min_size=4)
+        ran = []
+        heaps = []
+        pending = [s.call_later(60, ran.append, "never") for _ in range(10)]
+        now = s.now()
+
+        def cancel_all():
+            heap = s._heap
+            for handle in pending:
+                handle.cancel()
+            heaps.append(s._heap is heap)
+            ran.append("cancel")
+
+        s.call_at(now, cancel_all)
+        s.call_at(now, ran.append, "after")
+        s.call_later(0.02, ran.append, "later")
+        await asyncio.sleep(0.01)
+        compacted = (s._cancelled, len(s._heap))
+        await asyncio.sleep(0.03)
+        return ran, heaps, compacted
+
+    ran, heaps, compacted = asyncio.run(main())
+    assert ran == ["cancel", "after", "later"]
+    assert heaps == [True]  # 콜백 실행 중 힙은 그대로
+    assert compacted == (0, 1)  # 루프가 끝난 뒤 취소된 10개를 정리하고 "later" 만 남음
+
+
+def test_cancel_outside_due_loop_compacts_immediately():
+    async def main():
+        s = _scheduler(compact_min_size=4)
+        handles = [s.call_later(60, lambda: None) for _ in range(10)]
+        keep = s.call_later(60, lambda: None)
+        for handle in handles:
+            handle.cancel()
+        return len(s), len(s._heap), keep in [entry[2] for entry in s._heap]
+
+    live, size, kept = asyncio.run(main())
+    assert live == 1 and kept
+    assert size < 11  # 취소가 절반을 넘은 시점에 힙을 재구성
+
+
+def test_rearms_for_calls_scheduled_by_callbacks():
+    async def main():
+        s = _scheduler()
+        ran = []
+        s.call_later(0.01, lambda: s.call_later(0.01, ran.append, "nested"))
+        await asyncio.sleep(0.05)
+        return ran
+
+    assert asyncio.run(main()) == ["nested"]
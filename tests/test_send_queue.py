@@ -0,0 +1,131 @@
+# your_project/tests/test_send_queue.py
+
+import asyncio
+
+import pytest
+
+from core.protocol import TICK_KIND, json_frame, turn_wait_frame, update_timer_frame
+from core.send_queue import SendQueue
+
+
+class _StalledSocket:
+    """첫 send 에서 멈춰 큐가 비지 않는 느린 클라이언트"""
+
+    def __init__(self):
+        self.closed_with = None
+
+    async def send(self, message):
+        await asyncio.Event().wait()
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def _stalled(policy, queued):
+    socket = _StalledSocket()
+    queue = SendQueue(socket, maxsize=3, policy=policy)
+    queue.put(json_frame({"first": True}))
+    await asyncio.sleep(0)  # writer 가 첫 프레임을 보내다 멈춤
+    for frame in queued:
+        assert queue.put(frame)
+    return socket, queue
+
+
+def _kinds(queue):
+    return [frame.kind for frame in queue._items]
+
+
+def _ticks(*values):
+    return [update_timer_frame(0, v) for v in values]
+
+
+@pytest.mark.parametrize("policy", ["drop_oldest", "coalesce"])
+def test_full_queue_of_ticks_drops_oldest_for_untyped_frame(policy):
+    """명령 응답처럼 종류가 없는 프레임은 가장 오래된 tick 을 밀어내고 들어간다 (연결 유지)"""
+    async def main():
+        socket, queue = await _stalled(policy, _ticks(3, 2, 1))
+        accepted = queue.put(json_frame({"status": "success"}))
+        await asyncio.sleep(0)
+        result = accepted, queue.closed, _kinds(queue), queue.dropped, socket.closed_with
+        queue.close()
+        return result
+
+    assert asyncio.run(main()) == (True, False, [TICK_KIND, TICK_KIND, None], 1, None)
+
+
+def test_drop_oldest_keeps_newest_ticks():
+    async def main():
+        _, queue = await _stalled("drop_oldest", _ticks(5, 4, 3))
+        queue.put(update_timer_frame(0, 2))
+        values = [frame.text for frame in queue._items]
+        queue.close()
+        return values
+
+    assert asyncio.run(main()) == [f.text for f in _ticks(4, 3, 2)]
+
+
+def test_coalesce_replaces_queued_frames_of_same_kind():
+    async def main():
+        _, queue = await _stalled("coalesce", [turn_wait_frame(0, 2)] + _ticks(5, 4))
+        queue.put(update_timer_frame(0, 3))
+        result = [frame.text for frame in queue._items], queue.dropped
+        queue.close()
+        return result
+
+    texts, dropped = asyncio.run(main())
+    assert texts == [turn_wait_frame(0, 2).text, update_timer_frame(0, 3).text]
+    assert dropped == 2
+
+
+def test_coalesce_kind_not_queued_drops_oldest_tick():
+    async def main():
+        _, queue = await _stalled("coalesce", [json_frame({"a": 1})] + _ticks(5, 4))
+        accepted = queue.put(turn_wait_frame(0, 1))
+        result = accepted, queue.closed, [frame.text for frame in queue._items]
+        queue.close()
+        return result
+
+    accepted, closed, texts = asyncio.run(main())
+    assert (accepted, closed) == (True, False)
+    assert texts == [json_frame({"a": 1}).text, update_timer_frame(0, 4).text, turn_wait_frame(0, 1).text]
+
+
+@pytest.mark.parametrize("policy", ["drop_oldest", "coalesce"])
+def test_disconnects_when_nothing_can_be_dropped(policy):
+    """버릴 tick 도 합칠 프레임도 없으면 느린 클라이언트 연결을 끊는다"""
+    async def main():
+        socket, queue = await _stalled(policy, [json_frame({"n": n}) for n in range(3)])
+        accepted = queue.put(json_frame({"n": 3}))
+        await asyncio.sleep(0)
+        return accepted, queue.closed, socket.closed_with
+
+    assert asyncio.run(main()) == (False, True, 1008)
+
+
+def test_disconnect_policy_closes_on_overflow():
+    async def main():
+        socket, queue = await _stalled("disconnect", _ticks(3, 2, 1))
+        accepted = queue.put(update_timer_frame(0, 0))
+        await asyncio.sleep(0)
+        return accepted, queue.closed, socket.closed_with, queue.put(update_timer_frame(0, 0))
+
+    assert asyncio.run(main()) == (False, True, 1008, False)
+
+
+def test_writer_releases_resources_when_drained():
+    class _Socket:
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, message):
+            self.sent.append(message)
+
+    async def main():
+        socket = _Socket()
+        queue = SendQueue(socket, maxsize=3, policy="coalesce")
+        for frame in _ticks(3, 2, 1):
+            queue.put(frame)
+        await asyncio.sleep(0.01)
+        return len(socket.sent), queue._writer, queue._items
+
+    assert asyncio.run(main()) == (3, None, None)